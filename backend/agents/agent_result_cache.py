@@ -0,0 +1,156 @@
+"""Persistent TTL cache for CrewAI agent task results."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from .search_cache import normalize_query
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "agent_result_cache.sqlite3"
+
+# Freshness per agent type, in seconds. Override with AGENT_CACHE_TTL_<AGENT_TYPE>.
+DEFAULT_AGENT_TTLS = {
+    "trend_research": 6 * 3600,
+    "performance_analysis": 12 * 3600,
+    "campaign_analyst": 12 * 3600,
+    "strategic_recommendation": 24 * 3600,
+    "default": 6 * 3600,
+}
+
+
+def make_result_key(agent_type: str, task_description: str, parameters: Optional[Dict[str, Any]] = None) -> str:
+    """Stable hash of the agent type, normalized task description and parameters."""
+    raw = json.dumps(
+        {"agent_type": agent_type, "task": normalize_query(task_description), "parameters": parameters or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class AgentResultCache:
+    """Two-tier (in-memory LRU + SQLite) cache of successful agent task results.
+
+    Crew runs take minutes, so a result younger than its agent type's TTL (or the
+    caller's max_age, if shorter) is returned instead of running the crew again.
+    Results are stored as JSON; crew output objects are kept as their text. Used
+    from executor threads, so all access is synchronous and lock-protected.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_entries: Optional[int] = None):
+        self.path = str(path or os.getenv("AGENT_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.memory_entries = memory_entries or int(os.getenv("AGENT_CACHE_MEMORY_ENTRIES", "128"))
+        self.enabled = os.getenv("AGENT_CACHE_ENABLED", "true").lower() != "false"
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS agent_results ("
+            "key TEXT PRIMARY KEY, agent_type TEXT NOT NULL, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._purge_expired()
+
+        self.counters = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def ttl_for(self, agent_type: str) -> float:
+        """Freshness window for an agent type."""
+        default = DEFAULT_AGENT_TTLS.get(agent_type, DEFAULT_AGENT_TTLS["default"])
+        return float(os.getenv(f"AGENT_CACHE_TTL_{agent_type.upper()}", default))
+
+    def _purge_expired(self):
+        now = time.time()
+        with self._lock:
+            agent_types = [row[0] for row in self._db.execute("SELECT DISTINCT agent_type FROM agent_results")]
+            for agent_type in agent_types:
+                self._db.execute(
+                    "DELETE FROM agent_results WHERE agent_type = ? AND stored_at < ?",
+                    (agent_type, now - self.ttl_for(agent_type)),
+                )
+            self._db.commit()
+
+    def _memory_set(self, key: str, stored_at: float, value: Any):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(
+        self,
+        agent_type: str,
+        task_description: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        max_age: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Cached result with its age, or None if missing or older than the TTL / max_age."""
+        if not self.enabled or max_age == 0:
+            return None
+
+        limit = self.ttl_for(agent_type) if max_age is None else min(max_age, self.ttl_for(agent_type))
+        key = make_result_key(agent_type, task_description, parameters)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            else:
+                row = self._db.execute(
+                    "SELECT stored_at, value FROM agent_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], json.loads(row[1]))
+                    self._memory_set(key, *entry)
+                    self.counters["disk_hits"] += 1
+
+            age = time.time() - entry[0] if entry is not None else None
+            if entry is None or age >= limit:
+                self.counters["misses"] += 1
+                return None
+            self.counters["hits"] += 1
+            return {"result": entry[1], "stored_at": entry[0], "age_seconds": round(age, 1)}
+
+    def set(self, agent_type: str, task_description: str, parameters: Optional[Dict[str, Any]], result: Any):
+        """Store a successful result; error payloads are never cached."""
+        if not self.enabled or not result or (isinstance(result, dict) and result.get("status") == "error"):
+            return
+
+        key = make_result_key(agent_type, task_description, parameters)
+        stored_at = time.time()
+        value = json.dumps(result, default=str)
+        try:
+            with self._lock:
+                # Keep the JSON form in memory too, so hits look the same before and after a restart
+                self._memory_set(key, stored_at, json.loads(value))
+                self._db.execute(
+                    "INSERT OR REPLACE INTO agent_results (key, agent_type, value, stored_at) VALUES (?, ?, ?, ?)",
+                    (key, agent_type, value, stored_at),
+                )
+                self._db.commit()
+                self.counters["stores"] += 1
+        except sqlite3.Error as e:
+            logging.warning(f"Agent result cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        with self._lock:
+            disk_entries = self._db.execute("SELECT COUNT(*) FROM agent_results").fetchone()[0]
+        return {
+            **self.counters,
+            "hit_rate": round(self.counters["hits"] / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": disk_entries,
+        }
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
@@ -2,29 +2,104 @@
 
 import os
 import asyncio
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
+import importlib
 import json
 import uuid
 
-from .trend_research_agent import TrendResearchAgent
-from .performance_agent import PerformanceAnalysisAgent
-from .strategy_agent import StrategyRecommendationAgent
-from .campaign_agent import CampaignAnalysisAgent
+from .agent_result_cache import AgentResultCache
+
+# Agent attribute -> (module, class); modules are imported on first use because
+# importing crewai and building LLM clients dominates startup time
+AGENT_CLASSES = {
+    "trend_agent": ("trend_research_agent", "TrendResearchAgent"),
+    "performance_agent": ("performance_agent", "PerformanceAnalysisAgent"),
+    "strategy_agent": ("strategy_agent", "StrategyRecommendationAgent"),
+    "campaign_agent": ("campaign_agent", "CampaignAnalysisAgent"),
+}
+
+
+class CrewQueueFullError(Exception):
+    """Raised when too many crew tasks are already waiting for a worker."""
 
 
 class CrewManager:
-    """Manager class for coordinating all CrewAI agents and their tasks."""
+    """Manager class for coordinating all CrewAI agents and their tasks.
     
-    def __init__(self):
-        self.trend_agent = TrendResearchAgent()
-        self.performance_agent = PerformanceAnalysisAgent()
-        self.strategy_agent = StrategyRecommendationAgent()
-        self.campaign_agent = CampaignAnalysisAgent()
+    Crew runs are blocking (crew.kickoff() makes minutes of LLM and tool calls), so
+    tasks are executed on a bounded thread pool and tracked in active_tasks as
+    queued/running until they finish. Agents are built on first use.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        result_cache: Optional[AgentResultCache] = None,
+    ):
+        self._agents: Dict[str, Any] = {}
+        self._agents_lock = threading.Lock()
         
         # Task tracking
         self.active_tasks = {}
-        self.completed_tasks = {}
+        self.completed_tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        
+        # Bounded executor so crew runs never block the event loop
+        self.max_workers = max_workers or int(os.getenv("CREW_MAX_WORKERS", "2"))
+        self.max_queued = max_queued or int(os.getenv("CREW_MAX_QUEUED", "20"))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crew")
+        # Independent workflow steps running at once within one workflow
+        self.workflow_parallelism = int(os.getenv("CREW_WORKFLOW_PARALLELISM", "3"))
+        # Full result bodies are kept for the newest CREW_RESULT_RETENTION tasks; older
+        # records keep their metadata up to CREW_TASK_HISTORY tasks, then are dropped
+        self.result_retention = int(os.getenv("CREW_RESULT_RETENTION", "200"))
+        self.task_history = max(self.result_retention, int(os.getenv("CREW_TASK_HISTORY", "1000")))
+        self._with_results: deque = deque()
+        
+        # Running aggregates so summaries never scan completed_tasks
+        self.total_completed = 0
+        self.agent_task_counts: Dict[str, int] = {}
+        self.total_workflows = 0
+        self.last_workflow_completed_at: Optional[datetime] = None
+        self._latest_task_id: Optional[str] = None
+        
+        # Results of recent agent tasks, reused instead of re-running the crew
+        self.result_cache = result_cache or AgentResultCache()
+    
+    def _agent(self, name: str):
+        """Build an agent the first time it is needed and reuse it afterwards."""
+        agent = self._agents.get(name)
+        if agent is None:
+            with self._agents_lock:
+                agent = self._agents.get(name)
+                if agent is None:
+                    module_name, class_name = AGENT_CLASSES[name]
+                    module = importlib.import_module(f".{module_name}", __package__)
+                    agent = self._agents[name] = getattr(module, class_name)()
+        return agent
+    
+    @property
+    def trend_agent(self):
+        return self._agent("trend_agent")
+    
+    @property
+    def performance_agent(self):
+        return self._agent("performance_agent")
+    
+    @property
+    def strategy_agent(self):
+        return self._agent("strategy_agent")
+    
+    @property
+    def campaign_agent(self):
+        return self._agent("campaign_agent")
     
     def get_agents_status(self) -> Dict[str, Any]:
         """Get the status of all agents."""
@@ -51,218 +126,321 @@ class CrewManager:
             }
         }
     
-    def start_agent_task(self, agent_type: str, task_description: str, parameters: Dict = None) -> str:
-        """Start a specific agent task."""
-        task_id = str(uuid.uuid4())
-        
-        try:
-            if agent_type == "trend_research":
-                if "competitor_analysis" in task_description.lower():
-                    competitors = parameters.get("competitors") if parameters else None
-                    result = self.trend_agent.execute_competitor_research(competitors)
-                elif "trend_monitoring" in task_description.lower():
-                    result = self.trend_agent.execute_trend_monitoring()
-                else:
-                    result = self.trend_agent.execute_competitor_research()
-                    
-            elif agent_type == "performance_analysis":
-                if "content_performance" in task_description.lower():
-                    result = self.performance_agent.analyze_content_performance()
-                elif "audience_insights" in task_description.lower():
-                    result = self.performance_agent.analyze_audience_insights()
-                elif "platform_performance" in task_description.lower():
-                    result = self.performance_agent.analyze_platform_performance()
-                else:
-                    result = self.performance_agent.execute_full_performance_analysis()
-                    
-            elif agent_type == "strategic_recommendation":
-                if "content_strategy" in task_description.lower():
-                    result = self.strategy_agent.generate_content_strategy()
-                elif "campaign_recommendations" in task_description.lower():
-                    result = self.strategy_agent.generate_campaign_recommendations()
-                elif "competitive_strategy" in task_description.lower():
-                    result = self.strategy_agent.generate_competitive_strategy()
-                else:
-                    result = self.strategy_agent.execute_comprehensive_strategy()
-                    
-            elif agent_type == "campaign_analyst":
-                if "campaign_performance" in task_description.lower():
-                    result = self.campaign_agent.analyze_campaign_performance()
-                elif "audience_analysis" in task_description.lower():
-                    result = self.campaign_agent.analyze_audience_performance()
-                elif "creative_analysis" in task_description.lower():
-                    result = self.campaign_agent.analyze_creative_performance()
-                else:
-                    result = self.campaign_agent.execute_full_campaign_analysis()
-            else:
-                result = {
-                    "status": "error",
-                    "error": f"Unknown agent type: {agent_type}"
-                }
-            
-            # Store task result
-            self.completed_tasks[task_id] = {
+    def _submit(self, task_id: str, agent_type: str, task_description: str, parameters: Optional[Dict], fn: Callable[[], Dict[str, Any]]):
+        """Queue fn on the executor and track the task until it finishes."""
+        with self._lock:
+            queued = sum(1 for task in self.active_tasks.values() if task["status"] == "queued")
+            if queued >= self.max_queued:
+                raise CrewQueueFullError(f"{queued} crew tasks already waiting")
+            self.active_tasks[task_id] = {
                 "task_id": task_id,
                 "agent_type": agent_type,
                 "task_description": task_description,
                 "parameters": parameters,
-                "result": result,
+                "status": "queued",
                 "created_at": datetime.now(),
-                "completed_at": datetime.now(),
-                "status": "completed"
+                "started_at": None
             }
-            
-            return task_id
-            
+            self._futures[task_id] = self.executor.submit(self._run_task, task_id, fn)
+    
+    def _run_task(self, task_id: str, fn: Callable[[], Dict[str, Any]]):
+        """Executor entry point: run one task and move it to completed_tasks."""
+        with self._lock:
+            task = self.active_tasks[task_id]
+            task.update(status="running", started_at=datetime.now())
+        
+        try:
+            result = fn()
+            status = "failed" if result.get("status") == "error" else "completed"
         except Exception as e:
-            error_result = {
+            result = {
                 "status": "error",
                 "error": str(e),
-                "agent_type": agent_type
+                "agent_type": task["agent_type"]
             }
-            
-            self.completed_tasks[task_id] = {
-                "task_id": task_id,
+            status = "failed"
+        
+        with self._lock:
+            self.active_tasks.pop(task_id, None)
+            self._futures.pop(task_id, None)
+            self._record_completed(task_id, task, result, status)
+    
+    def _record_completed(self, task_id: str, task: Dict[str, Any], result: Dict[str, Any], status: str, **extra: Any):
+        """Store a finished task and update the aggregates (caller holds _lock)."""
+        record = self.completed_tasks[task_id] = {
+            "task_id": task_id,
+            "agent_type": task["agent_type"],
+            "task_description": task["task_description"],
+            "parameters": task["parameters"],
+            "result": result,
+            "created_at": task["created_at"],
+            "started_at": task["started_at"],
+            "completed_at": datetime.now(),
+            "status": status,
+            **extra
+        }
+        
+        agent_type = task["agent_type"]
+        self.total_completed += 1
+        self.agent_task_counts[agent_type] = self.agent_task_counts.get(agent_type, 0) + 1
+        if agent_type == "full_workflow":
+            self.total_workflows += 1
+            self.last_workflow_completed_at = record["completed_at"]
+        self._latest_task_id = task_id
+        self._apply_retention(task_id)
+    
+    def _apply_retention(self, task_id: str):
+        """Drop result bodies beyond result_retention and records beyond task_history."""
+        self._with_results.append(task_id)
+        while len(self._with_results) > self.result_retention:
+            old_id = self._with_results.popleft()
+            old = self.completed_tasks.get(old_id)
+            if old is not None:
+                # Replace rather than mutate: callers may still hold the old record
+                self.completed_tasks[old_id] = {**old, "result": None, "result_evicted": True}
+        while len(self.completed_tasks) > self.task_history:
+            self.completed_tasks.popitem(last=False)
+    
+    def start_agent_task(
+        self, agent_type: str, task_description: str, parameters: Dict = None, max_age: Optional[float] = None
+    ) -> str:
+        """Queue a specific agent task and return its task_id immediately.
+        
+        A cached result of the same agent_type/task_description/parameters that is
+        younger than the agent's TTL (and max_age seconds, if given) completes the
+        task at once without running the crew. max_age=0 always runs it.
+        """
+        task_id = str(uuid.uuid4())
+        cached = self.result_cache.get(agent_type, task_description, parameters, max_age)
+        if cached is not None:
+            now = datetime.now()
+            task = {
                 "agent_type": agent_type,
                 "task_description": task_description,
                 "parameters": parameters,
-                "result": error_result,
-                "created_at": datetime.now(),
-                "completed_at": datetime.now(),
-                "status": "failed"
+                "created_at": now,
+                "started_at": now
             }
-            
+            with self._lock:
+                self._record_completed(
+                    task_id, task, cached["result"], "completed",
+                    cached=True, cache_age_seconds=cached["age_seconds"]
+                )
             return task_id
+        
+        self._submit(
+            task_id, agent_type, task_description, parameters,
+            lambda: self._execute_and_cache(agent_type, task_description, parameters)
+        )
+        return task_id
+    
+    def _execute_and_cache(self, agent_type: str, task_description: str, parameters: Dict = None) -> Dict[str, Any]:
+        """Run an agent task and cache its result if it succeeded."""
+        result = self._execute_agent_task(agent_type, task_description, parameters)
+        self.result_cache.set(agent_type, task_description, parameters, result)
+        return result
+    
+    def _execute_agent_task(self, agent_type: str, task_description: str, parameters: Dict = None) -> Dict[str, Any]:
+        """Run a specific agent task (blocking)."""
+        if agent_type == "trend_research":
+            if "competitor_analysis" in task_description.lower():
+                competitors = parameters.get("competitors") if parameters else None
+                result = self.trend_agent.execute_competitor_research(competitors)
+            elif "trend_monitoring" in task_description.lower():
+                result = self.trend_agent.execute_trend_monitoring()
+            else:
+                result = self.trend_agent.execute_competitor_research()
+                
+        elif agent_type == "performance_analysis":
+            if "content_performance" in task_description.lower():
+                result = self.performance_agent.analyze_content_performance()
+            elif "audience_insights" in task_description.lower():
+                result = self.performance_agent.analyze_audience_insights()
+            elif "platform_performance" in task_description.lower():
+                result = self.performance_agent.analyze_platform_performance()
+            else:
+                result = self.performance_agent.execute_full_performance_analysis()
+                
+        elif agent_type == "strategic_recommendation":
+            if "content_strategy" in task_description.lower():
+                result = self.strategy_agent.generate_content_strategy()
+            elif "campaign_recommendations" in task_description.lower():
+                result = self.strategy_agent.generate_campaign_recommendations()
+            elif "competitive_strategy" in task_description.lower():
+                result = self.strategy_agent.generate_competitive_strategy()
+            else:
+                result = self.strategy_agent.execute_comprehensive_strategy()
+                
+        elif agent_type == "campaign_analyst":
+            if "campaign_performance" in task_description.lower():
+                result = self.campaign_agent.analyze_campaign_performance()
+            elif "audience_analysis" in task_description.lower():
+                result = self.campaign_agent.analyze_audience_performance()
+            elif "creative_analysis" in task_description.lower():
+                result = self.campaign_agent.analyze_creative_performance()
+            else:
+                result = self.campaign_agent.execute_full_campaign_analysis()
+        else:
+            result = {
+                "status": "error",
+                "error": f"Unknown agent type: {agent_type}"
+            }
+        
+        return result
     
     def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
-        """Get the result of a specific task."""
-        if task_id in self.completed_tasks:
-            return self.completed_tasks[task_id]
-        elif task_id in self.active_tasks:
-            return {
+        """Get the result of a specific task, or its queued/running state."""
+        with self._lock:
+            if task_id in self.completed_tasks:
+                return self.completed_tasks[task_id]
+            task = self.active_tasks.get(task_id)
+            if task is None:
+                return None
+            state = {
                 "task_id": task_id,
-                "status": "running",
-                "created_at": self.active_tasks[task_id]["created_at"]
+                "agent_type": task["agent_type"],
+                "status": task["status"],
+                "created_at": task["created_at"],
+                "started_at": task["started_at"]
             }
-        else:
-            return None
+            if task["status"] == "queued":
+                state["queue_position"] = 1 + sum(
+                    1 for other in self.active_tasks.values()
+                    if other["status"] == "queued" and other["created_at"] < task["created_at"]
+                )
+            return state
     
     def execute_full_workflow(self) -> str:
-        """Execute the full crew workflow with all agents."""
+        """Queue the full crew workflow with all agents and return its workflow_id immediately."""
         workflow_id = str(uuid.uuid4())
+        self._submit(
+            workflow_id, "full_workflow", "Complete crew workflow execution", None,
+            lambda: self._execute_full_workflow(workflow_id)
+        )
+        return workflow_id
+    
+    def _execute_full_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """Run the full crew workflow (blocking).
         
+        Research, monitoring, performance and campaign steps are independent and run
+        concurrently (up to workflow_parallelism at once); the strategy step runs on
+        their combined output. Research and monitoring share the trend agent, so
+        CrewTemplates runs whichever starts second on a copied crew and agent.
+        """
+        started = time.monotonic()
         try:
-            # Step 1: Trend and Competitor Research
-            print("Step 1: Executing Trend and Competitor Research...")
-            trend_result = self.trend_agent.execute_competitor_research()
-            trend_monitoring = self.trend_agent.execute_trend_monitoring()
-            
-            # Step 2: Internal Performance Analysis
-            print("Step 2: Executing Internal Performance Analysis...")
-            performance_result = self.performance_agent.execute_full_performance_analysis()
-            
-            # Step 3: Campaign Performance Analysis
-            print("Step 3: Executing Campaign Performance Analysis...")
-            campaign_result = self.campaign_agent.execute_full_campaign_analysis()
+            print("Steps 1-3: Executing research, performance and campaign analysis concurrently...")
+            steps = {
+                "trend_research": self.trend_agent.execute_competitor_research,
+                "trend_monitoring": self.trend_agent.execute_trend_monitoring,
+                "performance_analysis": self.performance_agent.execute_full_performance_analysis,
+                "campaign_analysis": self.campaign_agent.execute_full_campaign_analysis
+            }
+            with ThreadPoolExecutor(max_workers=self.workflow_parallelism, thread_name_prefix="crew-step") as pool:
+                futures = {name: pool.submit(self._run_step, name, fn) for name, fn in steps.items()}
+                outcomes = {name: future.result() for name, future in futures.items()}
             
             # Step 4: Strategic Recommendations
             print("Step 4: Generating Strategic Recommendations...")
             all_data = {
-                "competitor_analysis": trend_result,
-                "trend_monitoring": trend_monitoring,
-                "performance_analysis": performance_result,
-                "campaign_analysis": campaign_result
+                "competitor_analysis": outcomes["trend_research"][0],
+                "trend_monitoring": outcomes["trend_monitoring"][0],
+                "performance_analysis": outcomes["performance_analysis"][0],
+                "campaign_analysis": outcomes["campaign_analysis"][0]
             }
-            strategy_result = self.strategy_agent.execute_comprehensive_strategy(all_data)
+            outcomes["strategic_recommendations"] = self._run_step(
+                "strategic_recommendations", lambda: self.strategy_agent.execute_comprehensive_strategy(all_data)
+            )
+            
+            step_timings = {name: timing for name, (_, timing) in outcomes.items()}
+            all_succeeded = all(timing["status"] == "completed" for timing in step_timings.values())
             
             # Compile full workflow result
             workflow_result = {
-                "status": "success",
+                "status": "success" if all_succeeded else "partial",
                 "workflow_id": workflow_id,
-                "results": {
-                    "trend_research": trend_result,
-                    "trend_monitoring": trend_monitoring,
-                    "performance_analysis": performance_result,
-                    "campaign_analysis": campaign_result,
-                    "strategic_recommendations": strategy_result
-                },
+                "results": {name: result for name, (result, _) in outcomes.items()},
+                "steps": step_timings,
                 "summary": {
                     "total_agents_executed": 4,
-                    "execution_time": "completed",
+                    "execution_time_seconds": round(time.monotonic() - started, 2),
                     "key_insights": "Comprehensive analysis completed across all areas"
                 }
             }
             
-            # Store workflow result
-            self.completed_tasks[workflow_id] = {
-                "task_id": workflow_id,
-                "agent_type": "full_workflow",
-                "task_description": "Complete crew workflow execution",
-                "result": workflow_result,
-                "created_at": datetime.now(),
-                "completed_at": datetime.now(),
-                "status": "completed"
-            }
-            
-            return workflow_id
+            return workflow_result
             
         except Exception as e:
-            error_result = {
+            return {
                 "status": "error",
                 "workflow_id": workflow_id,
                 "error": str(e)
             }
-            
-            self.completed_tasks[workflow_id] = {
-                "task_id": workflow_id,
-                "agent_type": "full_workflow",
-                "task_description": "Complete crew workflow execution",
-                "result": error_result,
-                "created_at": datetime.now(),
-                "completed_at": datetime.now(),
-                "status": "failed"
-            }
-            
-            return workflow_id
+    
+    def _run_step(self, name: str, fn: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run one workflow step, returning its result and start/end timing."""
+        started_at = datetime.now()
+        step_started = time.monotonic()
+        try:
+            result = fn()
+            status = "failed" if isinstance(result, dict) and result.get("status") == "error" else "completed"
+        except Exception as e:
+            print(f"Workflow step {name} failed: {e}")
+            result = {"status": "error", "error": str(e)}
+            status = "failed"
+        return result, {
+            "status": status,
+            "started_at": started_at.isoformat(),
+            "completed_at": datetime.now().isoformat(),
+            "duration_seconds": round(time.monotonic() - step_started, 2)
+        }
     
     def get_latest_results(self) -> Dict[str, Any]:
         """Get the latest results from all agents."""
-        if not self.completed_tasks:
+        with self._lock:
+            latest_task = self.completed_tasks.get(self._latest_task_id) if self._latest_task_id else None
+            total_completed = self.total_completed
+        if latest_task is None:
             return {"message": "No completed tasks found"}
         
-        # Get the most recent task
-        latest_task = max(self.completed_tasks.values(), key=lambda x: x["completed_at"])
-        
         return {
             "latest_task": latest_task,
-            "total_completed_tasks": len(self.completed_tasks),
+            "total_completed_tasks": total_completed,
             "timestamp": datetime.now().isoformat()
         }
     
     def cancel_task(self, task_id: str) -> bool:
-        """Cancel a running task."""
-        if task_id in self.active_tasks:
-            del self.active_tasks[task_id]
-            return True
-        return False
+        """Cancel a task that has not started yet; running crews cannot be interrupted."""
+        with self._lock:
+            future = self._futures.get(task_id)
+            if future is None or not future.cancel():
+                return False
+            self._futures.pop(task_id)
+            self.active_tasks.pop(task_id)
+        return True
+    
+    def shutdown(self):
+        """Drop queued tasks and stop accepting work; running crews finish in the background.
+
+        The result cache is closed only once those crews are done, since they store
+        their results in it.
+        """
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+        self.executor.shutdown(wait=False)
+        threading.Thread(target=self._close_when_idle, name="crew-shutdown").start()
+    
+    def _close_when_idle(self):
+        self.executor.shutdown(wait=True)
+        self.result_cache.close()
     
     def get_workflow_summary(self) -> Dict[str, Any]:
         """Get a summary of all workflow executions."""
-        completed_workflows = [
-            task for task in self.completed_tasks.values() 
-            if task["agent_type"] == "full_workflow"
-        ]
-        
-        agent_task_counts = {}
-        for task in self.completed_tasks.values():
-            agent_type = task["agent_type"]
-            if agent_type not in agent_task_counts:
-                agent_task_counts[agent_type] = 0
-            agent_task_counts[agent_type] += 1
-        
-        return {
-            "total_workflows_executed": len(completed_workflows),
-            "total_tasks_completed": len(self.completed_tasks),
-            "agent_task_breakdown": agent_task_counts,
-            "last_workflow_execution": completed_workflows[-1]["completed_at"].isoformat() if completed_workflows else None
-        }
+        with self._lock:
+            return {
+                "total_workflows_executed": self.total_workflows,
+                "total_tasks_completed": self.total_completed,
+                "agent_task_breakdown": dict(self.agent_task_counts),
+                "last_workflow_execution": self.last_workflow_completed_at.isoformat() if self.last_workflow_completed_at else None
+            }
@@ -0,0 +1,64 @@
+"""Reusable CrewAI task templates and crews, built once per agent and task type."""
+
+import threading
+from typing import Any, Callable, Dict, List, Union
+
+from crewai import Crew, Task
+
+from .crew_trace import crew_verbose, get_trace_sink
+
+TaskBuilder = Callable[[], Union[Task, List[Task]]]
+
+
+class CrewTemplates:
+    """Tasks and crews of one agent, built on first use and re-run with new inputs.
+
+    Task descriptions are templates with {placeholders} that crew.kickoff(inputs=...)
+    fills in, so the prompt strings and Crew objects are created once per process
+    instead of on every call. kickoff mutates the crew's tasks and its agent, which
+    every crew here shares, so while any crew of this agent is running on another
+    thread, the crew is copied (with its own copy of the agent) for the concurrent run.
+
+    With CREW_TRACE_MODE=quiet, crews run with verbose off and report steps and
+    finished tasks to the sampled trace sink instead.
+    """
+
+    def __init__(self, agent: Any, agent_type: str):
+        self.agent = agent
+        self.agent_type = agent_type
+        self._crews: Dict[str, Crew] = {}
+        self._lock = threading.Lock()
+        self._busy = threading.Lock()
+
+    def _crew(self, name: str, build: TaskBuilder) -> Crew:
+        with self._lock:
+            crew = self._crews.get(name)
+            if crew is None:
+                tasks = build()
+                if isinstance(tasks, Task):
+                    tasks = [tasks]
+                options: Dict[str, Any] = {"verbose": crew_verbose()}
+                if not options["verbose"]:
+                    sink = get_trace_sink()
+                    options.update(step_callback=sink.step, task_callback=sink.task)
+                crew = self._crews[name] = Crew(agents=[self.agent], tasks=tasks, **options)
+            return crew
+
+    def kickoff(self, name: str, build: TaskBuilder, **inputs: Any) -> Any:
+        """Run the crew for task type `name`, building it with `build` the first time."""
+        crew = self._crew(name, build)
+        # Values are rendered the way the old f-string prompts rendered them
+        inputs = {key: str(value) for key, value in inputs.items()}
+        # The shared agent is in use by some crew of this agent: run a copy with its own agent
+        if self._busy.acquire(blocking=False):
+            try:
+                return self._run(crew, name, inputs)
+            finally:
+                self._busy.release()
+        return self._run(crew.copy(), name, inputs)
+
+    def _run(self, crew: Crew, name: str, inputs: Dict[str, str]) -> Any:
+        if crew_verbose():
+            return crew.kickoff(inputs=inputs)
+        with get_trace_sink().run(self.agent_type, name):
+            return crew.kickoff(inputs=inputs)
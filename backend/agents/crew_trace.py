@@ -0,0 +1,137 @@
+"""Structured, sampled trace records for crew runs, the quiet alternative to verbose stdout."""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+MAX_TEXT_CHARS = 500
+
+
+def crew_verbose() -> bool:
+    """False when CREW_TRACE_MODE=quiet; verbose agents and crews print their full trace to stdout."""
+    return os.getenv("CREW_TRACE_MODE", "verbose").lower() != "quiet"
+
+
+def _text(value: Any) -> str:
+    text = str(value or "")
+    return text if len(text) <= MAX_TEXT_CHARS else text[:MAX_TEXT_CHARS] + "..."
+
+
+class CrewTraceSink:
+    """Writes one JSON line per crew run, agent step and finished task.
+
+    Runs are sampled as a whole (CREW_TRACE_SAMPLE_RATE, default 0.1) so a sampled
+    trace is complete; failed runs are always recorded. Records go through a queue to
+    a background thread that writes to CREW_TRACE_PATH, or stderr when unset, so
+    crew threads never block on output.
+    """
+
+    def __init__(self, sample_rate: Optional[float] = None, path: Optional[str] = None):
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.getenv("CREW_TRACE_SAMPLE_RATE", "0.1"))
+        path = path or os.getenv("CREW_TRACE_PATH")
+        handler = logging.FileHandler(path) if path else logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        records: queue.Queue = queue.Queue(-1)
+        self._logger = logging.getLogger(f"crew_trace.{id(self)}")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._logger.addHandler(QueueHandler(records))
+        self._listener = QueueListener(records, handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
+        self._local = threading.local()
+        self.runs = 0
+        self.sampled_runs = 0
+        self.failed_runs = 0
+
+    def _emit(self, event: str, **fields: Any):
+        run = getattr(self._local, "run", None) or {}
+        record = {"event": event, "ts": round(time.time(), 3), **run, **fields}
+        record.pop("sampled", None)
+        self._logger.info(json.dumps(record, default=str))
+
+    @contextmanager
+    def run(self, agent_type: str, task_type: str):
+        """Trace one crew kickoff on the current thread."""
+        sampled = random.random() < self.sample_rate
+        self._local.run = {
+            "run_id": uuid.uuid4().hex[:12],
+            "agent_type": agent_type,
+            "task_type": task_type,
+            "sampled": sampled,
+        }
+        self.runs += 1
+        self.sampled_runs += sampled
+        started = time.monotonic()
+        if sampled:
+            self._emit("run_start")
+        try:
+            yield
+        except Exception as e:
+            self.failed_runs += 1
+            self._emit("run_error", duration_seconds=round(time.monotonic() - started, 2), error=_text(e))
+            raise
+        else:
+            if sampled:
+                self._emit("run_end", duration_seconds=round(time.monotonic() - started, 2))
+        finally:
+            self._local.run = None
+
+    def _sampled(self) -> bool:
+        run = getattr(self._local, "run", None)
+        return bool(run and run["sampled"])
+
+    def step(self, step_output: Any):
+        """Crew step_callback: an agent action or final answer."""
+        if self._sampled():
+            self._emit(
+                "step",
+                step_type=type(step_output).__name__,
+                tool=getattr(step_output, "tool", None),
+                text=_text(getattr(step_output, "output", None) or getattr(step_output, "log", None) or step_output),
+            )
+
+    def task(self, task_output: Any):
+        """Crew task_callback: a finished task."""
+        if self._sampled():
+            raw = getattr(task_output, "raw", None) or str(task_output)
+            self._emit(
+                "task_end",
+                task=" ".join(str(getattr(task_output, "description", "")).split())[:120],
+                output_chars=len(raw),
+                output=_text(raw),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Run counters and the sampling configuration."""
+        return {
+            "sample_rate": self.sample_rate,
+            "runs": self.runs,
+            "sampled_runs": self.sampled_runs,
+            "failed_runs": self.failed_runs,
+        }
+
+
+_sink: Optional[CrewTraceSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_trace_sink() -> CrewTraceSink:
+    """Process-wide sink, created on first use."""
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = CrewTraceSink()
+        return _sink
@@ -1,26 +1,55 @@
 """Focused Crew Manager - REAL WEB SEARCH + AI LLM ANALYSIS."""
 
 import asyncio
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
 from datetime import datetime
 import logging
-import requests
-import re
-import json
 import os
 from dotenv import load_dotenv
 
+from .metric_extraction import ExtractedMetrics, Metric, MetricExtractor
+from .rate_limiter import TokenBucketLimiter
+from .search_cache import SearchCache, make_cache_key
+from .search_client import TavilySearchClient
+from .single_flight import SingleFlight
+
 # Load environment variables
 load_dotenv()
 
+# Receives human-readable progress steps ("Searching Home Depot", ...) for a running analysis
+ProgressCallback = Callable[[str], None]
+
+# Receives a finished section (one competitor, one full-analysis stage) by name
+SectionCallback = Callable[[str, Any], None]
+
+
+def _report(progress: Optional[ProgressCallback], message: str):
+    if progress is not None:
+        progress(message)
+
 class FocusedCrewManager:
     """Manager for 3 focused AI agents using REAL web search only."""
     
+    DEFAULT_COMPETITORS = ['Home Depot', 'Menards', 'Wayfair', 'Ace Hardware']
+    FULL_ANALYSIS_STAGES = ['competitor_analysis', 'lowes_performance', 'campaign_analysis', 'strategy_generation']
+    
     def __init__(self):
         self.active_tasks = {}
         self.completed_tasks = {}
         # Use environment variable or fallback to hardcoded key
         self.tavily_api_key = os.getenv("TAVILY_API_KEY", "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")
+        # Shared keep-alive pool, reused by every analysis for the process lifetime
+        self.search_client = TavilySearchClient(self.tavily_api_key)
+        # Shared limiter so concurrent fan-outs stay within the Tavily rate limit
+        self.rate_limiter = TokenBucketLimiter()
+        # Persistent result cache so repeated dashboard loads skip the network
+        self.search_cache = SearchCache()
+        self.search_params = {"search_depth": "advanced", "max_results": 5}
+        # Identical concurrent searches share one upstream request
+        self.search_flight = SingleFlight()
+        # Precompiled single-pass metric extraction shared by all report generators
+        self.metric_extractor = MetricExtractor()
         # Using OpenAI-compatible API for LLM analysis
         self.llm_api_url = "https://api.openai.com/v1/chat/completions"
         self.llm_api_key = "sk-placeholder"  # Will use environment variable in production
@@ -45,26 +74,44 @@ class FocusedCrewManager:
             }
         }
     
-    async def analyze_competitors(self) -> Dict[str, Any]:
-        """Execute competitor analysis using REAL web search."""
+    async def analyze_competitors(
+        self,
+        competitors: Optional[List[str]] = None,
+        progress: Optional[ProgressCallback] = None,
+        on_section: Optional[SectionCallback] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Execute competitor analysis using REAL web search.
+
+        Each competitor's report section is passed to on_section as soon as its search
+        and extraction finish, before the full report is assembled. refresh=True
+        bypasses the search cache.
+        """
         try:
             logging.info("🔍 Starting REAL competitor analysis with web search...")
             
-            competitors = ['Home Depot', 'Menards', 'Wayfair', 'Ace Hardware']
-            competitor_data = {}
+            competitors = competitors or self.DEFAULT_COMPETITORS
+            sections: Dict[str, str] = {}
+
+            def _section_ready(competitor: str, search_data: Dict[str, Any]):
+                _report(progress, f"Extracting metrics: {competitor}")
+                sections[competitor] = self._competitor_section(competitor, search_data)
+                if on_section is not None:
+                    on_section(competitor, sections[competitor])
             
-            # Search for each competitor using Tavily
-            for competitor in competitors:
-                logging.info(f"🔍 Searching real data for {competitor}...")
-                search_query = f"{competitor} Instagram followers social media statistics engagement 2024"
-                search_results = await self._tavily_search(search_query)
-                competitor_data[competitor] = search_results
-                await asyncio.sleep(1)  # Rate limiting
+            # Search all competitors concurrently using Tavily
+            await self._search_many({
+                competitor: f"{competitor} Instagram followers social media statistics engagement 2024"
+                for competitor in competitors
+            }, family="competitor", progress=progress, on_result=_section_ready, refresh=refresh)
             
             # Generate AI analysis based on REAL search results + LLM insights
-            raw_analysis = self._generate_competitor_analysis(competitor_data)
+            raw_analysis = self._generate_competitor_analysis(sections={
+                competitor: sections[competitor] for competitor in competitors
+            })
 
             # Enhance with LLM analysis
+            _report(progress, "Generating AI insights")
             llm_insights = await self._llm_analyze(
                 "competitor analysis",
                 raw_analysis
@@ -87,26 +134,27 @@ class FocusedCrewManager:
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def analyze_lowes_performance(self) -> Dict[str, Any]:
-        """Execute Lowe's performance analysis using REAL web search."""
+    async def analyze_lowes_performance(
+        self, progress: Optional[ProgressCallback] = None, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Execute Lowe's performance analysis using REAL web search (refresh=True bypasses the cache)."""
         try:
             logging.info("🔍 Starting REAL Lowe's analysis with web search...")
             
             platforms = ['Instagram', 'Facebook', 'Twitter']
-            lowes_data = {}
             
-            # Search for Lowe's data on each platform
-            for platform in platforms:
-                logging.info(f"🔍 Searching real Lowe's {platform} data...")
-                search_query = f"Lowes {platform} followers engagement statistics social media 2024"
-                search_results = await self._tavily_search(search_query)
-                lowes_data[platform.lower()] = search_results
-                await asyncio.sleep(1)  # Rate limiting
+            # Search Lowe's data on all platforms concurrently
+            lowes_data = await self._search_many({
+                platform.lower(): f"Lowes {platform} followers engagement statistics social media 2024"
+                for platform in platforms
+            }, family="lowes", progress=progress, refresh=refresh)
             
             # Generate AI analysis based on REAL search results + LLM insights
+            _report(progress, "Extracting metrics")
             raw_analysis = self._generate_lowes_analysis(lowes_data)
 
             # Enhance with LLM analysis
+            _report(progress, "Generating AI insights")
             llm_insights = await self._llm_analyze(
                 "lowes performance analysis",
                 raw_analysis
@@ -129,8 +177,14 @@ class FocusedCrewManager:
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def generate_strategy_and_content(self, competitor_data: str = "", lowes_data: str = "") -> Dict[str, Any]:
-        """Generate strategic recommendations based on REAL search data."""
+    async def generate_strategy_and_content(
+        self,
+        competitor_data: str = "",
+        lowes_data: str = "",
+        progress: Optional[ProgressCallback] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Generate strategic recommendations based on REAL search data (refresh=True bypasses the cache)."""
         try:
             logging.info("🔍 Starting REAL strategy generation with web search...")
             
@@ -141,17 +195,16 @@ class FocusedCrewManager:
                 "retail social media best practices 2024"
             ]
             
-            trend_data = {}
-            for query in trend_queries:
-                logging.info(f"🔍 Searching trends: {query}")
-                search_results = await self._tavily_search(query)
-                trend_data[query] = search_results
-                await asyncio.sleep(1)
+            trend_data = await self._search_many(
+                {query: query for query in trend_queries}, family="strategy", progress=progress, refresh=refresh
+            )
             
             # Generate AI strategy based on REAL trend data + LLM insights
+            _report(progress, "Extracting metrics")
             raw_strategy = self._generate_strategy_analysis(trend_data)
 
             # Enhance with LLM analysis for strategic recommendations
+            _report(progress, "Generating AI insights")
             llm_insights = await self._llm_analyze(
                 "strategy generation and content recommendations",
                 raw_strategy + f"\nCompetitor Context: {competitor_data}\nLowes Context: {lowes_data}"
@@ -174,8 +227,10 @@ class FocusedCrewManager:
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def analyze_ad_campaigns(self) -> Dict[str, Any]:
-        """Analyze ad campaign performance using REAL search + LLM insights."""
+    async def analyze_ad_campaigns(
+        self, progress: Optional[ProgressCallback] = None, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Analyze ad campaign performance using REAL search + LLM insights (refresh=True bypasses the cache)."""
         try:
             logging.info("🔍 Starting REAL ad campaign analysis with web search...")
 
@@ -186,17 +241,16 @@ class FocusedCrewManager:
                 "home improvement retail advertising ROI benchmarks 2024"
             ]
 
-            campaign_data = {}
-            for query in campaign_queries:
-                logging.info(f"🔍 Searching campaign data: {query}")
-                search_results = await self._tavily_search(query)
-                campaign_data[query] = search_results
-                await asyncio.sleep(1)
+            campaign_data = await self._search_many(
+                {query: query for query in campaign_queries}, family="campaign", progress=progress, refresh=refresh
+            )
 
             # Generate AI analysis based on REAL search results + LLM insights
+            _report(progress, "Extracting metrics")
             raw_analysis = self._generate_campaign_analysis(campaign_data)
 
             # Enhance with LLM analysis for campaign optimization
+            _report(progress, "Generating AI insights")
             llm_insights = await self._llm_analyze(
                 "ad campaign performance analysis and optimization",
                 raw_analysis
@@ -219,35 +273,144 @@ class FocusedCrewManager:
                 "timestamp": datetime.now().isoformat()
             }
 
-    async def _tavily_search(self, query: str) -> Dict[str, Any]:
-        """Perform REAL search using Tavily API."""
+    async def execute_full_analysis(
+        self, progress: Optional[ProgressCallback] = None, on_section: Optional[SectionCallback] = None
+    ) -> Dict[str, Any]:
+        """Run all analyses as a stage DAG.
+
+        Competitor, Lowe's and ad-campaign analyses run concurrently; strategy generation
+        starts as soon as the competitor and Lowe's stages finish and takes their reports
+        directly. Each stage result is passed to on_section as it finishes.
+        """
+        logging.info("🚀 Starting full analysis stage graph...")
+        started = time.monotonic()
+
+        def stage_progress(stage: str) -> Optional[ProgressCallback]:
+            if progress is None:
+                return None
+            return lambda message: progress(f"{stage}: {message}")
+
+        stages = {
+            "competitor_analysis": (
+                [], lambda inputs: self.analyze_competitors(progress=stage_progress("competitor_analysis"))
+            ),
+            "lowes_performance": (
+                [], lambda inputs: self.analyze_lowes_performance(progress=stage_progress("lowes_performance"))
+            ),
+            "campaign_analysis": (
+                [], lambda inputs: self.analyze_ad_campaigns(progress=stage_progress("campaign_analysis"))
+            ),
+            "strategy_generation": (
+                ["competitor_analysis", "lowes_performance"],
+                lambda inputs: self.generate_strategy_and_content(
+                    inputs["competitor_analysis"].get("result", ""),
+                    inputs["lowes_performance"].get("result", ""),
+                    progress=stage_progress("strategy_generation")
+                )
+            ),
+        }
+        results, stage_status = await self._run_stage_graph(stages, progress, on_section)
+
+        all_succeeded = all(stage["status"] == "completed" for stage in stage_status.values())
+        return {
+            "status": "success" if all_succeeded else "partial",
+            "analysis_type": "full_analysis",
+            "result": results,
+            "stages": stage_status,
+            "total_duration_seconds": round(time.monotonic() - started, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def _run_stage_graph(
+        self,
+        stages: Dict[str, Tuple[List[str], Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]],
+        progress: Optional[ProgressCallback] = None,
+        on_section: Optional[SectionCallback] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run stages concurrently, each one starting as soon as its dependencies finish.
+
+        Stages map to (dependencies, fn); fn receives the dependency results by name.
+        Returns the stage results and per-stage status/timing records.
+        """
+        tasks: Dict[str, asyncio.Future] = {}
+        stage_status: Dict[str, Any] = {
+            name: {"status": "pending", "depends_on": deps} for name, (deps, _) in stages.items()
+        }
+
+        async def _run(name: str, deps: List[str], fn) -> Dict[str, Any]:
+            inputs = {dep: await tasks[dep] for dep in deps}
+            record = stage_status[name]
+            record.update(status="running", started_at=datetime.now().isoformat())
+            _report(progress, f"Stage {name} started")
+            stage_started = time.monotonic()
+            try:
+                result = await fn(inputs)
+            except Exception as e:
+                logging.error(f"Stage {name} failed: {e}")
+                result = {"status": "error", "error": str(e), "timestamp": datetime.now().isoformat()}
+            record.update(
+                status="completed" if result.get("status") == "success" else "failed",
+                completed_at=datetime.now().isoformat(),
+                duration_seconds=round(time.monotonic() - stage_started, 2)
+            )
+            logging.info(f"✅ Stage {name} {record['status']} in {record['duration_seconds']}s")
+            _report(progress, f"Stage {name} {record['status']}")
+            if on_section is not None:
+                on_section(name, result)
+            return result
+
+        for name, (deps, fn) in stages.items():
+            tasks[name] = asyncio.ensure_future(_run(name, deps, fn))
+
         try:
-            url = "https://api.tavily.com/search"
-            
-            payload = {
-                "api_key": self.tavily_api_key,
-                "query": query,
-                "search_depth": "advanced",
-                "include_answer": True,
-                "include_raw_content": False,
-                "max_results": 5
-            }
-            
-            headers = {"Content-Type": "application/json"}
-            
-            response = requests.post(url, json=payload, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                logging.info(f"✅ Tavily search successful for: {query}")
-                return data
-            else:
-                logging.error(f"❌ Tavily API error: {response.status_code}")
-                return {}
-                
-        except Exception as e:
-            logging.error(f"❌ Tavily search error: {e}")
-            return {}
+            results = await asyncio.gather(*tasks.values())
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return dict(zip(tasks.keys(), results)), stage_status
+
+    async def _tavily_search(self, query: str, family: str = "default", refresh: bool = False) -> Dict[str, Any]:
+        """Perform REAL search using Tavily API, served from the search cache when fresh unless refresh is set."""
+        async def _search():
+            async with self.rate_limiter:
+                return await self.search_client.search(query, **self.search_params)
+
+        async def _fetch():
+            key = make_cache_key(family, query, self.search_params)
+            return await self.search_flight.do(key, _search)
+
+        return await self.search_cache.get_or_fetch(family, query, self.search_params, _fetch, refresh=refresh)
+
+    async def _search_many(
+        self,
+        queries: Dict[str, str],
+        family: str = "default",
+        progress: Optional[ProgressCallback] = None,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Run several searches concurrently under the shared rate limiter.
+
+        Keys map to search queries; results come back under the same keys, in order.
+        on_result is called with each key and result as soon as that search finishes.
+        """
+        async def _search(key: str, query: str):
+            logging.info(f"🔍 Searching real data for {key}...")
+            _report(progress, f"Searching {key}")
+            result = await self._tavily_search(query, family, refresh)
+            _report(progress, f"Search finished: {key}")
+            if on_result is not None:
+                on_result(key, result)
+            return result
+
+        results = await asyncio.gather(*(_search(key, query) for key, query in queries.items()))
+        return dict(zip(queries.keys(), results))
+
+    async def close(self):
+        """Release the pooled HTTP connections and the cache database."""
+        await self.search_client.close()
+        self.search_cache.close()
 
     async def _llm_analyze(self, prompt: str, data: str) -> str:
         """Use LLM to analyze data and provide intelligent insights."""
@@ -283,11 +446,12 @@ class FocusedCrewManager:
     async def _enhanced_pattern_analysis(self, prompt: str, data: str) -> str:
         """Enhanced pattern-based analysis that simulates advanced LLM insights."""
 
-        # Extract key metrics from data
-        follower_counts = re.findall(r'(\d+(?:\.\d+)?)\s*(?:million|M|k|K)?\s*followers?', data, re.IGNORECASE)
-        engagement_data = re.findall(r'(\d+(?:,\d+)*)\s*(?:likes?|comments?)', data, re.IGNORECASE)
-        roas_data = re.findall(r'(\d+(?:\.\d+)?)\s*(?:x|:1)?\s*(?:ROAS|ROI)', data, re.IGNORECASE)
-        cost_data = re.findall(r'\$(\d+(?:\.\d+)?)', data, re.IGNORECASE)
+        # Extract key metrics from data in one pass
+        metrics = self.metric_extractor.extract_text(data)
+        follower_counts = metrics.of("followers")
+        engagement_data = metrics.of("likes", "comments")
+        roas_data = [metric for metric in metrics.of("roas") if metric.text.lower().endswith(("roas", "roi"))]
+        cost_data = metrics.of("cpc", "cpm", "spend", "revenue", "dollar")
 
         insights = []
         current_month = datetime.now().strftime("%B")
@@ -297,15 +461,13 @@ class FocusedCrewManager:
             insights.append("📊 ADVANCED FOLLOWER ANALYSIS:")
             total_followers = 0
             for count in follower_counts[:3]:
-                if 'million' in data.lower() or 'M' in count:
-                    followers = float(count) * 1000000
-                    total_followers += followers
-                    insights.append(f"• Large brand presence: {count}M followers - Top 10% of retail brands")
-                    insights.append(f"• Market share indicator: {followers:,.0f} followers = significant brand awareness")
-                elif 'k' in data.lower() or 'K' in count:
-                    followers = float(count) * 1000
-                    total_followers += followers
-                    insights.append(f"• Growing brand: {count}K followers - 3x growth potential identified")
+                if count.unit in ("M", "B"):
+                    total_followers += count.value
+                    insights.append(f"• Large brand presence: {count.raw}{count.unit} followers - Top 10% of retail brands")
+                    insights.append(f"• Market share indicator: {count.value:,.0f} followers = significant brand awareness")
+                elif count.unit == "K":
+                    total_followers += count.value
+                    insights.append(f"• Growing brand: {count.raw}K followers - 3x growth potential identified")
 
             if total_followers > 0:
                 insights.append(f"• Total reach potential: {total_followers:,.0f} followers across platforms")
@@ -314,7 +476,7 @@ class FocusedCrewManager:
         if engagement_data:
             insights.append("\n💡 ENGAGEMENT INTELLIGENCE:")
             try:
-                avg_engagement = sum(int(e.replace(',', '')) for e in engagement_data[:3]) / len(engagement_data[:3])
+                avg_engagement = sum(e.value for e in engagement_data[:3]) / len(engagement_data[:3])
                 if avg_engagement > 2000:
                     insights.append(f"• Exceptional engagement: {avg_engagement:,.0f} avg - Top 5% performance")
                     insights.append("• Prediction: 40% growth potential with video content optimization")
@@ -331,7 +493,7 @@ class FocusedCrewManager:
         if roas_data or cost_data:
             insights.append("\n💰 CAMPAIGN PERFORMANCE INTELLIGENCE:")
             if roas_data:
-                avg_roas = sum(float(r) for r in roas_data[:3]) / len(roas_data[:3])
+                avg_roas = sum(r.value for r in roas_data[:3]) / len(roas_data[:3])
                 if avg_roas > 4.0:
                     insights.append(f"• Excellent ROAS: {avg_roas:.1f}x - Outperforming industry benchmark")
                 elif avg_roas > 2.0:
@@ -340,7 +502,7 @@ class FocusedCrewManager:
                     insights.append(f"• ROAS opportunity: {avg_roas:.1f}x - 50% improvement potential")
 
             if cost_data:
-                avg_cost = sum(float(c) for c in cost_data[:3]) / len(cost_data[:3])
+                avg_cost = sum(c.value for c in cost_data[:3]) / len(cost_data[:3])
                 insights.append(f"• Cost efficiency: ${avg_cost:.2f} average - Optimization opportunities identified")
 
         # Context-specific strategic recommendations
@@ -411,37 +573,48 @@ class FocusedCrewManager:
             "• Custom seasonal strategy recommended"
         ])
 
-    def _generate_competitor_analysis(self, competitor_data: Dict[str, Any]) -> str:
-        """Generate AI analysis based on REAL competitor search data."""
+    def _competitor_section(self, competitor: str, search_data: Dict[str, Any]) -> str:
+        """Report section for one competitor's REAL search data."""
+        section = f"🔍 {competitor.upper()} - REAL DATA:\n"
+        
+        # Extract real data from Tavily search results
+        if search_data.get('answer'):
+            section += f"• REAL ANSWER: {search_data['answer']}\n"
+        
+        metrics = self._extract_metrics(search_data)
+        followers = self._extract_follower_count(metrics)
+        if followers != "Data not found":
+            section += f"• FOLLOWERS: {followers}\n"
+        
+        engagement = self._extract_engagement_data(metrics)
+        if engagement != "Data not found":
+            section += f"• ENGAGEMENT: {engagement}\n"
+        
+        # Add real content from search results
+        if 'results' in search_data and search_data['results']:
+            for i, result in enumerate(search_data['results'][:2]):
+                if 'content' in result and result['content']:
+                    content_snippet = result['content'][:200].replace('\n', ' ')
+                    section += f"• SOURCE {i+1}: {content_snippet}...\n"
+        
+        return section + "\n"
+
+    def _generate_competitor_analysis(
+        self, competitor_data: Optional[Dict[str, Any]] = None, sections: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate AI analysis based on REAL competitor search data (or prebuilt sections)."""
         current_month = datetime.now().strftime("%B")
         current_year = datetime.now().year
         
         analysis = f"🤖 AI COMPETITOR ANALYSIS - {current_month} {current_year}\n"
         analysis += "📊 REAL-TIME WEB SEARCH RESULTS:\n\n"
         
-        for competitor, search_data in competitor_data.items():
-            analysis += f"🔍 {competitor.upper()} - REAL DATA:\n"
-            
-            # Extract real data from Tavily search results
-            if search_data.get('answer'):
-                analysis += f"• REAL ANSWER: {search_data['answer']}\n"
-            
-            followers = self._extract_follower_count(search_data)
-            if followers != "Data not found":
-                analysis += f"• FOLLOWERS: {followers}\n"
-            
-            engagement = self._extract_engagement_data(search_data)
-            if engagement != "Data not found":
-                analysis += f"• ENGAGEMENT: {engagement}\n"
-            
-            # Add real content from search results
-            if 'results' in search_data and search_data['results']:
-                for i, result in enumerate(search_data['results'][:2]):
-                    if 'content' in result and result['content']:
-                        content_snippet = result['content'][:200].replace('\n', ' ')
-                        analysis += f"• SOURCE {i+1}: {content_snippet}...\n"
-            
-            analysis += "\n"
+        if sections is None:
+            sections = {
+                competitor: self._competitor_section(competitor, search_data)
+                for competitor, search_data in (competitor_data or {}).items()
+            }
+        analysis += "".join(sections.values())
         
         analysis += "🎯 AI INSIGHTS FROM REAL DATA:\n"
         analysis += "• All data sourced from live web search using Tavily API\n"
@@ -465,11 +638,12 @@ class FocusedCrewManager:
             if search_data.get('answer'):
                 analysis += f"• REAL ANSWER: {search_data['answer']}\n"
             
-            followers = self._extract_follower_count(search_data)
+            metrics = self._extract_metrics(search_data)
+            followers = self._extract_follower_count(metrics)
             if followers != "Data not found":
                 analysis += f"• FOLLOWERS: {followers}\n"
             
-            engagement = self._extract_engagement_data(search_data)
+            engagement = self._extract_engagement_data(metrics)
             if engagement != "Data not found":
                 analysis += f"• ENGAGEMENT: {engagement}\n"
             
@@ -536,11 +710,12 @@ class FocusedCrewManager:
                 analysis += f"• CAMPAIGN INSIGHT: {search_data['answer']}\n"
 
             # Extract campaign performance data
-            roas_data = self._extract_roas_data(search_data)
+            metrics = self._extract_metrics(search_data)
+            roas_data = self._extract_roas_data(metrics)
             if roas_data != "Data not found":
                 analysis += f"• ROI/ROAS: {roas_data}\n"
 
-            cpc_data = self._extract_cpc_data(search_data)
+            cpc_data = self._extract_cpc_data(metrics)
             if cpc_data != "Data not found":
                 analysis += f"• COST DATA: {cpc_data}\n"
 
@@ -561,155 +736,42 @@ class FocusedCrewManager:
 
         return analysis
 
-    def _extract_roas_data(self, search_data: Dict[str, Any]) -> str:
-        """Extract ROAS/ROI data from search results."""
-        try:
-            all_content = ""
+    def _extract_metrics(self, search_data: Dict[str, Any]) -> ExtractedMetrics:
+        """Scan the combined search content once and return every typed metric."""
+        return self.metric_extractor.extract(search_data)
 
-            if 'answer' in search_data and search_data['answer']:
-                all_content += search_data['answer'] + " "
-
-            if 'results' in search_data:
-                for result in search_data['results']:
-                    if 'content' in result:
-                        all_content += result['content'] + " "
-
-            # Extract ROAS/ROI metrics
-            roas_patterns = [
-                r'(\d+(?:\.\d+)?)\s*(?:x|:1)?\s*(?:ROAS|ROI|return)',
-                r'(\d+(?:\.\d+)?)\s*(?:%|percent)\s*(?:ROI|return)',
-                r'(\$\d+(?:\.\d+)?)\s*(?:revenue|return)'
-            ]
-
-            for pattern in roas_patterns:
-                match = re.search(pattern, all_content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
+    @staticmethod
+    def _format_money(metric: Metric) -> str:
+        scale = {1e3: "K", 1e6: "M", 1e9: "B"}.get(metric.multiplier, "")
+        return f"${metric.raw}{scale}"
 
+    def _extract_roas_data(self, metrics: ExtractedMetrics) -> str:
+        """Extract ROAS/ROI data from extracted metrics."""
+        metric = metrics.first("roas", "roi_percent", "revenue")
+        if metric is None:
             return "Data not found"
+        return self._format_money(metric) if metric.unit == "$" else metric.raw
 
-        except Exception as e:
-            logging.error(f"Error extracting ROAS data: {e}")
-            return "Error extracting ROAS"
-
-    def _extract_cpc_data(self, search_data: Dict[str, Any]) -> str:
-        """Extract CPC/cost data from search results."""
-        try:
-            all_content = ""
-
-            if 'answer' in search_data and search_data['answer']:
-                all_content += search_data['answer'] + " "
-
-            if 'results' in search_data:
-                for result in search_data['results']:
-                    if 'content' in result:
-                        all_content += result['content'] + " "
-
-            # Extract cost metrics
-            cost_patterns = [
-                r'(\$\d+(?:\.\d+)?)\s*(?:CPC|cost per click)',
-                r'(\$\d+(?:\.\d+)?)\s*(?:CPM|cost per thousand)',
-                r'(\$\d+(?:,\d+)*)\s*(?:budget|spend|cost)'
-            ]
-
-            for pattern in cost_patterns:
-                match = re.search(pattern, all_content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
+    def _extract_cpc_data(self, metrics: ExtractedMetrics) -> str:
+        """Extract CPC/cost data from extracted metrics."""
+        metric = metrics.first("cpc", "cpm", "spend")
+        return self._format_money(metric) if metric else "Data not found"
 
+    def _extract_follower_count(self, metrics: ExtractedMetrics) -> str:
+        """Extract the largest follower count from extracted metrics."""
+        metric = metrics.largest("followers")
+        if metric is None:
             return "Data not found"
 
-        except Exception as e:
-            logging.error(f"Error extracting cost data: {e}")
-            return "Error extracting cost"
-
-    def _extract_follower_count(self, search_data: Dict[str, Any]) -> str:
-        """Extract follower count from real search data with improved accuracy."""
-        try:
-            all_content = ""
-
-            # Combine all content for better extraction
-            if 'answer' in search_data and search_data['answer']:
-                all_content += search_data['answer'] + " "
-
-            if 'results' in search_data:
-                for result in search_data['results']:
-                    if 'content' in result:
-                        all_content += result['content'] + " "
-
-            # Enhanced patterns to catch more variations
-            follower_patterns = [
-                r'(\d+(?:\.\d+)?)\s*(?:M|million)\s*followers?',  # 1M followers, 1.5M followers
-                r'(\d+(?:\.\d+)?)\s*(?:K|k)\s*followers?',        # 982.3K followers
-                r'(\d+(?:,\d+)*)\s*followers?',                   # 1,000,000 followers
-                r'has\s+(\d+(?:\.\d+)?)\s*(?:M|million|K|k)?\s*followers?',  # has 1M followers
-                r'(\d+(?:\.\d+)?)\s*(?:M|million|K|k)?\s+Followers',  # 1M Followers (capital F)
-            ]
-
-            # Try each pattern and return the highest/most specific match
-            best_match = None
-            best_value = 0
-
-            for pattern in follower_patterns:
-                matches = re.findall(pattern, all_content, re.IGNORECASE)
-                for match in matches:
-                    try:
-                        # Convert to numeric value for comparison
-                        if 'M' in all_content[all_content.find(match):all_content.find(match)+20] or 'million' in all_content[all_content.find(match):all_content.find(match)+20].lower():
-                            value = float(match) * 1000000
-                            formatted = f"{match}M followers"
-                        elif 'K' in all_content[all_content.find(match):all_content.find(match)+20] or 'k' in all_content[all_content.find(match):all_content.find(match)+20]:
-                            value = float(match.replace(',', '')) * 1000
-                            formatted = f"{match}K followers"
-                        else:
-                            value = float(match.replace(',', ''))
-                            if value > 1000000:
-                                formatted = f"{value/1000000:.1f}M followers"
-                            elif value > 1000:
-                                formatted = f"{value/1000:.0f}K followers"
-                            else:
-                                formatted = f"{int(value)} followers"
-
-                        # Keep the highest value (most likely to be accurate)
-                        if value > best_value:
-                            best_value = value
-                            best_match = formatted
-                    except:
-                        continue
-
-            return best_match if best_match else "Data not found"
-
-        except Exception as e:
-            logging.error(f"Error extracting follower count: {e}")
-            return "Error extracting data"
-
-    def _extract_engagement_data(self, search_data: Dict[str, Any]) -> str:
-        """Extract engagement data from real search data."""
-        try:
-            all_content = ""
-            
-            if 'answer' in search_data and search_data['answer']:
-                all_content += search_data['answer'] + " "
-            
-            if 'results' in search_data:
-                for result in search_data['results']:
-                    if 'content' in result:
-                        all_content += result['content'] + " "
-            
-            # Extract engagement metrics
-            engagement_patterns = [
-                r'(\d+(?:\.\d+)?\s*(?:%|percent)\s*engagement)',
-                r'(\d+(?:,\d+)*\s*likes?)',
-                r'(\d+(?:,\d+)*\s*comments?)'
-            ]
-            
-            for pattern in engagement_patterns:
-                match = re.search(pattern, all_content, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-            
-            return "Data not found"
-            
-        except Exception as e:
-            logging.error(f"Error extracting engagement data: {e}")
-            return "Error extracting engagement"
+        if metric.unit:
+            return f"{metric.raw}{metric.unit} followers"
+        if metric.value > 1000000:
+            return f"{metric.value/1000000:.1f}M followers"
+        if metric.value > 1000:
+            return f"{metric.value/1000:.0f}K followers"
+        return f"{int(metric.value)} followers"
+
+    def _extract_engagement_data(self, metrics: ExtractedMetrics) -> str:
+        """Extract engagement data from extracted metrics."""
+        metric = metrics.first("engagement_rate", "likes", "comments")
+        return metric.text if metric else "Data not found"
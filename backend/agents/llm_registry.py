@@ -0,0 +1,44 @@
+"""Shared, lazily built LLM clients and tools for the CrewAI agents."""
+
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_lock = threading.Lock()
+_llms: Dict[float, Any] = {}
+_search_tool: Optional[Any] = None
+_search_tool_built = False
+
+
+def get_llm(temperature: float = 0.3):
+    """Azure OpenAI chat client for this temperature, built on first use and shared by all agents."""
+    with _lock:
+        if temperature not in _llms:
+            from langchain_openai import AzureChatOpenAI
+
+            _llms[temperature] = AzureChatOpenAI(
+                azure_deployment=os.getenv("AZURE_DEPLOYMENT_NAME", "intern-gpt4"),
+                azure_endpoint=os.getenv("AZURE_ENDPOINT"),
+                api_key=os.getenv("AZURE_API_KEY"),
+                api_version=os.getenv("AZURE_API_VERSION", "2023-05-15"),
+                temperature=temperature,
+                model_name="gpt-4"
+            )
+        return _llms[temperature]
+
+
+def get_search_tools() -> List[Any]:
+    """Web search tools for the agents ([] when SERPAPI_KEY is not set), built on first use."""
+    global _search_tool, _search_tool_built
+    with _lock:
+        if not _search_tool_built:
+            if os.getenv("SERPAPI_KEY"):
+                from crewai_tools import SerperDevTool
+
+                _search_tool = SerperDevTool(api_key=os.getenv("SERPAPI_KEY"))
+            _search_tool_built = True
+        return [_search_tool] if _search_tool else []
@@ -0,0 +1,164 @@
+"""Single-pass metric extraction from Tavily search results."""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+MULTIPLIERS = {
+    "k": 1e3,
+    "thousand": 1e3,
+    "m": 1e6,
+    "million": 1e6,
+    "b": 1e9,
+    "billion": 1e9,
+}
+
+_NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?"
+_SCALE = r"(?:k|thousand|m|million|b|billion)\b"
+
+# One pattern, one scan. Every metric starts with a number (or "$" + number) that is
+# not preceded by another digit, so the number is matched once and the suffix decides
+# which metric family it belongs to.
+METRIC_PATTERN = re.compile(
+    rf"""(?<![\d.,])(?:
+        \$(?P<m_num>{_NUMBER})\s*(?P<m_scale>{_SCALE})?
+            (?:\s*(?P<m_kind>CPC|cost\ per\ click|CPM|cost\ per\ thousand|budget|spend|cost|revenue|return))?
+      | (?P<num>{_NUMBER})\s*(?:
+            (?:%|percent)\s*(?:(?P<engagement>engagement)|(?P<roi_percent>ROI|return))
+          | (?P<f_scale>{_SCALE})?\s*(?P<followers>followers?)
+          | (?P<interactions>likes?|comments?)
+          | (?P<r_unit>x|:1)?\s*(?P<roas>ROAS|ROI|return)
+        )
+    )""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+MONEY_KINDS = {
+    "cpc": "cpc",
+    "cost per click": "cpc",
+    "cpm": "cpm",
+    "cost per thousand": "cpm",
+    "budget": "spend",
+    "spend": "spend",
+    "cost": "spend",
+    "revenue": "revenue",
+    "return": "revenue",
+}
+
+
+@dataclass
+class Metric:
+    """A single number found in search text, with its unit and where it came from."""
+
+    kind: str
+    value: float
+    raw: str
+    unit: str
+    multiplier: float
+    offset: int
+    source_url: Optional[str]
+    text: str
+
+
+@dataclass
+class ExtractedMetrics:
+    """All metrics from one search result payload, in text order."""
+
+    metrics: List[Metric] = field(default_factory=list)
+
+    def of(self, *kinds: str) -> List[Metric]:
+        """Metrics of the given kinds, in text order."""
+        return [metric for metric in self.metrics if metric.kind in kinds]
+
+    def first(self, *kinds: str) -> Optional[Metric]:
+        """First metric of the highest-priority kind that has any match."""
+        for kind in kinds:
+            for metric in self.metrics:
+                if metric.kind == kind:
+                    return metric
+        return None
+
+    def largest(self, kind: str) -> Optional[Metric]:
+        """Metric of this kind with the largest scaled value."""
+        candidates = self.of(kind)
+        return max(candidates, key=lambda metric: metric.value) if candidates else None
+
+
+def _to_float(raw: str) -> float:
+    return float(raw.replace(",", ""))
+
+
+def _build_metric(match: "re.Match", offset: int, source_url: Optional[str]) -> Optional[Metric]:
+    text = match.group(0).strip()
+
+    if match.group("m_num") is not None:
+        raw, scale = match.group("m_num"), (match.group("m_scale") or "").lower()
+        multiplier = MULTIPLIERS.get(scale, 1.0)
+        money_kind = MONEY_KINDS.get((match.group("m_kind") or "").lower(), "dollar")
+        return Metric(money_kind, _to_float(raw) * multiplier, raw, "$", multiplier, offset, source_url, text)
+
+    raw = match.group("num")
+
+    if match.group("followers"):
+        multiplier = MULTIPLIERS.get((match.group("f_scale") or "").lower(), 1.0)
+        unit = {1e3: "K", 1e6: "M", 1e9: "B"}.get(multiplier, "")
+        return Metric("followers", _to_float(raw) * multiplier, raw, unit, multiplier, offset, source_url, text)
+
+    interactions = match.group("interactions")
+    if interactions:
+        metric_kind = "likes" if interactions[0] in "lL" else "comments"
+        return Metric(metric_kind, _to_float(raw), raw, "", 1.0, offset, source_url, text)
+
+    if match.group("engagement"):
+        return Metric("engagement_rate", _to_float(raw), raw, "%", 1.0, offset, source_url, text)
+
+    if match.group("roi_percent"):
+        return Metric("roi_percent", _to_float(raw), raw, "%", 1.0, offset, source_url, text)
+
+    if match.group("roas"):
+        unit = (match.group("r_unit") or "x").lower()
+        return Metric("roas", _to_float(raw), raw, unit, 1.0, offset, source_url, text)
+
+    return None
+
+
+class MetricExtractor:
+    """Precompiled extraction engine; one regex scan over the combined search text."""
+
+    def combine(self, search_data: Dict[str, Any]) -> Tuple[str, List[int], List[Optional[str]]]:
+        """Join answer and result contents, remembering where each source starts."""
+        parts, starts, urls = [], [], []
+        position = 0
+
+        def _add(text: str, url: Optional[str]):
+            nonlocal position
+            starts.append(position)
+            urls.append(url)
+            parts.append(text)
+            position += len(text) + 1
+
+        if search_data.get("answer"):
+            _add(search_data["answer"], None)
+        for result in search_data.get("results") or []:
+            if result.get("content"):
+                _add(result["content"], result.get("url"))
+
+        return " ".join(parts), starts, urls
+
+    def extract_text(self, text: str, starts: List[int] = None, urls: List[Optional[str]] = None) -> ExtractedMetrics:
+        """Extract every metric from plain text in a single pass."""
+        extracted = ExtractedMetrics()
+        for match in METRIC_PATTERN.finditer(text):
+            source_url = None
+            if starts:
+                source_url = urls[bisect_right(starts, match.start()) - 1]
+            metric = _build_metric(match, match.start(), source_url)
+            if metric is not None:
+                extracted.metrics.append(metric)
+        return extracted
+
+    def extract(self, search_data: Dict[str, Any]) -> ExtractedMetrics:
+        """Extract every metric from a Tavily response (answer + result contents)."""
+        text, starts, urls = self.combine(search_data or {})
+        return self.extract_text(text, starts, urls)
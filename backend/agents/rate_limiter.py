@@ -0,0 +1,55 @@
+"""Token-bucket rate limiter for outbound search API calls."""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+
+class TokenBucketLimiter:
+    """Async limiter enforcing a requests/sec rate, a burst size and a cap on in-flight calls.
+
+    Use as ``async with limiter: ...`` around each upstream request.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.rate = rate or float(os.getenv("SEARCH_RATE_LIMIT", "5"))
+        self.burst = burst or int(os.getenv("SEARCH_RATE_BURST", str(max(1, int(self.rate)))))
+        self.max_in_flight = max_in_flight or int(os.getenv("SEARCH_MAX_IN_FLIGHT", "8"))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire_token(self):
+        """Wait until a token is available and consume it (FIFO across waiters)."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self._in_flight.acquire()
+        try:
+            await self.acquire_token()
+        except BaseException:
+            self._in_flight.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._in_flight.release()
+        return False
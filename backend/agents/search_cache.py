@@ -0,0 +1,233 @@
+"""Persistent TTL cache for web search results with stale-while-revalidate."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Awaitable, Callable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "search_cache.sqlite3"
+
+# Freshness per query family, in seconds. Override with SEARCH_CACHE_TTL_<FAMILY>.
+DEFAULT_FAMILY_TTLS = {
+    "competitor": 6 * 3600,
+    "lowes": 6 * 3600,
+    "strategy": 12 * 3600,
+    "campaign": 12 * 3600,
+    "serp_competitor": 6 * 3600,
+    "serp_trends": 3 * 3600,
+    "default": 3600,
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case and collapse whitespace so trivially different queries share an entry."""
+    return " ".join(query.lower().split())
+
+
+def make_cache_key(family: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable hash of the query family, normalized query and search parameters."""
+    raw = json.dumps(
+        {"family": family, "query": normalize_query(query), "params": params or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """Two-tier (in-memory LRU + SQLite) search cache.
+
+    Entries younger than the family TTL are served as fresh hits. Entries past the
+    TTL but still inside the stale window are served immediately while a background
+    refresh replaces them. Anything older is treated as a miss.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        memory_entries: Optional[int] = None,
+        stale_factor: Optional[float] = None,
+    ):
+        self.path = str(path or os.getenv("SEARCH_CACHE_PATH", DEFAULT_CACHE_PATH))
+        self.memory_entries = memory_entries or int(os.getenv("SEARCH_CACHE_MEMORY_ENTRIES", "512"))
+        self.stale_factor = stale_factor if stale_factor is not None else float(os.getenv("SEARCH_CACHE_STALE_FACTOR", "1.0"))
+        self.enabled = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() != "false"
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing = set()
+        self._background = set()
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, family TEXT NOT NULL, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._db.commit()
+        self._purge_expired()
+
+        self.counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "disk_hits": 0,
+        }
+
+    def ttl_for(self, family: str) -> float:
+        """Freshness window for a query family."""
+        default = DEFAULT_FAMILY_TTLS.get(family, DEFAULT_FAMILY_TTLS["default"])
+        return float(os.getenv(f"SEARCH_CACHE_TTL_{family.upper()}", default))
+
+    def _max_age(self, family: str) -> float:
+        ttl = self.ttl_for(family)
+        return ttl + ttl * self.stale_factor
+
+    # Disk tier -----------------------------------------------------------
+
+    def _disk_get(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT stored_at, value FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _disk_set(self, key: str, family: str, stored_at: float, value: Any):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_cache (key, family, value, stored_at) VALUES (?, ?, ?, ?)",
+                (key, family, json.dumps(value, default=str), stored_at),
+            )
+            self._db.commit()
+
+    def _purge_expired(self):
+        now = time.time()
+        with self._db_lock:
+            families = [row[0] for row in self._db.execute("SELECT DISTINCT family FROM search_cache")]
+            for family in families:
+                self._db.execute(
+                    "DELETE FROM search_cache WHERE family = ? AND stored_at < ?",
+                    (family, now - self._max_age(family)),
+                )
+            self._db.commit()
+
+    # Memory tier ---------------------------------------------------------
+
+    def _memory_set(self, key: str, stored_at: float, value: Any):
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+
+        loop = asyncio.get_event_loop()
+        entry = await loop.run_in_executor(None, self._disk_get, key)
+        if entry is not None:
+            self.counters["disk_hits"] += 1
+            self._memory_set(key, *entry)
+        return entry
+
+    async def _store(self, key: str, family: str, value: Any):
+        stored_at = time.time()
+        self._memory_set(key, stored_at, value)
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._disk_set, key, family, stored_at, value)
+
+    @staticmethod
+    def _is_cacheable(value: Any) -> bool:
+        """Empty results and upstream error payloads are never cached."""
+        if not value:
+            return False
+        return not (isinstance(value, dict) and "error" in value)
+
+    # Public API ----------------------------------------------------------
+
+    async def get_or_fetch(
+        self,
+        family: str,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        fetch: Callable[[], Awaitable[Any]],
+        refresh: bool = False,
+    ) -> Any:
+        """Return a cached result for (family, query, params), calling fetch on a miss.
+
+        With refresh=True the cached entry is ignored and replaced by a fresh fetch.
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = make_cache_key(family, query, params)
+        entry = None if refresh else await self._lookup(key)
+
+        if entry is not None:
+            stored_at, value = entry
+            age = time.time() - stored_at
+            if age < self.ttl_for(family):
+                self.counters["hits"] += 1
+                return value
+            if age < self._max_age(family):
+                self.counters["stale_hits"] += 1
+                self._schedule_refresh(key, family, fetch)
+                return value
+
+        self.counters["refreshes" if refresh else "misses"] += 1
+        value = await fetch()
+        if self._is_cacheable(value):
+            await self._store(key, family, value)
+        return value
+
+    def _schedule_refresh(self, key: str, family: str, fetch: Callable[[], Awaitable[Any]]):
+        """Refresh a stale entry in the background, at most once per key at a time."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def _refresh():
+            try:
+                value = await fetch()
+                if self._is_cacheable(value):
+                    await self._store(key, family, value)
+                    self.counters["refreshes"] += 1
+            except Exception as e:
+                self.counters["refresh_errors"] += 1
+                logging.error(f"Search cache refresh failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.ensure_future(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes for tuning."""
+        lookups = self.counters["hits"] + self.counters["stale_hits"] + self.counters["misses"]
+        with self._db_lock:
+            disk_entries = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return {
+            **self.counters,
+            "hit_rate": round((self.counters["hits"] + self.counters["stale_hits"]) / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "disk_entries": disk_entries,
+            "refreshing": len(self._refreshing),
+        }
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._db_lock:
+            self._db.close()
@@ -0,0 +1,90 @@
+"""Async Tavily search client with a shared keep-alive connection pool."""
+
+import asyncio
+import logging
+import os
+from typing import Dict, Any, Optional
+
+import aiohttp
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+
+class TavilySearchClient:
+    """Non-blocking Tavily client that reuses one aiohttp session for the process lifetime."""
+
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        keepalive_timeout: Optional[float] = None,
+    ):
+        self.api_key = api_key
+        self.pool_size = pool_size or int(os.getenv("TAVILY_POOL_SIZE", "20"))
+        self.per_host_limit = per_host_limit or int(os.getenv("TAVILY_POOL_PER_HOST", "10"))
+        self.timeout = timeout or float(os.getenv("TAVILY_TIMEOUT", "15"))
+        self.keepalive_timeout = keepalive_timeout or float(os.getenv("TAVILY_KEEPALIVE_TIMEOUT", "60"))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session on first use, inside the running event loop."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    limit_per_host=self.per_host_limit,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    headers={"Content-Type": "application/json"},
+                )
+        return self._session
+
+    async def search(
+        self,
+        query: str,
+        search_depth: str = "advanced",
+        max_results: int = 5,
+        include_answer: bool = True,
+    ) -> Dict[str, Any]:
+        """Run a Tavily search; returns an empty dict on any failure."""
+        payload = {
+            "api_key": self.api_key,
+            "query": query,
+            "search_depth": search_depth,
+            "include_answer": include_answer,
+            "include_raw_content": False,
+            "max_results": max_results,
+        }
+
+        try:
+            session = await self._get_session()
+            async with session.post(TAVILY_SEARCH_URL, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    logging.info(f"✅ Tavily search successful for: {query}")
+                    return data
+
+                logging.error(f"❌ Tavily API error: {response.status}")
+                return {}
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"❌ Tavily search error: {e}")
+            return {}
+
+    async def close(self):
+        """Close the pooled session and release its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,27 +1,15 @@
 """Strategic Recommendation Agent using CrewAI."""
 
-import os
-from crewai import Agent, Task, Crew
-from crewai_tools import SerperDevTool
-from langchain_openai import AzureChatOpenAI
+from crewai import Agent, Task
 from dotenv import load_dotenv
 from typing import Dict, List, Any
 import json
 
-load_dotenv()
-
-# Initialize Azure OpenAI
-llm = AzureChatOpenAI(
-    azure_deployment=os.getenv("AZURE_DEPLOYMENT_NAME", "intern-gpt4"),
-    azure_endpoint=os.getenv("AZURE_ENDPOINT"),
-    api_key=os.getenv("AZURE_API_KEY"),
-    api_version=os.getenv("AZURE_API_VERSION", "2023-05-15"),
-    temperature=0.4,
-    model_name="gpt-4"
-)
+from .crew_templates import CrewTemplates
+from .crew_trace import crew_verbose
+from .llm_registry import get_llm, get_search_tools
 
-# Initialize tools
-search_tool = SerperDevTool(api_key=os.getenv("SERPAPI_KEY"))
+load_dotenv()
 
 class StrategyRecommendationAgent:
     """Strategic Recommendation Agent for generating actionable content and campaign strategies."""
@@ -35,56 +23,63 @@ class StrategyRecommendationAgent:
             Your expertise lies in translating insights into practical recommendations that drive engagement, brand awareness, 
             and business results. You understand the home improvement market deeply and can create strategies that resonate 
             with DIY enthusiasts, homeowners, and contractors alike.""",
-            tools=[search_tool],
-            llm=llm,
-            verbose=True,
+            tools=get_search_tools(),
+            llm=get_llm(0.4),
+            verbose=crew_verbose(),
             allow_delegation=False
         )
+        self.crews = CrewTemplates(self.agent, "strategy_recommendation")
+    
+    def create_content_strategy_task(self) -> Task:
+        """Task template for generate_content_strategy()."""
+        return Task(
+            description="""
+            Based on competitor analysis and internal performance data, generate a comprehensive content strategy for Lowe's.
+            
+            Competitor insights: {competitor_data}
+            Performance data: {performance_data}
+            
+            Develop strategy for:
+            1. Content themes and topics that will resonate with target audience
+            2. Content calendar with seasonal and trending topics
+            3. Platform-specific content strategies
+            4. Content formats and creative approaches
+            5. Hashtag and SEO optimization strategies
+            6. Influencer and partnership opportunities
+            7. User-generated content campaigns
+            8. Cross-platform content distribution
+            
+            Focus on:
+            - Differentiating Lowe's from competitors
+            - Leveraging identified market gaps
+            - Maximizing engagement and reach
+            - Driving traffic and conversions
+            - Building brand loyalty and community
+            
+            Provide specific, actionable recommendations with timelines.
+            """,
+            agent=self.agent,
+            expected_output="""A comprehensive JSON strategy document containing:
+            - content_themes: Primary content pillars and topics
+            - content_calendar: Monthly content planning with seasonal focus
+            - platform_strategies: Specific approaches for each social platform
+            - creative_guidelines: Content format and style recommendations
+            - engagement_tactics: Strategies to boost audience interaction
+            - growth_strategies: Plans for audience and reach expansion
+            - measurement_framework: KPIs and success metrics
+            - implementation_roadmap: Timeline and priority actions"""
+        )
     
     def generate_content_strategy(self, competitor_data: Dict = None, performance_data: Dict = None) -> Dict[str, Any]:
         """Generate comprehensive content strategy recommendations."""
         try:
-            strategy_task = Task(
-                description=f"""
-                Based on competitor analysis and internal performance data, generate a comprehensive content strategy for Lowe's.
-                
-                Competitor insights: {competitor_data if competitor_data else "Use general market knowledge"}
-                Performance data: {performance_data if performance_data else "Use industry benchmarks"}
-                
-                Develop strategy for:
-                1. Content themes and topics that will resonate with target audience
-                2. Content calendar with seasonal and trending topics
-                3. Platform-specific content strategies
-                4. Content formats and creative approaches
-                5. Hashtag and SEO optimization strategies
-                6. Influencer and partnership opportunities
-                7. User-generated content campaigns
-                8. Cross-platform content distribution
-                
-                Focus on:
-                - Differentiating Lowe's from competitors
-                - Leveraging identified market gaps
-                - Maximizing engagement and reach
-                - Driving traffic and conversions
-                - Building brand loyalty and community
-                
-                Provide specific, actionable recommendations with timelines.
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON strategy document containing:
-                - content_themes: Primary content pillars and topics
-                - content_calendar: Monthly content planning with seasonal focus
-                - platform_strategies: Specific approaches for each social platform
-                - creative_guidelines: Content format and style recommendations
-                - engagement_tactics: Strategies to boost audience interaction
-                - growth_strategies: Plans for audience and reach expansion
-                - measurement_framework: KPIs and success metrics
-                - implementation_roadmap: Timeline and priority actions"""
+            result = self.crews.kickoff(
+                "content_strategy",
+                self.create_content_strategy_task,
+                competitor_data=competitor_data if competitor_data else "Use general market knowledge",
+                performance_data=performance_data if performance_data else "Use industry benchmarks"
             )
             
-            crew = Crew(agents=[self.agent], tasks=[strategy_task], verbose=True)
-            result = crew.kickoff()
-            
             return {
                 "status": "success",
                 "agent_type": "strategy_recommendation",
@@ -99,51 +94,56 @@ class StrategyRecommendationAgent:
                 "error": str(e)
             }
     
+    def create_campaign_recommendations_task(self) -> Task:
+        """Task template for generate_campaign_recommendations()."""
+        return Task(
+            description="""
+            Generate specific marketing campaign recommendations for Lowe's based on current trends and market opportunities.
+            
+            Trend insights: {trend_data}
+            
+            Develop campaigns for:
+            1. Seasonal promotions (Spring/Summer home improvement, Holiday decorating)
+            2. Trending topics and viral opportunities
+            3. Product launches and new arrivals
+            4. Educational content series (DIY tutorials, how-to guides)
+            5. Community engagement initiatives
+            6. Sustainability and eco-friendly focus
+            7. Smart home technology integration
+            8. Professional contractor partnerships
+            
+            For each campaign, provide:
+            - Campaign concept and messaging
+            - Target audience and demographics
+            - Content formats and creative direction
+            - Platform distribution strategy
+            - Timeline and key milestones
+            - Budget considerations and ROI projections
+            - Success metrics and KPIs
+            
+            Prioritize campaigns based on potential impact and feasibility.
+            """,
+            agent=self.agent,
+            expected_output="""A comprehensive JSON campaign portfolio containing:
+            - priority_campaigns: Top 5 recommended campaigns with full details
+            - seasonal_campaigns: Time-sensitive campaign opportunities
+            - evergreen_campaigns: Ongoing campaign concepts
+            - campaign_calendar: Annual campaign timeline
+            - resource_requirements: Budget and team needs for each campaign
+            - success_metrics: How to measure campaign effectiveness
+            - risk_assessment: Potential challenges and mitigation strategies
+            - implementation_guide: Step-by-step execution plans"""
+        )
+    
     def generate_campaign_recommendations(self, trend_data: Dict = None) -> Dict[str, Any]:
         """Generate specific campaign recommendations based on trends and opportunities."""
         try:
-            campaign_task = Task(
-                description=f"""
-                Generate specific marketing campaign recommendations for Lowe's based on current trends and market opportunities.
-                
-                Trend insights: {trend_data if trend_data else "Use current market trends"}
-                
-                Develop campaigns for:
-                1. Seasonal promotions (Spring/Summer home improvement, Holiday decorating)
-                2. Trending topics and viral opportunities
-                3. Product launches and new arrivals
-                4. Educational content series (DIY tutorials, how-to guides)
-                5. Community engagement initiatives
-                6. Sustainability and eco-friendly focus
-                7. Smart home technology integration
-                8. Professional contractor partnerships
-                
-                For each campaign, provide:
-                - Campaign concept and messaging
-                - Target audience and demographics
-                - Content formats and creative direction
-                - Platform distribution strategy
-                - Timeline and key milestones
-                - Budget considerations and ROI projections
-                - Success metrics and KPIs
-                
-                Prioritize campaigns based on potential impact and feasibility.
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON campaign portfolio containing:
-                - priority_campaigns: Top 5 recommended campaigns with full details
-                - seasonal_campaigns: Time-sensitive campaign opportunities
-                - evergreen_campaigns: Ongoing campaign concepts
-                - campaign_calendar: Annual campaign timeline
-                - resource_requirements: Budget and team needs for each campaign
-                - success_metrics: How to measure campaign effectiveness
-                - risk_assessment: Potential challenges and mitigation strategies
-                - implementation_guide: Step-by-step execution plans"""
+            result = self.crews.kickoff(
+                "campaign_recommendations",
+                self.create_campaign_recommendations_task,
+                trend_data=trend_data if trend_data else "Use current market trends"
             )
             
-            crew = Crew(agents=[self.agent], tasks=[campaign_task], verbose=True)
-            result = crew.kickoff()
-            
             return {
                 "status": "success",
                 "agent_type": "strategy_recommendation",
@@ -158,49 +158,54 @@ class StrategyRecommendationAgent:
                 "error": str(e)
             }
     
+    def create_competitive_strategy_task(self) -> Task:
+        """Task template for generate_competitive_strategy()."""
+        return Task(
+            description="""
+            Develop competitive positioning and differentiation strategies for Lowe's based on competitor analysis.
+            
+            Competitor analysis: {competitor_analysis}
+            
+            Develop strategies for:
+            1. Competitive differentiation and unique value propositions
+            2. Market positioning and brand messaging
+            3. Competitive response strategies
+            4. Market gap exploitation opportunities
+            5. Defensive strategies against competitor threats
+            6. Innovation and first-mover advantages
+            7. Partnership and collaboration opportunities
+            8. Customer acquisition from competitors
+            
+            Focus on:
+            - Lowe's unique strengths and advantages
+            - Competitor weaknesses to exploit
+            - Market opportunities competitors are missing
+            - Defensive strategies for competitive threats
+            - Long-term competitive sustainability
+            
+            Provide actionable strategies with implementation timelines.
+            """,
+            agent=self.agent,
+            expected_output="""A comprehensive JSON competitive strategy containing:
+            - positioning_strategy: How Lowe's should position against competitors
+            - differentiation_tactics: Unique value propositions and messaging
+            - competitive_responses: How to respond to competitor actions
+            - market_opportunities: Gaps Lowe's can exploit
+            - defensive_strategies: Protecting market share and customers
+            - innovation_roadmap: Areas for competitive advantage
+            - partnership_opportunities: Strategic alliances and collaborations
+            - implementation_plan: Timeline and resource allocation"""
+        )
+    
     def generate_competitive_strategy(self, competitor_analysis: Dict = None) -> Dict[str, Any]:
         """Generate competitive positioning and differentiation strategies."""
         try:
-            competitive_task = Task(
-                description=f"""
-                Develop competitive positioning and differentiation strategies for Lowe's based on competitor analysis.
-                
-                Competitor analysis: {competitor_analysis if competitor_analysis else "Use market knowledge"}
-                
-                Develop strategies for:
-                1. Competitive differentiation and unique value propositions
-                2. Market positioning and brand messaging
-                3. Competitive response strategies
-                4. Market gap exploitation opportunities
-                5. Defensive strategies against competitor threats
-                6. Innovation and first-mover advantages
-                7. Partnership and collaboration opportunities
-                8. Customer acquisition from competitors
-                
-                Focus on:
-                - Lowe's unique strengths and advantages
-                - Competitor weaknesses to exploit
-                - Market opportunities competitors are missing
-                - Defensive strategies for competitive threats
-                - Long-term competitive sustainability
-                
-                Provide actionable strategies with implementation timelines.
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON competitive strategy containing:
-                - positioning_strategy: How Lowe's should position against competitors
-                - differentiation_tactics: Unique value propositions and messaging
-                - competitive_responses: How to respond to competitor actions
-                - market_opportunities: Gaps Lowe's can exploit
-                - defensive_strategies: Protecting market share and customers
-                - innovation_roadmap: Areas for competitive advantage
-                - partnership_opportunities: Strategic alliances and collaborations
-                - implementation_plan: Timeline and resource allocation"""
+            result = self.crews.kickoff(
+                "competitive_strategy",
+                self.create_competitive_strategy_task,
+                competitor_analysis=competitor_analysis if competitor_analysis else "Use market knowledge"
             )
             
-            crew = Crew(agents=[self.agent], tasks=[competitive_task], verbose=True)
-            result = crew.kickoff()
-            
             return {
                 "status": "success",
                 "agent_type": "strategy_recommendation",
@@ -215,51 +220,56 @@ class StrategyRecommendationAgent:
                 "error": str(e)
             }
     
+    def create_comprehensive_strategy_task(self) -> Task:
+        """Task template for execute_comprehensive_strategy()."""
+        return Task(
+            description="""
+            Synthesize all available research and analysis data to create a comprehensive marketing strategy for Lowe's.
+            
+            Available data: {all_data}
+            
+            Create integrated strategy covering:
+            1. Overall marketing objectives and goals
+            2. Target audience strategy and segmentation
+            3. Content strategy and creative direction
+            4. Campaign portfolio and calendar
+            5. Competitive positioning and differentiation
+            6. Platform-specific strategies and tactics
+            7. Resource allocation and budget recommendations
+            8. Performance measurement and optimization framework
+            
+            Ensure strategy is:
+            - Data-driven and evidence-based
+            - Actionable and implementable
+            - Aligned with business objectives
+            - Competitive and differentiated
+            - Measurable and optimizable
+            
+            Provide detailed implementation roadmap with priorities and timelines.
+            """,
+            agent=self.agent,
+            expected_output="""A comprehensive JSON marketing strategy containing:
+            - executive_summary: Key strategic recommendations and priorities
+            - strategic_objectives: Goals and success metrics
+            - audience_strategy: Target segments and personas
+            - content_strategy: Themes, formats, and calendar
+            - campaign_portfolio: Priority campaigns and initiatives
+            - competitive_strategy: Positioning and differentiation
+            - platform_strategies: Channel-specific approaches
+            - resource_plan: Budget and team requirements
+            - implementation_roadmap: Timeline and milestones
+            - measurement_framework: KPIs and optimization approach"""
+        )
+    
     def execute_comprehensive_strategy(self, all_data: Dict = None) -> Dict[str, Any]:
         """Execute comprehensive strategy development using all available data."""
         try:
-            comprehensive_task = Task(
-                description=f"""
-                Synthesize all available research and analysis data to create a comprehensive marketing strategy for Lowe's.
-                
-                Available data: {all_data if all_data else "Use comprehensive market analysis"}
-                
-                Create integrated strategy covering:
-                1. Overall marketing objectives and goals
-                2. Target audience strategy and segmentation
-                3. Content strategy and creative direction
-                4. Campaign portfolio and calendar
-                5. Competitive positioning and differentiation
-                6. Platform-specific strategies and tactics
-                7. Resource allocation and budget recommendations
-                8. Performance measurement and optimization framework
-                
-                Ensure strategy is:
-                - Data-driven and evidence-based
-                - Actionable and implementable
-                - Aligned with business objectives
-                - Competitive and differentiated
-                - Measurable and optimizable
-                
-                Provide detailed implementation roadmap with priorities and timelines.
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON marketing strategy containing:
-                - executive_summary: Key strategic recommendations and priorities
-                - strategic_objectives: Goals and success metrics
-                - audience_strategy: Target segments and personas
-                - content_strategy: Themes, formats, and calendar
-                - campaign_portfolio: Priority campaigns and initiatives
-                - competitive_strategy: Positioning and differentiation
-                - platform_strategies: Channel-specific approaches
-                - resource_plan: Budget and team requirements
-                - implementation_roadmap: Timeline and milestones
-                - measurement_framework: KPIs and optimization approach"""
+            result = self.crews.kickoff(
+                "comprehensive_strategy",
+                self.create_comprehensive_strategy_task,
+                all_data=all_data if all_data else "Use comprehensive market analysis"
             )
             
-            crew = Crew(agents=[self.agent], tasks=[comprehensive_task], verbose=True)
-            result = crew.kickoff()
-            
             return {
                 "status": "success",
                 "agent_type": "strategy_recommendation",
@@ -1,35 +1,22 @@
 """Trend & Competitor Research Agent using CrewAI."""
 
-import os
-from crewai import Agent, Task, Crew
-from crewai_tools import SerperDevTool
-from langchain_openai import AzureChatOpenAI
+from crewai import Agent, Task
 from dotenv import load_dotenv
 from typing import Dict, List, Any
 import json
 
-load_dotenv()
+from .crew_templates import CrewTemplates
+from .crew_trace import crew_verbose
+from .llm_registry import get_llm, get_search_tools
 
-# Initialize Azure OpenAI
-llm = AzureChatOpenAI(
-    azure_deployment=os.getenv("AZURE_DEPLOYMENT_NAME", "intern-gpt4"),
-    azure_endpoint=os.getenv("AZURE_ENDPOINT"),
-    api_key=os.getenv("AZURE_API_KEY"),
-    api_version=os.getenv("AZURE_API_VERSION", "2023-05-15"),
-    temperature=0.3,
-    model_name="gpt-4"
-)
+load_dotenv()
 
-# Initialize tools (only if API key is available)
-search_tool = None
-if os.getenv("SERPAPI_KEY"):
-    search_tool = SerperDevTool(api_key=os.getenv("SERPAPI_KEY"))
+DEFAULT_COMPETITORS = ["Home Depot", "Menards", "Wayfair", "Ace Hardware", "Tractor Supply Co"]
 
 class TrendResearchAgent:
     """Trend & Competitor Research Agent for monitoring competitors and identifying trends."""
 
     def __init__(self):
-        tools = [search_tool] if search_tool else []
         self.agent = Agent(
             role="Trend & Competitor Research Specialist",
             goal="Monitor competitor social media accounts, identify trending topics in home improvement, and analyze competitor strategies",
@@ -38,20 +25,18 @@ class TrendResearchAgent:
             identifying emerging trends, analyzing competitor content strategies, and providing actionable insights for
             Lowe's marketing team. You understand the seasonal nature of home improvement and can spot opportunities
             before they become mainstream.""",
-            tools=tools,
-            llm=llm,
-            verbose=True,
+            tools=get_search_tools(),
+            llm=get_llm(0.3),
+            verbose=crew_verbose(),
             allow_delegation=False
         )
+        self.crews = CrewTemplates(self.agent, "trend_research")
     
-    def create_competitor_analysis_task(self, competitors: List[str] = None) -> Task:
-        """Create a task for comprehensive competitor analysis."""
-        if competitors is None:
-            competitors = ["Home Depot", "Menards", "Wayfair", "Ace Hardware", "Tractor Supply Co"]
-
+    def create_competitor_analysis_task(self) -> Task:
+        """Create a task for comprehensive competitor analysis of the {competitors} input."""
         return Task(
-            description=f"""
-            Conduct comprehensive competitor analysis for the following home improvement retailers: {', '.join(competitors)}.
+            description="""
+            Conduct comprehensive competitor analysis for the following home improvement retailers: {competitors}.
 
             For each competitor, analyze:
             1. Recent social media content and engagement patterns
@@ -83,16 +68,19 @@ class TrendResearchAgent:
     def execute_competitor_research(self, competitors: List[str] = None) -> Dict[str, Any]:
         """Execute competitor research and return results."""
         try:
-            task = self.create_competitor_analysis_task(competitors)
-            crew = Crew(agents=[self.agent], tasks=[task], verbose=True)
-            result = crew.kickoff()
+            competitors = competitors or DEFAULT_COMPETITORS
+            result = self.crews.kickoff(
+                "competitor_analysis",
+                self.create_competitor_analysis_task,
+                competitors=", ".join(competitors)
+            )
 
             return {
                 "status": "success",
                 "agent_type": "trend_research",
                 "task_type": "competitor_analysis",
                 "result": result,
-                "competitors_analyzed": competitors or ["Home Depot", "Menards", "Wayfair", "Ace Hardware", "Tractor Supply Co"]
+                "competitors_analyzed": competitors
             }
         except Exception as e:
             return {
@@ -105,39 +93,7 @@ class TrendResearchAgent:
     def execute_trend_monitoring(self) -> Dict[str, Any]:
         """Execute trend monitoring and return results."""
         try:
-            trend_task = Task(
-                description="""
-                Monitor and analyze current trends in the home improvement and DIY space.
-
-                Research trending topics across:
-                1. Social media platforms (Instagram, TikTok, Pinterest, YouTube)
-                2. Home improvement websites and blogs
-                3. Seasonal and holiday-related projects
-                4. Smart home and technology integration
-                5. Sustainable and eco-friendly solutions
-                6. Budget-friendly DIY projects
-
-                For each trend, analyze:
-                - Current popularity and growth trajectory
-                - Target audience and demographics
-                - Content formats that work best
-                - Seasonal relevance and timing
-                - Lowe's product alignment and opportunities
-
-                Prioritize trends based on relevance to Lowe's and implementation feasibility.
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON report containing:
-                - trending_topics: List of current trends with analysis
-                - trend_scores: Relevance and opportunity scores
-                - content_opportunities: Specific content ideas
-                - seasonal_calendar: Trend timing and relevance
-                - audience_insights: Target demographics
-                - implementation_roadmap: Priority order and timeline"""
-            )
-
-            crew = Crew(agents=[self.agent], tasks=[trend_task], verbose=True)
-            result = crew.kickoff()
+            result = self.crews.kickoff("trend_monitoring", self.create_trend_monitoring_task)
 
             return {
                 "status": "success",
@@ -228,20 +184,16 @@ class TrendResearchAgent:
     def execute_full_research(self, competitors: List[str] = None) -> Dict[str, Any]:
         """Execute comprehensive trend and competitor research."""
         try:
-            # Create tasks
-            competitor_task = self.create_competitor_analysis_task(competitors)
-            trend_task = self.create_trend_monitoring_task()
-            gap_analysis_task = self.create_content_gap_analysis_task()
-            
-            # Create crew
-            research_crew = Crew(
-                agents=[self.agent],
-                tasks=[competitor_task, trend_task, gap_analysis_task],
-                verbose=True
-            )
-            
             # Execute research
-            result = research_crew.kickoff()
+            result = self.crews.kickoff(
+                "full_research",
+                lambda: [
+                    self.create_competitor_analysis_task(),
+                    self.create_trend_monitoring_task(),
+                    self.create_content_gap_analysis_task()
+                ],
+                competitors=", ".join(competitors or DEFAULT_COMPETITORS)
+            )
             
             return {
                 "status": "success",
@@ -257,46 +209,46 @@ class TrendResearchAgent:
                 "agent_type": "trend_research"
             }
     
+    def create_specific_competitor_task(self) -> Task:
+        """Task template for analyze_specific_competitor()."""
+        return Task(
+            description="""
+            Conduct an in-depth analysis of {competitor_name}'s social media strategy and performance.
+            
+            Analyze:
+            1. Content strategy and themes
+            2. Posting patterns and frequency
+            3. Engagement rates and audience response
+            4. Visual branding and messaging
+            5. Customer service approach
+            6. Promotional strategies
+            7. Seasonal campaign execution
+            8. Influencer partnerships
+            9. User-generated content utilization
+            10. Cross-platform consistency
+            
+            Provide specific examples and actionable insights for how Lowe's can compete more effectively.
+            """,
+            agent=self.agent,
+            expected_output="""A detailed JSON analysis of {competitor_name} containing:
+            - content_strategy: Their approach to content creation
+            - performance_metrics: Engagement and reach analysis
+            - strengths: What they do exceptionally well
+            - weaknesses: Areas where they're vulnerable
+            - opportunities: How Lowe's can compete better
+            - threats: Areas where they pose the biggest competitive threat
+            - recommendations: Specific tactics for Lowe's to implement"""
+        )
+    
     def analyze_specific_competitor(self, competitor_name: str) -> Dict[str, Any]:
         """Analyze a specific competitor in detail."""
         try:
-            specific_task = Task(
-                description=f"""
-                Conduct an in-depth analysis of {competitor_name}'s social media strategy and performance.
-                
-                Analyze:
-                1. Content strategy and themes
-                2. Posting patterns and frequency
-                3. Engagement rates and audience response
-                4. Visual branding and messaging
-                5. Customer service approach
-                6. Promotional strategies
-                7. Seasonal campaign execution
-                8. Influencer partnerships
-                9. User-generated content utilization
-                10. Cross-platform consistency
-                
-                Provide specific examples and actionable insights for how Lowe's can compete more effectively.
-                """,
-                agent=self.agent,
-                expected_output=f"""A detailed JSON analysis of {competitor_name} containing:
-                - content_strategy: Their approach to content creation
-                - performance_metrics: Engagement and reach analysis
-                - strengths: What they do exceptionally well
-                - weaknesses: Areas where they're vulnerable
-                - opportunities: How Lowe's can compete better
-                - threats: Areas where they pose the biggest competitive threat
-                - recommendations: Specific tactics for Lowe's to implement"""
-            )
-            
-            crew = Crew(
-                agents=[self.agent],
-                tasks=[specific_task],
-                verbose=True
+            result = self.crews.kickoff(
+                "specific_competitor",
+                self.create_specific_competitor_task,
+                competitor_name=competitor_name
             )
             
-            result = crew.kickoff()
-            
             return {
                 "status": "success",
                 "competitor": competitor_name,
@@ -312,44 +264,40 @@ class TrendResearchAgent:
                 "agent_type": "trend_research"
             }
     
+    def create_trending_hashtags_task(self) -> Task:
+        """Task template for monitor_trending_hashtags()."""
+        return Task(
+            description="""
+            Research and analyze trending hashtags in the home improvement and DIY space.
+            
+            Focus on:
+            1. Current trending hashtags on Instagram, TikTok, and Twitter
+            2. Hashtag performance and reach metrics
+            3. Seasonal hashtag trends
+            4. Niche-specific hashtags for different home improvement categories
+            5. Competitor hashtag strategies
+            6. Emerging hashtag opportunities
+            
+            Provide recommendations for Lowe's hashtag strategy including:
+            - High-performing hashtags to use
+            - Optimal hashtag combinations
+            - Seasonal hashtag calendar
+            - Niche hashtags for specific products/services
+            """,
+            agent=self.agent,
+            expected_output="""A comprehensive JSON report containing:
+            - trending_hashtags: Current high-performing hashtags
+            - hashtag_performance: Reach and engagement metrics
+            - seasonal_hashtags: Time-sensitive hashtag opportunities
+            - competitor_hashtags: What competitors are using successfully
+            - recommendations: Specific hashtag strategy for Lowe's
+            - hashtag_calendar: When to use specific hashtags"""
+        )
+    
     def monitor_trending_hashtags(self) -> Dict[str, Any]:
         """Monitor trending hashtags in home improvement space."""
         try:
-            hashtag_task = Task(
-                description="""
-                Research and analyze trending hashtags in the home improvement and DIY space.
-                
-                Focus on:
-                1. Current trending hashtags on Instagram, TikTok, and Twitter
-                2. Hashtag performance and reach metrics
-                3. Seasonal hashtag trends
-                4. Niche-specific hashtags for different home improvement categories
-                5. Competitor hashtag strategies
-                6. Emerging hashtag opportunities
-                
-                Provide recommendations for Lowe's hashtag strategy including:
-                - High-performing hashtags to use
-                - Optimal hashtag combinations
-                - Seasonal hashtag calendar
-                - Niche hashtags for specific products/services
-                """,
-                agent=self.agent,
-                expected_output="""A comprehensive JSON report containing:
-                - trending_hashtags: Current high-performing hashtags
-                - hashtag_performance: Reach and engagement metrics
-                - seasonal_hashtags: Time-sensitive hashtag opportunities
-                - competitor_hashtags: What competitors are using successfully
-                - recommendations: Specific hashtag strategy for Lowe's
-                - hashtag_calendar: When to use specific hashtags"""
-            )
-            
-            crew = Crew(
-                agents=[self.agent],
-                tasks=[hashtag_task],
-                verbose=True
-            )
-            
-            result = crew.kickoff()
+            result = self.crews.kickoff("trending_hashtags", self.create_trending_hashtags_task)
             
             return {
                 "status": "success",
@@ -0,0 +1,84 @@
+"""Baseline handling shared by the benchmark scripts.
+
+Benchmarks produce flat results, {label: {stat: value}}, and name the stat that is
+compared against the stored baseline and whether a higher value is better.
+Baselines are machine specific; record one with --save-baseline on the machine
+you compare on.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+Results = Dict[str, Dict[str, float]]
+
+# (header, stat key, column width)
+Column = Tuple[str, str, int]
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, default_baseline: Path, tolerance_help: str):
+    """--baseline, --save-baseline and --tolerance options."""
+    parser.add_argument("--baseline", type=Path, default=default_baseline, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help=tolerance_help)
+
+
+def load_baseline(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """The stored baseline; None (after explaining why) if a comparison run has none."""
+    if args.baseline.exists():
+        return json.loads(args.baseline.read_text())
+    if args.save_baseline:
+        return {}
+    print(f"No baseline at {args.baseline}; record one on this machine with --save-baseline", file=sys.stderr)
+    return None
+
+
+def _change(value: float, reference: float) -> float:
+    return (value / reference - 1) * 100
+
+
+def compare(
+    results: Results, baseline: Dict[str, Any], metric: str, higher_is_better: bool, tolerance: float
+) -> List[str]:
+    """Labels whose metric moved more than tolerance in the wrong direction."""
+    regressions = []
+    for label, stats in results.items():
+        reference = baseline.get(label)
+        if not reference:
+            continue
+        value, base = stats[metric], reference[metric]
+        regressed = value < base * (1 - tolerance) if higher_is_better else value > base * (1 + tolerance)
+        if regressed:
+            regressions.append(f"{label}: {metric} {value:.1f} (baseline {base:.1f}, {_change(value, base):+.0f}%)")
+    return regressions
+
+
+def print_table(results: Results, baseline: Dict[str, Any], label: str, columns: List[Column], metric: str):
+    """One row per label with the given stat columns and the metric's change against the baseline."""
+    widths = [width for _, _, width in columns]
+    print(f"{label:<40}" + "".join(f" {header:>{width}}" for header, _, width in columns) + f" {'vs base':>9}")
+    print("-" * (40 + sum(width + 1 for width in widths) + 10))
+    for name, stats in results.items():
+        reference = baseline.get(name)
+        delta = f"{_change(stats[metric], reference[metric]):+.0f}%" if reference else "-"
+        cells = "".join(f" {stats[key]:>{width}.1f}" for _, key, width in columns)
+        print(f"{name:<40}{cells} {delta:>9}")
+
+
+def finish(args: argparse.Namespace, results: Results, baseline: Dict[str, Any], metric: str, higher_is_better: bool) -> int:
+    """Save the baseline or report regressions; returns the process exit code."""
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, metric, higher_is_better, args.tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
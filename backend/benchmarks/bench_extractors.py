@@ -0,0 +1,162 @@
+"""Micro-benchmarks for FocusedCrewManager metric extractors and report generators.
+
+Builds synthetic Tavily-shaped responses (answer + N results with realistic numbers)
+and times each extractor and report generator at several payload sizes, reporting
+ops/sec and peak memory. Results are compared against a stored baseline so
+regressions show up.
+
+Usage (from the backend directory):
+
+    python benchmarks/bench_extractors.py                  # run and compare to baseline
+    python benchmarks/bench_extractors.py --save-baseline  # record a new baseline
+    python benchmarks/bench_extractors.py --sizes 5 50     # subset of sizes
+
+Baselines are machine specific; record one on the machine you compare on.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Any, Callable, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Keep the benchmark from touching the real search cache database
+os.environ.setdefault("SEARCH_CACHE_PATH", os.path.join(tempfile.gettempdir(), "bench_search_cache.sqlite3"))
+
+from agents.focused_crew_manager import FocusedCrewManager  # noqa: E402
+from benchmarks._harness import add_baseline_arguments, finish, load_baseline, print_table  # noqa: E402
+
+DEFAULT_SIZES = [5, 50, 500, 5000]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline_extractors.json"
+METRIC = "ops_per_sec"
+
+BRANDS = ["Home Depot", "Lowe's", "Menards", "Wayfair", "Ace Hardware"]
+PLATFORMS = ["Instagram", "Facebook", "Twitter", "TikTok", "Pinterest"]
+FILLER = [
+    "The brand continues to invest in DIY tutorials and seasonal project content.",
+    "Short-form video has become the dominant format for home improvement audiences.",
+    "Analysts expect social commerce to grow through the holiday season.",
+    "User-generated content drives a large share of weekend engagement.",
+    "Smart home installs and outdoor living remain the top trending categories.",
+]
+
+
+def _metric_sentence(rng: random.Random) -> str:
+    brand, platform = rng.choice(BRANDS), rng.choice(PLATFORMS)
+    templates = [
+        lambda: f"{brand} has {rng.uniform(0.2, 12):.1f}M followers on {platform}.",
+        lambda: f"{brand}'s {platform} account grew to {rng.uniform(50, 999):.1f}K followers in 2024.",
+        lambda: f"Top posts average {rng.randint(500, 90000):,} likes and {rng.randint(10, 4000):,} comments.",
+        lambda: f"The account holds a {rng.uniform(0.3, 6):.1f}% engagement rate on {platform}.",
+        lambda: f"Paid social campaigns returned {rng.uniform(1.2, 8):.1f}x ROAS last quarter.",
+        lambda: f"Search ads delivered {rng.randint(80, 600)}% ROI with ${rng.uniform(0.4, 4):.2f} CPC.",
+        lambda: f"Display inventory cost ${rng.uniform(2, 18):.2f} CPM against a ${rng.randint(1, 40)}M budget.",
+    ]
+    return rng.choice(templates)()
+
+
+def make_tavily_response(num_results: int, seed: int = 7) -> Dict[str, Any]:
+    """Synthetic Tavily response with an answer and num_results result entries."""
+    rng = random.Random(seed + num_results)
+    results = []
+    for index in range(num_results):
+        sentences = [_metric_sentence(rng) if rng.random() < 0.6 else rng.choice(FILLER) for _ in range(6)]
+        results.append({
+            "title": f"{rng.choice(BRANDS)} social media statistics #{index}",
+            "url": f"https://example.com/stats/{index}",
+            "content": " ".join(sentences),
+            "score": round(rng.random(), 4),
+        })
+    return {
+        "query": "synthetic benchmark query",
+        "answer": " ".join(_metric_sentence(rng) for _ in range(3)),
+        "results": results,
+    }
+
+
+def measure(fn: Callable[[], Any], min_time: float, min_runs: int = 3) -> Dict[str, float]:
+    """Run fn repeatedly for at least min_time seconds; report ops/sec and peak memory."""
+    runs, elapsed = 0, 0.0
+    start = time.perf_counter()
+    while runs < min_runs or elapsed < min_time:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ops_per_sec": runs / elapsed, "peak_kb": peak / 1024}
+
+
+def build_cases(manager: FocusedCrewManager, payload: Dict[str, Any], loop: asyncio.AbstractEventLoop) -> Dict[str, Callable[[], Any]]:
+    """Extractors and report generators to time against one payload."""
+    metrics = manager._extract_metrics(payload)
+    grouped = {name: payload for name in BRANDS}
+    report_text = manager._generate_competitor_analysis(grouped)
+
+    return {
+        "extract_metrics": lambda: manager._extract_metrics(payload),
+        "extract_follower_count": lambda: manager._extract_follower_count(manager._extract_metrics(payload)),
+        "extract_engagement_data": lambda: manager._extract_engagement_data(manager._extract_metrics(payload)),
+        "extract_roas_data": lambda: manager._extract_roas_data(manager._extract_metrics(payload)),
+        "extract_cpc_data": lambda: manager._extract_cpc_data(manager._extract_metrics(payload)),
+        "format_all_from_metrics": lambda: (
+            manager._extract_follower_count(metrics),
+            manager._extract_engagement_data(metrics),
+            manager._extract_roas_data(metrics),
+            manager._extract_cpc_data(metrics),
+        ),
+        "generate_competitor_analysis": lambda: manager._generate_competitor_analysis(grouped),
+        "generate_lowes_analysis": lambda: manager._generate_lowes_analysis(grouped),
+        "generate_strategy_analysis": lambda: manager._generate_strategy_analysis(grouped),
+        "generate_campaign_analysis": lambda: manager._generate_campaign_analysis(grouped),
+        "enhanced_pattern_analysis": lambda: loop.run_until_complete(
+            manager._enhanced_pattern_analysis("competitor analysis", report_text)
+        ),
+    }
+
+
+def run(sizes: List[int], min_time: float) -> Dict[str, Dict[str, float]]:
+    """Benchmark every case at every size; returns {"case @ size": stats}."""
+    manager = FocusedCrewManager()
+    loop = asyncio.new_event_loop()
+    by_case: Dict[str, Dict[int, Dict[str, float]]] = {}
+    try:
+        for size in sizes:
+            payload = make_tavily_response(size)
+            for name, fn in build_cases(manager, payload, loop).items():
+                by_case.setdefault(name, {})[size] = measure(fn, min_time)
+    finally:
+        loop.close()
+        manager.search_cache.close()
+    return {f"{name} @ {size}": stats for name, by_size in by_case.items() for size, stats in by_size.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Result counts per payload")
+    parser.add_argument("--min-time", type=float, default=0.3, help="Minimum seconds per case")
+    add_baseline_arguments(parser, DEFAULT_BASELINE, "Allowed ops/sec drop before flagging")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args)
+    if baseline is None:
+        return 2
+    results = run(args.sizes, args.min_time)
+    print_table(results, baseline, "case @ results", [("ops/sec", "ops_per_sec", 12), ("peak KB", "peak_kb", 10)], METRIC)
+    return finish(args, results, baseline, METRIC, higher_is_better=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
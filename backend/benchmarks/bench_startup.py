@@ -0,0 +1,127 @@
+"""Cold-import benchmark for the backend entry points.
+
+Imports each module in a fresh interpreter (so nothing is already cached in
+sys.modules) and reports the median wall time over several runs, plus the slowest
+imports from `python -X importtime` for the first module. Results are compared
+against a stored baseline so startup regressions show up.
+
+Usage (from the backend directory):
+
+    python benchmarks/bench_startup.py                  # run and compare to baseline
+    python benchmarks/bench_startup.py --save-baseline  # record a new baseline
+    python benchmarks/bench_startup.py --modules agents.crew_manager focused_server
+
+Dummy values are used for required environment variables; no connections are made.
+Baselines are machine specific; record one on the machine you compare on.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks._harness import add_baseline_arguments, finish, load_baseline, print_table  # noqa: E402
+
+DEFAULT_MODULES = ["agents.crew_manager", "focused_server", "server"]
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline_startup.json"
+METRIC = "median_ms"
+
+BENCH_ENV = {
+    "MONGO_URL": "mongodb://localhost:27017",
+    "DB_NAME": "bench",
+    "AZURE_API_KEY": "bench",
+    "AZURE_API_VERSION": "2024-02-01",
+    "AZURE_ENDPOINT": "https://bench.openai.azure.com",
+    "SERPAPI_KEY": "bench",
+    "TAVILY_API_KEY": "bench",
+    "PREWARM_ENABLED": "false",
+    "SEARCH_CACHE_PATH": os.path.join(tempfile.gettempdir(), "bench_search_cache.sqlite3"),
+    "TASK_STORE_PATH": os.path.join(tempfile.gettempdir(), "bench_task_store.sqlite3"),
+}
+
+TIMER = "import time, importlib; t = time.perf_counter(); importlib.import_module({module!r}); print(time.perf_counter() - t)"
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    for key, value in BENCH_ENV.items():
+        env.setdefault(key, value)
+    return env
+
+
+def time_import(module: str, runs: int) -> Dict[str, float]:
+    """Median and best cold-import time of one module, in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(module=module)],
+            cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]) * 1000)
+    return {"median_ms": statistics.median(samples), "best_ms": min(samples)}
+
+
+def top_imports(module: str, limit: int) -> List[Tuple[str, float]]:
+    """Slowest imports (cumulative ms) when importing module, from -X importtime."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True,
+    )
+    packages: Dict[str, float] = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.strip()
+        if name == module or module.startswith(f"{name}."):
+            continue
+        # Report per top-level package; a package's cumulative time covers its submodules
+        root = name.split(".")[0]
+        packages[root] = max(packages.get(root, 0.0), int(cumulative) / 1000)
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def run(modules: List[str], runs: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for module in modules:
+        try:
+            results[module] = time_import(module, runs)
+        except subprocess.CalledProcessError as e:
+            print(f"{module}: import failed ({e.stderr.strip().splitlines()[-1] if e.stderr else e})")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list for the first module")
+    add_baseline_arguments(parser, DEFAULT_BASELINE, "Allowed import time increase before flagging")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args)
+    if baseline is None:
+        return 2
+    results = run(args.modules, args.runs)
+    print_table(results, baseline, "module", [("median ms", "median_ms", 10), ("best ms", "best_ms", 10)], METRIC)
+
+    if args.top and results:
+        module = next(iter(results))
+        print(f"\nSlowest imports for {module}:")
+        for name, ms in top_imports(module, args.top):
+            print(f"  {name:<40} {ms:>8.1f} ms")
+
+    return finish(args, results, baseline, METRIC, higher_is_better=False)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
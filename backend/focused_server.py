@@ -1,6 +1,7 @@
 """Focused FastAPI server for 3 AI agents: Competitor Analysis, Lowe's Analysis, Strategy Generation."""
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, Header
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -10,8 +11,15 @@ import logging
 import asyncio
 from datetime import datetime
 import uuid
+import hashlib
+import json
 
 from agents.focused_crew_manager import FocusedCrewManager
+from task_store import TaskStore
+from job_scheduler import AnalysisScheduler, QueueFullError
+from task_events import TaskEvents
+from http_responses import cached_json_response
+from prewarm import PrewarmScheduler, prewarm_enabled
 
 # Load environment variables
 load_dotenv()
@@ -35,9 +43,27 @@ app.add_middleware(
 # Initialize the focused crew manager
 crew_manager = FocusedCrewManager()
 
-# Global storage for results (in production, use a database)
-analysis_results = {}
-active_tasks = {}
+# Bounded task store: in-memory LRU over SQLite, survives restarts
+task_store = TaskStore()
+
+# Fixed worker pool with a priority queue and per-analysis-type concurrency caps
+scheduler = AnalysisScheduler()
+
+# Progress events for the SSE results stream
+task_events = TaskEvents()
+
+# Identical analyses started or finished within this window are shared instead of re-run
+DEDUP_WINDOW_SECONDS = float(os.getenv("ANALYSIS_DEDUP_WINDOW_SECONDS", "300"))
+
+# Pre-warmed analyses stay reusable until the next scheduled refresh lands, for
+# requests that opt in with prefer_cached=true
+PREWARM_ANALYSIS_TYPES = {
+    "competitors": "competitor_analysis",
+    "lowes": "lowes_performance",
+    "campaigns": "campaign_analysis",
+    "strategy": "strategy_generation",
+}
+PREWARM_GRACE_SECONDS = float(os.getenv("PREWARM_GRACE_SECONDS", "300"))
 
 # Pydantic models
 class AnalysisRequest(BaseModel):
@@ -63,301 +89,469 @@ async def get_status():
     return {
         "status": "operational",
         "agents": crew_manager.get_agents_status(),
-        "active_tasks": len(active_tasks),
-        "completed_analyses": len(analysis_results)
+        "active_tasks": task_store.count("running"),
+        "completed_analyses": task_store.count() - task_store.count("running"),
+        "task_store": task_store.stats(),
+        "search_cache": crew_manager.search_cache.stats(),
+        "search_single_flight": crew_manager.search_flight.stats(),
+        "scheduler": scheduler.stats(),
+        "task_events": task_events.stats(),
+        "prewarm": prewarm.stats() if prewarm is not None else None
     }
 
-@app.post("/api/analyze/competitors")
-async def analyze_competitors(background_tasks: BackgroundTasks):
-    """Start competitor analysis using web search."""
-    task_id = str(uuid.uuid4())
-    
-    active_tasks[task_id] = {
-        "type": "competitor_analysis",
-        "status": "running",
-        "started_at": datetime.now().isoformat()
-    }
-    
-    # Run analysis in background
-    background_tasks.add_task(run_competitor_analysis, task_id)
-    
+def analysis_params_key(params: Dict[str, Any]) -> str:
+    """Stable key for the parameters that make two analyses equivalent."""
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+def attach_response(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Response for a request attached to an equivalent running or fresh task."""
+    task_id = record["task_id"]
+    if record["status"] == "running":
+        status = scheduler.state(task_id) or "running"
+        message = "An identical analysis is already in progress; attached to it."
+    else:
+        status = "completed"
+        message = "An identical analysis finished recently; returning it. Use force=true to re-run."
     return {
         "task_id": task_id,
-        "status": "started",
-        "message": "Competitor analysis started. This will take 2-3 minutes.",
-        "estimated_completion": "2-3 minutes"
+        "status": status,
+        "message": message,
+        "deduplicated": True,
+        "started_at": record["started_at"],
+        "queue_position": scheduler.position(task_id),
+        "eta_seconds": scheduler.eta_seconds(task_id)
     }
 
-@app.post("/api/analyze/lowes")
-async def analyze_lowes(background_tasks: BackgroundTasks):
-    """Start Lowe's performance analysis using web search."""
-    task_id = str(uuid.uuid4())
-    
-    active_tasks[task_id] = {
-        "type": "lowes_performance",
-        "status": "running", 
-        "started_at": datetime.now().isoformat()
-    }
-    
-    # Run analysis in background
-    background_tasks.add_task(run_lowes_analysis, task_id)
-    
-    return {
-        "task_id": task_id,
-        "status": "started",
-        "message": "Lowe's performance analysis started. This will take 2-3 minutes.",
-        "estimated_completion": "2-3 minutes"
-    }
+def fresh_window(analysis_type: str, prefer_cached: bool = False) -> float:
+    """How old a completed analysis may be and still be returned instead of re-run.
+
+    Requests get the configured dedup window; only prefer_cached requests accept a
+    pre-warmed result up to one refresh interval old.
+    """
+    if prewarm is None or not prefer_cached:
+        return DEDUP_WINDOW_SECONDS
+    for name, prewarmed_type in PREWARM_ANALYSIS_TYPES.items():
+        if prewarmed_type == analysis_type:
+            return max(DEDUP_WINDOW_SECONDS, prewarm.max_age_seconds(name) + PREWARM_GRACE_SECONDS)
+    return DEDUP_WINDOW_SECONDS
+
+async def enqueue_analysis(
+    analysis_type: str,
+    runner,
+    priority: int,
+    message: str,
+    estimate: str,
+    force: bool = False,
+    params: Optional[Dict[str, Any]] = None,
+    fresh_seconds: Optional[float] = None,
+    prefer_cached: bool = False
+) -> Dict[str, Any]:
+    """Record a task and queue it on the worker pool, unless an equivalent one can be reused."""
+    params_key = analysis_params_key(params or {})
+    if fresh_seconds is None:
+        fresh_seconds = fresh_window(analysis_type, prefer_cached)
+
+    # Lookup and start happen without an await in between, so concurrent requests can't both miss
+    if not force:
+        existing = task_store.find_equivalent(analysis_type, params_key, fresh_seconds)
+        if existing is not None:
+            logger.info(f"Attached {analysis_type} request to task {existing['task_id']}")
+            return attach_response(existing)
 
-@app.post("/api/analyze/strategy")
-async def generate_strategy(background_tasks: BackgroundTasks):
-    """Generate strategy and content recommendations."""
     task_id = str(uuid.uuid4())
-
-    active_tasks[task_id] = {
-        "type": "strategy_generation",
-        "status": "running",
-        "started_at": datetime.now().isoformat()
-    }
-
-    # Run strategy generation in background
-    background_tasks.add_task(run_strategy_generation, task_id)
+    task_store.start(task_id, analysis_type, params_key)
+    try:
+        await scheduler.submit(task_id, analysis_type, lambda: runner(task_id), priority=priority)
+    except QueueFullError as e:
+        task_store.complete(task_id, {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        })
+        raise HTTPException(status_code=429, detail=str(e))
 
     return {
         "task_id": task_id,
-        "status": "started",
-        "message": "Strategy generation started. This will take 1-2 minutes.",
-        "estimated_completion": "1-2 minutes"
+        "status": "queued",
+        "message": message,
+        "deduplicated": False,
+        "estimated_completion": estimate,
+        "queue_position": scheduler.position(task_id),
+        "eta_seconds": scheduler.eta_seconds(task_id)
     }
 
-@app.post("/api/analyze/campaigns")
-async def analyze_campaigns(background_tasks: BackgroundTasks):
-    """Start ad campaign analysis using mock APIs."""
-    task_id = str(uuid.uuid4())
+@app.post("/api/analyze/competitors")
+async def analyze_competitors(priority: int = Query(0, ge=0, le=10), force: bool = False, prefer_cached: bool = False):
+    """Start competitor analysis using web search."""
+    return await enqueue_analysis(
+        "competitor_analysis", run_competitor_analysis, priority,
+        "Competitor analysis started. This will take 2-3 minutes.", "2-3 minutes",
+        force=force, prefer_cached=prefer_cached
+    )
 
-    active_tasks[task_id] = {
-        "type": "campaign_analysis",
-        "status": "running",
-        "started_at": datetime.now().isoformat()
-    }
+@app.post("/api/analyze/lowes")
+async def analyze_lowes(priority: int = Query(0, ge=0, le=10), force: bool = False, prefer_cached: bool = False):
+    """Start Lowe's performance analysis using web search."""
+    return await enqueue_analysis(
+        "lowes_performance", run_lowes_analysis, priority,
+        "Lowe's performance analysis started. This will take 2-3 minutes.", "2-3 minutes",
+        force=force, prefer_cached=prefer_cached
+    )
 
-    # Run analysis in background
-    background_tasks.add_task(run_campaign_analysis, task_id)
+@app.post("/api/analyze/strategy")
+async def generate_strategy(priority: int = Query(0, ge=0, le=10), force: bool = False, prefer_cached: bool = False):
+    """Generate strategy and content recommendations."""
+    return await enqueue_analysis(
+        "strategy_generation", run_strategy_generation, priority,
+        "Strategy generation started. This will take 1-2 minutes.", "1-2 minutes",
+        force=force, prefer_cached=prefer_cached
+    )
 
-    return {
-        "task_id": task_id,
-        "status": "started",
-        "message": "Ad campaign analysis started. This will take 2-3 minutes.",
-        "estimated_completion": "2-3 minutes"
-    }
+@app.post("/api/analyze/campaigns")
+async def analyze_campaigns(priority: int = Query(0, ge=0, le=10), force: bool = False, prefer_cached: bool = False):
+    """Start ad campaign analysis using mock APIs."""
+    return await enqueue_analysis(
+        "campaign_analysis", run_campaign_analysis, priority,
+        "Ad campaign analysis started. This will take 2-3 minutes.", "2-3 minutes",
+        force=force, prefer_cached=prefer_cached
+    )
 
 @app.post("/api/analyze/full")
-async def full_analysis(background_tasks: BackgroundTasks):
-    """Run complete analysis: competitors + Lowe's + strategy."""
-    task_id = str(uuid.uuid4())
+async def full_analysis(priority: int = Query(0, ge=0, le=10), force: bool = False):
+    """Run complete analysis: competitors + Lowe's + campaigns concurrently, then strategy."""
+    return await enqueue_analysis(
+        "full_analysis", run_full_analysis, priority,
+        "Full analysis started. This will take 2-3 minutes.", "2-3 minutes",
+        force=force
+    )
+
+def result_payload(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Response body for a task record, shared by the results endpoint and SSE stream."""
+    task_id = record["task_id"]
     
-    active_tasks[task_id] = {
-        "type": "full_analysis",
-        "status": "running",
-        "started_at": datetime.now().isoformat()
-    }
+    # Check if task is still queued or running
+    if record["status"] == "running":
+        state = scheduler.state(task_id) or "running"
+        payload = {
+            "task_id": task_id,
+            "status": state,
+            "message": "Analysis queued..." if state == "queued" else "Analysis still running...",
+            "started_at": record["started_at"],
+            "queue_position": scheduler.position(task_id),
+            "eta_seconds": scheduler.eta_seconds(task_id)
+        }
+        # Sections finished so far, for analyses that report partial results
+        partial = record["result"]
+        if partial:
+            payload.update(
+                sections=partial["sections"],
+                completed_sections=list(partial["sections"]),
+                pending_sections=partial["pending_sections"]
+            )
+        return payload
     
-    # Run full analysis in background
-    background_tasks.add_task(run_full_analysis, task_id)
+    if record["status"] == "cancelled":
+        return {
+            "task_id": task_id,
+            "status": "cancelled",
+            "cancelled_at": record["completed_at"]
+        }
     
     return {
         "task_id": task_id,
-        "status": "started",
-        "message": "Full analysis started. This will take 5-7 minutes.",
-        "estimated_completion": "5-7 minutes"
+        "status": "completed",
+        "results": record["result"]
     }
 
 @app.get("/api/results/{task_id}")
-async def get_results(task_id: str):
+async def get_results(task_id: str, request: Request):
     """Get analysis results by task ID."""
     
-    # Check if task is still running
-    if task_id in active_tasks:
-        return {
-            "task_id": task_id,
-            "status": active_tasks[task_id]["status"],
-            "message": "Analysis still running...",
-            "started_at": active_tasks[task_id]["started_at"]
-        }
+    record = task_store.get(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     
-    # Check if results are available
-    if task_id in analysis_results:
-        return {
-            "task_id": task_id,
-            "status": "completed",
-            "results": analysis_results[task_id]
-        }
+    return cached_json_response(request, result_payload(record))
+
+def format_sse(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Encode one Server-Sent Event."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+@app.get("/api/results/{task_id}/events")
+async def stream_results(task_id: str, request: Request, last_event_id: Optional[str] = Header(None)):
+    """Stream progress events and the final result for a task (Server-Sent Events)."""
+    
+    record = task_store.get(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    async def event_stream():
+        if record["status"] != "running":
+            yield format_sse("done", result_payload(record))
+            return
+        
+        # Tell the client where it stands before the first progress event
+        yield format_sse("status", result_payload(record))
+        
+        after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+        async for event in task_events.subscribe(task_id, after):
+            if event is not None:
+                yield format_sse(event["event"], event["data"], event["id"])
+                continue
+            
+            # No events for a while: stop if the client left, finish if another worker completed it
+            if await request.is_disconnected():
+                return
+            current = task_store.get(task_id)
+            if current is not None and current["status"] != "running":
+                yield format_sse("done", result_payload(current))
+                return
+            yield ": keep-alive\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.delete("/api/results/{task_id}")
+async def cancel_analysis(task_id: str):
+    """Cancel a queued or running analysis, stopping its in-flight searches."""
+    
+    record = task_store.get(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Task not found")
     
-    raise HTTPException(status_code=404, detail="Task not found")
+    if record["status"] != "running":
+        raise HTTPException(status_code=409, detail=f"Task already {record['status']}")
+    
+    if not await scheduler.cancel(task_id):
+        record = task_store.get(task_id)
+        if record["status"] != "running":
+            raise HTTPException(status_code=409, detail=f"Task already {record['status']}")
+        raise HTTPException(status_code=409, detail="Task is not running in this worker")
+    
+    record = finish_task(task_id, {
+        "status": "cancelled",
+        "timestamp": datetime.now().isoformat()
+    })
+    if record is None:
+        # The analysis stored its own result before the cancellation landed
+        status = task_store.get(task_id)["status"]
+        raise HTTPException(status_code=409, detail=f"Task already {status}")
+    logger.info(f"Cancelled task {task_id}")
+    
+    return {
+        "task_id": task_id,
+        "status": "cancelled"
+    }
 
 @app.get("/api/results/latest/{analysis_type}")
-async def get_latest_results(analysis_type: str):
-    """Get latest results for a specific analysis type."""
+async def get_latest_results(request: Request, analysis_type: str, n: Optional[int] = Query(None, ge=1, le=100)):
+    """Get latest results for a specific analysis type (or the last n with ?n=)."""
     
-    # Find latest result of the specified type
-    latest_result = None
-    latest_time = None
+    if n is not None:
+        records = task_store.latest(analysis_type, n)
+        return cached_json_response(request, {
+            "status": "success" if records else "not_found",
+            "analysis_type": analysis_type,
+            "count": len(records),
+            "results": [record["result"] for record in records]
+        })
     
-    for task_id, result in analysis_results.items():
-        if result.get("analysis_type") == analysis_type:
-            result_time = datetime.fromisoformat(result.get("timestamp", ""))
-            if latest_time is None or result_time > latest_time:
-                latest_time = result_time
-                latest_result = result
+    latest_result = task_store.latest_result(analysis_type)
     
     if latest_result:
-        return {
+        return cached_json_response(request, {
             "status": "success",
             "analysis_type": analysis_type,
             "results": latest_result
-        }
+        })
     
     return {
         "status": "not_found",
         "message": f"No results found for analysis type: {analysis_type}"
     }
 
+@app.on_event("startup")
+async def start_scheduler():
+    await scheduler.start()
+    if prewarm is not None:
+        await prewarm.start()
+
+@app.on_event("shutdown")
+async def shutdown_search_client():
+    if prewarm is not None:
+        await prewarm.stop()
+    # Record queued and running analyses as cancelled; this also ends their SSE streams
+    for task_id in await scheduler.stop():
+        finish_task(task_id, {
+            "status": "cancelled",
+            "error": "Server shutting down",
+            "timestamp": datetime.now().isoformat()
+        })
+    await crew_manager.close()
+    task_store.close()
+
 # Background task functions
-async def run_competitor_analysis(task_id: str):
-    """Background task for competitor analysis."""
+def finish_task(task_id: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Store a task's result and push it to any open event streams; None if it had already finished."""
+    record = task_store.complete(task_id, result)
+    if record is not None:
+        task_events.finish(task_id, result_payload(record))
+    return record
+
+def section_reporter(task_id: str, names):
+    """Section callback that accumulates partial results on the task record."""
+    task_store.expect_sections(task_id, names)
+
+    def _on_section(name: str, content: Any):
+        task_store.add_section(task_id, name, content)
+        task_events.publish(task_id, "section", {"name": name, "content": content})
+
+    return _on_section
+
+def progress_reporter(task_id: str):
+    """Progress callback that publishes steps to the task's event stream."""
+    task_events.progress(task_id, "Started")
+    return lambda message: task_events.progress(task_id, message)
+
+async def run_competitor_analysis(task_id: str, refresh: bool = False):
+    """Background task for competitor analysis (refresh=True bypasses the search cache)."""
     try:
         logger.info(f"Starting competitor analysis for task {task_id}")
-        result = await crew_manager.analyze_competitors()
+        result = await crew_manager.analyze_competitors(
+            progress=progress_reporter(task_id),
+            on_section=section_reporter(task_id, crew_manager.DEFAULT_COMPETITORS),
+            refresh=refresh
+        )
         
         # Store result
-        analysis_results[task_id] = result
-        
-        # Remove from active tasks
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        finish_task(task_id, result)
             
         logger.info(f"Competitor analysis completed for task {task_id}")
         
     except Exception as e:
         logger.error(f"Competitor analysis failed for task {task_id}: {e}")
-        analysis_results[task_id] = {
+        finish_task(task_id, {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        })
 
-async def run_lowes_analysis(task_id: str):
-    """Background task for Lowe's analysis."""
+async def run_lowes_analysis(task_id: str, refresh: bool = False):
+    """Background task for Lowe's analysis (refresh=True bypasses the search cache)."""
     try:
         logger.info(f"Starting Lowe's analysis for task {task_id}")
-        result = await crew_manager.analyze_lowes_performance()
+        result = await crew_manager.analyze_lowes_performance(progress=progress_reporter(task_id), refresh=refresh)
         
         # Store result
-        analysis_results[task_id] = result
-        
-        # Remove from active tasks
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        finish_task(task_id, result)
             
         logger.info(f"Lowe's analysis completed for task {task_id}")
         
     except Exception as e:
         logger.error(f"Lowe's analysis failed for task {task_id}: {e}")
-        analysis_results[task_id] = {
+        finish_task(task_id, {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        })
 
-async def run_strategy_generation(task_id: str):
-    """Background task for strategy generation."""
+async def run_strategy_generation(task_id: str, refresh: bool = False):
+    """Background task for strategy generation (refresh=True bypasses the search cache)."""
     try:
         logger.info(f"Starting strategy generation for task {task_id}")
         
         # Get latest competitor and Lowe's data if available
-        competitor_data = ""
-        lowes_data = ""
-        
-        for result in analysis_results.values():
-            if result.get("analysis_type") == "competitor_analysis":
-                competitor_data = result.get("result", "")
-            elif result.get("analysis_type") == "lowes_performance":
-                lowes_data = result.get("result", "")
+        competitor_result = task_store.latest_result("competitor_analysis") or {}
+        lowes_result = task_store.latest_result("lowes_performance") or {}
+        competitor_data = competitor_result.get("result", "")
+        lowes_data = lowes_result.get("result", "")
         
-        result = await crew_manager.generate_strategy_and_content(competitor_data, lowes_data)
+        result = await crew_manager.generate_strategy_and_content(
+            competitor_data, lowes_data, progress=progress_reporter(task_id), refresh=refresh
+        )
         
         # Store result
-        analysis_results[task_id] = result
-        
-        # Remove from active tasks
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        finish_task(task_id, result)
             
         logger.info(f"Strategy generation completed for task {task_id}")
         
     except Exception as e:
         logger.error(f"Strategy generation failed for task {task_id}: {e}")
-        analysis_results[task_id] = {
+        finish_task(task_id, {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        })
 
-async def run_campaign_analysis(task_id: str):
-    """Background task for ad campaign analysis."""
+async def run_campaign_analysis(task_id: str, refresh: bool = False):
+    """Background task for ad campaign analysis (refresh=True bypasses the search cache)."""
     try:
         logger.info(f"Starting ad campaign analysis for task {task_id}")
-        result = await crew_manager.analyze_ad_campaigns()
+        result = await crew_manager.analyze_ad_campaigns(progress=progress_reporter(task_id), refresh=refresh)
 
         # Store result
-        analysis_results[task_id] = result
-
-        # Remove from active tasks
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        finish_task(task_id, result)
 
         logger.info(f"Ad campaign analysis completed for task {task_id}")
 
     except Exception as e:
         logger.error(f"Ad campaign analysis failed for task {task_id}: {e}")
-        analysis_results[task_id] = {
+        finish_task(task_id, {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        })
 
 async def run_full_analysis(task_id: str):
     """Background task for full analysis."""
     try:
         logger.info(f"Starting full analysis for task {task_id}")
-        result = await crew_manager.execute_full_analysis()
+        result = await crew_manager.execute_full_analysis(
+            progress=progress_reporter(task_id),
+            on_section=section_reporter(task_id, crew_manager.FULL_ANALYSIS_STAGES)
+        )
         
         # Store result
-        analysis_results[task_id] = result
-        
-        # Remove from active tasks
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        finish_task(task_id, result)
             
         logger.info(f"Full analysis completed for task {task_id}")
         
     except Exception as e:
         logger.error(f"Full analysis failed for task {task_id}: {e}")
-        analysis_results[task_id] = {
+        finish_task(task_id, {
             "status": "error",
             "error": str(e),
             "timestamp": datetime.now().isoformat()
-        }
-        if task_id in active_tasks:
-            del active_tasks[task_id]
+        })
+
+# Scheduled pre-warming
+async def prewarm_analysis(name: str):
+    """Refresh one dashboard analysis at low priority and wait for it to finish."""
+    analysis_type = PREWARM_ANALYSIS_TYPES[name]
+    runner = PREWARM_RUNNERS[analysis_type]
+    response = await enqueue_analysis(
+        # Search cache TTLs are longer than the prewarm intervals, so re-fetch the searches
+        analysis_type, lambda task_id: runner(task_id, refresh=True), -1, "Scheduled refresh", "",
+        # Skip the refresh if someone already ran it in the second half of the interval
+        fresh_seconds=prewarm.intervals[name] / 2
+    )
+    await scheduler.wait(response["task_id"])
+
+PREWARM_RUNNERS = {
+    "competitor_analysis": run_competitor_analysis,
+    "lowes_performance": run_lowes_analysis,
+    "campaign_analysis": run_campaign_analysis,
+    "strategy_generation": run_strategy_generation,
+}
+
+prewarm = PrewarmScheduler({
+    name: (lambda name=name: prewarm_analysis(name)) for name in PREWARM_ANALYSIS_TYPES
+}, name="focused_server") if prewarm_enabled() else None
 
 if __name__ == "__main__":
     import uvicorn
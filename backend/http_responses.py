@@ -0,0 +1,92 @@
+"""Fast JSON responses with content-hash ETags and size-gated compression."""
+
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:
+    # Falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    # gzip only
+    brotli = None
+
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+
+
+def _default(value: Any) -> Any:
+    # numpy scalars, ObjectIds and anything else the encoder doesn't know
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_default, separators=(",", ":")).encode()
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    encodings = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.lower()] = quality
+    return encodings
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison: W/"x" and "x" are the same validator
+    candidates = [_opaque_tag(tag) for tag in if_none_match.split(",")]
+    return "*" in candidates or _opaque_tag(etag) in candidates
+
+
+def cached_json_response(request: Request, payload: Any, etag_source: Optional[Any] = None) -> Response:
+    """JSON response with an ETag, 304 on If-None-Match, and gzip/brotli above a size threshold.
+
+    etag_source, when given, is hashed instead of the body, so volatile fields such
+    as a generation timestamp can be left out of the validator.
+    """
+    body = dumps(payload)
+    validator = body if etag_source is None else dumps(etag_source)
+    etag = f'W/"{hashlib.blake2b(validator, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    if len(body) >= COMPRESSION_MIN_BYTES:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        if brotli is not None and accepted.get("br", 0) > 0:
+            body = brotli.compress(body, quality=5)
+            headers["Content-Encoding"] = "br"
+        elif accepted.get("gzip", 0) > 0:
+            body = gzip.compress(body, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,245 @@
+"""Analysis job scheduler: fixed worker pool, priority queue and per-type concurrency caps."""
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+from typing import Dict, Any, Awaitable, Callable, List, Optional
+
+# Typical run times used for ETAs until real durations have been observed
+DEFAULT_DURATIONS = {
+    "competitor_analysis": 150.0,
+    "lowes_performance": 150.0,
+    "campaign_analysis": 150.0,
+    "strategy_generation": 90.0,
+    "full_analysis": 180.0,
+}
+
+
+class QueueFullError(Exception):
+    """Raised when the analysis queue is at capacity."""
+
+
+def parse_type_limits(spec: str) -> Dict[str, int]:
+    """Parse "type=limit,type=limit" into a dict."""
+    limits = {}
+    for item in spec.split(","):
+        if "=" in item:
+            analysis_type, limit = item.split("=", 1)
+            limits[analysis_type.strip()] = int(limit)
+    return limits
+
+
+class Job:
+    """A queued or running analysis."""
+
+    def __init__(self, task_id: str, analysis_type: str, fn: Callable[[], Awaitable[Any]], priority: int, seq: int):
+        self.task_id = task_id
+        self.analysis_type = analysis_type
+        self.fn = fn
+        self.priority = priority
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.task: Optional[asyncio.Future] = None
+        self.cancelled = False
+        self.done = asyncio.Event()
+
+    def sort_key(self):
+        # Higher priority first, then FIFO
+        return (-self.priority, self.seq)
+
+
+class AnalysisScheduler:
+    """Runs analyses on a fixed number of workers.
+
+    Jobs are taken in priority order (FIFO within a priority) as long as their
+    analysis type is under its concurrency cap. Running jobs can be cancelled; the
+    cancellation propagates into in-flight searches.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self.workers = workers or int(os.getenv("ANALYSIS_WORKERS", "4"))
+        self.type_limits = type_limits or parse_type_limits(
+            os.getenv("ANALYSIS_TYPE_LIMITS", "full_analysis=1,competitor_analysis=2,lowes_performance=2,"
+                                              "campaign_analysis=2,strategy_generation=2")
+        )
+        self.max_queue = max_queue or int(os.getenv("ANALYSIS_QUEUE_LIMIT", "100"))
+
+        self._queue: List[Job] = []
+        self._running: Dict[str, Job] = {}
+        self._running_by_type: Dict[str, int] = {}
+        self._durations: Dict[str, float] = dict(DEFAULT_DURATIONS)
+        self._seq = itertools.count()
+        self._cond: Optional[asyncio.Condition] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self.completed = 0
+        self.cancelled = 0
+
+    # Lifecycle -----------------------------------------------------------
+
+    async def start(self):
+        """Spawn the worker pool (call from the app startup hook)."""
+        self._cond = asyncio.Condition()
+        self._worker_tasks = [asyncio.ensure_future(self._worker(index)) for index in range(self.workers)]
+        logging.info(f"Analysis scheduler started with {self.workers} workers")
+
+    async def stop(self) -> List[str]:
+        """Cancel running jobs, drop queued ones and stop the workers.
+
+        Returns the ids of the jobs that were stopped, so the caller can record them.
+        """
+        stopped = [job.task_id for job in self._queue]
+        for job in self._queue:
+            job.done.set()
+        self._queue = []
+        for job in list(self._running.values()):
+            stopped.append(job.task_id)
+            if job.task is not None:
+                job.task.cancel()
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        return stopped
+
+    # Queueing ------------------------------------------------------------
+
+    async def submit(self, task_id: str, analysis_type: str, fn: Callable[[], Awaitable[Any]], priority: int = 0):
+        """Queue an analysis; raises QueueFullError when the queue is at capacity."""
+        async with self._cond:
+            if len(self._queue) >= self.max_queue:
+                raise QueueFullError(f"Analysis queue is full ({self.max_queue} jobs)")
+            self._queue.append(Job(task_id, analysis_type, fn, priority, next(self._seq)))
+            self._queue.sort(key=Job.sort_key)
+            self._cond.notify_all()
+
+    def _next_runnable(self) -> Optional[Job]:
+        for job in self._queue:
+            limit = self.type_limits.get(job.analysis_type)
+            if limit is None or self._running_by_type.get(job.analysis_type, 0) < limit:
+                return job
+        return None
+
+    async def _worker(self, index: int):
+        while True:
+            async with self._cond:
+                job = self._next_runnable()
+                while job is None:
+                    await self._cond.wait()
+                    job = self._next_runnable()
+                self._queue.remove(job)
+                self._running[job.task_id] = job
+                self._running_by_type[job.analysis_type] = self._running_by_type.get(job.analysis_type, 0) + 1
+
+            job.started_at = time.monotonic()
+            job.task = asyncio.ensure_future(job.fn())
+            try:
+                await job.task
+                self.completed += 1
+                self._record_duration(job.analysis_type, time.monotonic() - job.started_at)
+            except asyncio.CancelledError:
+                if not job.cancelled:
+                    # The worker itself is being stopped
+                    raise
+                logging.info(f"Analysis {job.task_id} cancelled while running")
+            except Exception as e:
+                logging.error(f"Analysis {job.task_id} raised in worker {index}: {e}")
+            finally:
+                async with self._cond:
+                    self._running.pop(job.task_id, None)
+                    self._running_by_type[job.analysis_type] -= 1
+                    self._cond.notify_all()
+                job.done.set()
+
+    def _record_duration(self, analysis_type: str, seconds: float):
+        """Exponential moving average of observed run times, for ETAs."""
+        previous = self._durations.get(analysis_type)
+        self._durations[analysis_type] = seconds if previous is None else 0.7 * previous + 0.3 * seconds
+
+    # Cancellation --------------------------------------------------------
+
+    async def cancel(self, task_id: str) -> bool:
+        """Cancel a queued or running job; False if it is unknown or has already finished."""
+        async with self._cond:
+            for job in self._queue:
+                if job.task_id == task_id:
+                    self._queue.remove(job)
+                    self.cancelled += 1
+                    self._cond.notify_all()
+                    job.done.set()
+                    return True
+
+            job = self._running.get(task_id)
+            # A finished job may still be listed while its worker waits to unregister it
+            if job is None or job.task is None or job.task.done():
+                return False
+            job.cancelled = True
+            job.task.cancel()
+
+        self.cancelled += 1
+        # Wait for the cancellation to unwind through in-flight searches
+        await asyncio.gather(job.task, return_exceptions=True)
+        return True
+
+    async def wait(self, task_id: str):
+        """Wait until a queued or running job finishes; returns at once if it is unknown."""
+        job = self._running.get(task_id) or next((job for job in self._queue if job.task_id == task_id), None)
+        if job is not None:
+            await job.done.wait()
+
+    # Introspection -------------------------------------------------------
+
+    def state(self, task_id: str) -> Optional[str]:
+        """"queued", "running" or None if the job is not in this scheduler."""
+        if task_id in self._running:
+            return "running"
+        if any(job.task_id == task_id for job in self._queue):
+            return "queued"
+        return None
+
+    def position(self, task_id: str) -> Optional[int]:
+        """1-based queue position, or None if the job is not queued."""
+        for index, job in enumerate(self._queue):
+            if job.task_id == task_id:
+                return index + 1
+        return None
+
+    def eta_seconds(self, task_id: str) -> Optional[float]:
+        """Estimated seconds until this job completes."""
+        now = time.monotonic()
+        job = self._running.get(task_id)
+        if job is not None:
+            return round(max(0.0, self._durations.get(job.analysis_type, 120.0) - (now - job.started_at)), 1)
+
+        position = self.position(task_id)
+        if position is None:
+            return None
+
+        # Work ahead of this job, spread across the worker pool
+        remaining_running = sum(
+            max(0.0, self._durations.get(running.analysis_type, 120.0) - (now - running.started_at))
+            for running in self._running.values() if running.started_at is not None
+        )
+        queued_ahead = sum(self._durations.get(job.analysis_type, 120.0) for job in self._queue[:position - 1])
+        own = self._durations.get(self._queue[position - 1].analysis_type, 120.0)
+        return round((remaining_running + queued_ahead) / self.workers + own, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running jobs per type and counters."""
+        return {
+            "workers": self.workers,
+            "queued": len(self._queue),
+            "running": len(self._running),
+            "running_by_type": {key: value for key, value in self._running_by_type.items() if value},
+            "type_limits": self.type_limits,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "average_durations": {key: round(value, 1) for key, value in self._durations.items()},
+        }
@@ -0,0 +1,155 @@
+"""Scheduled pre-warming of dashboard analyses so users open against fresh results."""
+
+import asyncio
+import fcntl
+import logging
+import os
+import random
+import tempfile
+import time
+from typing import Dict, Any, Awaitable, Callable, Optional
+
+import schedule
+
+DEFAULT_INTERVAL_MINUTES = {
+    "competitors": 30,
+    "lowes": 30,
+    "campaigns": 60,
+    "strategy": 60,
+    "trends": 60,
+}
+
+
+def prewarm_enabled() -> bool:
+    """Pre-warming calls paid APIs, so it is off unless PREWARM_ENABLED is set."""
+    return os.getenv("PREWARM_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+class PrewarmScheduler:
+    """Refreshes analyses ahead of time on per-type intervals.
+
+    Intervals come from PREWARM_INTERVAL_<TYPE> (minutes) and are jittered by
+    PREWARM_JITTER (a fraction of the interval) so refreshes don't line up. At most
+    PREWARM_MAX_CONCURRENT refreshes run at once, and a type is never refreshed
+    twice concurrently. Jobs run on the `schedule` library, ticked from the event loop.
+
+    Only one process per name pre-warms: the others (e.g. further uvicorn workers)
+    fail to take the file lock in PREWARM_LOCK_DIR and stay idle.
+    """
+
+    def __init__(
+        self,
+        jobs: Dict[str, Callable[[], Awaitable[Any]]],
+        name: str = "prewarm",
+        max_concurrent: Optional[int] = None,
+        jitter: Optional[float] = None,
+    ):
+        self.jobs = jobs
+        self.lock_path = os.path.join(os.getenv("PREWARM_LOCK_DIR", tempfile.gettempdir()), f"{name}.prewarm.lock")
+        self.max_concurrent = max_concurrent or int(os.getenv("PREWARM_MAX_CONCURRENT", "2"))
+        self.jitter = jitter if jitter is not None else float(os.getenv("PREWARM_JITTER", "0.1"))
+        self.warm_on_startup = os.getenv("PREWARM_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+        self.intervals = {
+            name: float(os.getenv(f"PREWARM_INTERVAL_{name.upper()}", DEFAULT_INTERVAL_MINUTES.get(name, 60))) * 60
+            for name in jobs
+        }
+
+        self._schedule = schedule.Scheduler()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self._ticker: Optional[asyncio.Task] = None
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._lock_file = None
+
+    def max_age_seconds(self, name: str) -> Optional[float]:
+        """Longest time between two refreshes of a type (interval plus jitter)."""
+        interval = self.intervals.get(name)
+        return interval * (1 + self.jitter) if interval is not None else None
+
+    def _acquire_leader_lock(self) -> bool:
+        """Take the per-name file lock; False if another process already holds it."""
+        lock_file = open(self.lock_path, "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    @property
+    def leader(self) -> bool:
+        return self._lock_file is not None
+
+    async def start(self):
+        """Register the jobs and start ticking the schedule (call from the app startup hook)."""
+        if not self._acquire_leader_lock():
+            logging.info(f"Pre-warming runs in another worker ({self.lock_path} is locked)")
+            return
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        for name, interval in self.intervals.items():
+            low = max(1, int(interval * (1 - self.jitter)))
+            high = max(low, int(interval * (1 + self.jitter)))
+            self._schedule.every(low).to(high).seconds.do(self.trigger, name)
+        if self.warm_on_startup:
+            for name in self.jobs:
+                # Stagger the initial warm-up so the types don't all start together
+                asyncio.get_event_loop().call_later(random.uniform(0, 30 * self.jitter), self.trigger, name)
+        self._ticker = asyncio.ensure_future(self._tick())
+        logging.info(f"Pre-warming {', '.join(self.jobs)} (max {self.max_concurrent} concurrent)")
+
+    async def _tick(self):
+        while True:
+            self._schedule.run_pending()
+            await asyncio.sleep(1)
+
+    def trigger(self, name: str):
+        """Start a refresh of one type unless one is already pending or running."""
+        if name in self._refreshing:
+            return
+        self._refreshing[name] = asyncio.ensure_future(self._refresh(name))
+
+    async def _refresh(self, name: str):
+        try:
+            async with self._semaphore:
+                started = time.monotonic()
+                try:
+                    await self.jobs[name]()
+                    status = "ok"
+                except Exception as e:
+                    logging.error(f"Pre-warm of {name} failed: {e}")
+                    status = "error"
+                self._last[name] = {
+                    "status": status,
+                    "finished_at": time.time(),
+                    "duration_seconds": round(time.monotonic() - started, 2),
+                }
+        finally:
+            self._refreshing.pop(name, None)
+
+    async def stop(self):
+        """Stop ticking and cancel in-progress refreshes."""
+        self._schedule.clear()
+        pending = [task for task in [self._ticker, *self._refreshing.values()] if task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-type interval, last refresh and whether one is in progress."""
+        now = time.time()
+        if not self.leader:
+            return {"leader": False}
+        return {
+            name: {
+                "interval_minutes": round(self.intervals[name] / 60, 1),
+                "refreshing": name in self._refreshing,
+                "last_status": self._last.get(name, {}).get("status"),
+                "last_duration_seconds": self._last.get(name, {}).get("duration_seconds"),
+                "age_seconds": round(now - self._last[name]["finished_at"], 1) if name in self._last else None,
+            }
+            for name in self.jobs
+        }
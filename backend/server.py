@@ -1,7 +1,8 @@
-from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Request
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
 import os
 import logging
 from pathlib import Path
@@ -11,20 +12,18 @@ import uuid
 from datetime import datetime, timedelta
 import asyncio
 import json
-from serpapi import GoogleSearch
-from openai import AzureOpenAI
-import aiohttp
-from bs4 import BeautifulSoup
-import pandas as pd
+import hashlib
+from openai import AsyncAzureOpenAI
 import numpy as np
-from urllib.parse import urlparse, parse_qs
-import schedule
-import time
-from threading import Thread
 import re
 
 # Import CrewAI agents
-from agents.crew_manager import CrewManager
+from agents.crew_manager import CrewManager, CrewQueueFullError
+from agents.search_cache import SearchCache, make_cache_key
+from agents.single_flight import SingleFlight
+from prewarm import PrewarmScheduler, prewarm_enabled
+from http_responses import cached_json_response
+from write_buffer import WriteBehindBuffer
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -33,16 +32,40 @@ load_dotenv(ROOT_DIR / '.env')
 mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
+# Competitor and trend records are written behind the request in batches
+write_buffer = WriteBehindBuffer(db)
 
 # API Configurations
-azure_client = AzureOpenAI(
+azure_client = AsyncAzureOpenAI(
     api_key=os.environ['AZURE_API_KEY'],
     api_version=os.environ['AZURE_API_VERSION'],
     azure_endpoint=os.environ['AZURE_ENDPOINT']
 )
 
+# Upper bound on concurrent Azure completions across all requests
+llm_semaphore = asyncio.Semaphore(int(os.environ.get('AZURE_MAX_CONCURRENT_COMPLETIONS', '8')))
+
+# Batched snippet analysis: several snippets per completion, split to fit a prompt token budget
+AI_BATCH_ENABLED = os.environ.get('AI_BATCH_ENABLED', 'true').lower() != 'false'
+AI_BATCH_MAX_SNIPPETS = int(os.environ.get('AI_BATCH_MAX_SNIPPETS', '12'))
+AI_BATCH_TOKEN_BUDGET = int(os.environ.get('AI_BATCH_TOKEN_BUDGET', '3000'))
+AI_BATCH_OUTPUT_TOKENS_PER_SNIPPET = int(os.environ.get('AI_BATCH_OUTPUT_TOKENS_PER_SNIPPET', '450'))
+
+# Content analysis cache in Mongo. Bump the prompt version whenever the analysis prompt
+# changes; it is part of the cache key, so old entries stop matching and expire via TTL.
+CONTENT_ANALYSIS_PROMPT_VERSION = os.environ.get('CONTENT_ANALYSIS_PROMPT_VERSION', 'v1')
+AI_ANALYSIS_CACHE_TTL_SECONDS = int(os.environ.get('AI_ANALYSIS_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+ai_analysis_cache_counters = {"hits": 0, "misses": 0, "stored": 0, "errors": 0}
+
 serpapi_key = os.environ['SERPAPI_KEY']
 
+# Persistent search result cache (SQLite-backed, stale-while-revalidate)
+search_cache = SearchCache()
+
+# Coalesce identical in-flight SerpAPI searches and LLM prompts across concurrent requests
+search_flight = SingleFlight()
+llm_flight = SingleFlight()
+
 # Create the main app
 app = FastAPI(title="Lowe's AI Social Media Analytics", version="2.0.0")
 api_router = APIRouter(prefix="/api")
@@ -105,16 +128,9 @@ class CampaignPerformance(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 # Enhanced AI Analysis Functions
-async def analyze_content_with_ai(content: str, context: str = "social media", competitor_name: str = "") -> Dict[str, Any]:
-    """Advanced content analysis using Azure OpenAI"""
-    try:
-        prompt = f"""
-        As a social media marketing expert for home improvement retail, analyze this {context} content from {competitor_name}:
-        
-        Content: {content}
-        
-        Provide detailed analysis in JSON format with:
-        1. content_themes: List of specific themes/topics (max 5)
+CONTENT_ANALYSIS_SYSTEM_PROMPT = "You are a strategic social media marketing consultant with 15+ years experience in home improvement retail marketing. Provide detailed, actionable insights."
+
+CONTENT_ANALYSIS_FIELDS = """1. content_themes: List of specific themes/topics (max 5)
         2. sentiment_score: Float between -1 (negative) and 1 (positive)
         3. engagement_potential: Float between 0 and 1
         4. target_audience: Specific audience type (homeowners, DIY enthusiasts, contractors, etc.)
@@ -125,15 +141,113 @@ async def analyze_content_with_ai(content: str, context: str = "social media", c
         9. key_insights: Strategic insights for Lowe's social media team
         10. competitive_advantage: What gives this content an edge
         11. potential_weaknesses: What could be improved
-        12. call_to_action_effectiveness: Rating 1-10 and why
+        12. call_to_action_effectiveness: Rating 1-10 and why"""
+
+def default_content_analysis() -> Dict[str, Any]:
+    """Neutral content analysis used when the AI call fails"""
+    return {
+        "content_themes": ["general"],
+        "sentiment_score": 0.0,
+        "engagement_potential": 0.5,
+        "target_audience": "general",
+        "content_category": "unknown",
+        "performance_indicators": ["Analysis unavailable"],
+        "marketing_strategy": "Unknown",
+        "improvement_suggestions": ["Analysis unavailable"],
+        "key_insights": ["Analysis unavailable"],
+        "competitive_advantage": "Unknown",
+        "potential_weaknesses": ["Analysis unavailable"],
+        "call_to_action_effectiveness": 5
+    }
+
+async def create_chat_completion(**kwargs):
+    """Async Azure chat completion, bounded by the shared in-flight semaphore"""
+    async with llm_semaphore:
+        return await azure_client.chat.completions.create(**kwargs)
+
+def content_analysis_cache_key(content: str, context: str, competitor_name: str, variant: str = "single") -> str:
+    """Hash of the snippet, its context, competitor, prompt variant and version, and model deployment
+
+    The variant is "single" or "batch": the two paths use different prompts, so their
+    outputs are cached separately.
+    """
+    raw = json.dumps([
+        content,
+        context,
+        competitor_name,
+        variant,
+        CONTENT_ANALYSIS_PROMPT_VERSION,
+        os.environ['AZURE_DEPLOYMENT_NAME']
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def is_cacheable_analysis(analysis: Dict[str, Any]) -> bool:
+    """Only real, well-formed analyses are cached; failure fallbacks are not"""
+    return "content_themes" in analysis and analysis != default_content_analysis()
+
+async def get_cached_analyses(keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Look up cached content analyses by key in one query"""
+    if not keys:
+        return {}
+    try:
+        docs = await db.ai_analysis_cache.find({"_id": {"$in": keys}}).to_list(len(keys))
+        cached = {doc["_id"]: doc["analysis"] for doc in docs}
+    except Exception as e:
+        ai_analysis_cache_counters["errors"] += 1
+        logging.error(f"AI analysis cache lookup error: {e}")
+        return {}
+    ai_analysis_cache_counters["hits"] += len(cached)
+    ai_analysis_cache_counters["misses"] += len(set(keys)) - len(cached)
+    return cached
+
+async def store_cached_analyses(analyses: Dict[str, Dict[str, Any]]):
+    """Upsert content analyses into the cache collection"""
+    operations = [
+        ReplaceOne({"_id": key}, {"_id": key, "analysis": analysis, "created_at": datetime.utcnow()}, upsert=True)
+        for key, analysis in analyses.items() if is_cacheable_analysis(analysis)
+    ]
+    if not operations:
+        return
+    try:
+        await db.ai_analysis_cache.bulk_write(operations, ordered=False)
+        ai_analysis_cache_counters["stored"] += len(operations)
+    except Exception as e:
+        ai_analysis_cache_counters["errors"] += 1
+        logging.error(f"AI analysis cache write error: {e}")
+
+async def analyze_content_with_ai(content: str, context: str = "social media", competitor_name: str = "") -> Dict[str, Any]:
+    """Advanced content analysis using Azure OpenAI, served from the analysis cache when possible"""
+    key = content_analysis_cache_key(content, context, competitor_name)
+    cached = await get_cached_analyses([key])
+    if key in cached:
+        return cached[key]
+
+    async def _analyze_and_cache():
+        analysis = await _analyze_content_with_ai(content, context, competitor_name)
+        await store_cached_analyses({key: analysis})
+        return analysis
+
+    # Identical in-flight prompts share one call
+    return await llm_flight.do(key, _analyze_and_cache)
+
+async def _analyze_content_with_ai(content: str, context: str, competitor_name: str) -> Dict[str, Any]:
+    """Run a single content analysis completion"""
+    try:
+        prompt = f"""
+        As a social media marketing expert for home improvement retail, analyze this {context} content from {competitor_name}:
+        
+        Content: {content}
+        
+        Provide detailed analysis in JSON format with:
+        {CONTENT_ANALYSIS_FIELDS}
         
         Return only valid JSON.
         """
         
-        response = azure_client.chat.completions.create(
+        response = await create_chat_completion(
             model=os.environ['AZURE_DEPLOYMENT_NAME'],
             messages=[
-                {"role": "system", "content": "You are a strategic social media marketing consultant with 15+ years experience in home improvement retail marketing. Provide detailed, actionable insights."},
+                {"role": "system", "content": CONTENT_ANALYSIS_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
@@ -176,20 +290,135 @@ async def analyze_content_with_ai(content: str, context: str = "social media", c
         
     except Exception as e:
         logging.error(f"AI analysis error: {e}")
-        return {
-            "content_themes": ["general"],
-            "sentiment_score": 0.0,
-            "engagement_potential": 0.5,
-            "target_audience": "general",
-            "content_category": "unknown",
-            "performance_indicators": ["Analysis unavailable"],
-            "marketing_strategy": "Unknown",
-            "improvement_suggestions": ["Analysis unavailable"],
-            "key_insights": ["Analysis unavailable"],
-            "competitive_advantage": "Unknown",
-            "potential_weaknesses": ["Analysis unavailable"],
-            "call_to_action_effectiveness": 5
-        }
+        return default_content_analysis()
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) for batch sizing"""
+    return len(text) // 4 + 1
+
+def plan_analysis_batches(contents: List[str]) -> List[List[int]]:
+    """Group snippet indices into batches that fit the snippet count and prompt token budget"""
+    batches, current, current_tokens = [], [], 0
+    for index, content in enumerate(contents):
+        tokens = estimate_tokens(content)
+        if current and (len(current) >= AI_BATCH_MAX_SNIPPETS or current_tokens + tokens > AI_BATCH_TOKEN_BUDGET):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+def parse_batch_analysis(content: str, expected: int) -> Optional[List[Dict[str, Any]]]:
+    """Parse a JSON array of per-snippet analyses; None if it is malformed or incomplete"""
+    content = content.strip()
+    json_match = re.search(r'```(?:json)?\s*(\[.*\])\s*```', content, re.DOTALL)
+    if json_match:
+        content = json_match.group(1)
+    else:
+        start, end = content.find('['), content.rfind(']')
+        if start == -1 or end <= start:
+            return None
+        content = content[start:end + 1]
+
+    try:
+        items = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(items, list):
+        return None
+
+    analyses = {}
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            return None
+        index = item.pop("index", position)
+        if isinstance(index, int) and 0 <= index < expected:
+            analyses[index] = {**default_content_analysis(), **item}
+
+    if len(analyses) != expected:
+        return None
+    return [analyses[index] for index in range(expected)]
+
+async def analyze_contents_batch_with_ai(contents: List[str], context: str = "social media", competitor_name: str = "") -> List[Dict[str, Any]]:
+    """Analyze many snippets with as few completions as the token budget allows"""
+    if not contents:
+        return []
+    if not AI_BATCH_ENABLED:
+        return list(await asyncio.gather(*(
+            analyze_content_with_ai(content, context, competitor_name) for content in contents
+        )))
+
+    # Serve cached snippets first and only send the misses to Azure
+    keys = [content_analysis_cache_key(content, context, competitor_name, "batch") for content in contents]
+    cached = await get_cached_analyses(keys)
+    results: List[Dict[str, Any]] = [cached.get(key) for key in keys]
+    pending = [index for index, analysis in enumerate(results) if analysis is None]
+    if not pending:
+        return results
+
+    pending_contents = [contents[index] for index in pending]
+    batches = plan_analysis_batches(pending_contents)
+    batch_results = await asyncio.gather(*(
+        _analyze_batch_with_ai([pending_contents[index] for index in batch], context, competitor_name)
+        for batch in batches
+    ))
+
+    fresh = {}
+    for batch, analyses in zip(batches, batch_results):
+        for index, analysis in zip(batch, analyses):
+            results[pending[index]] = analysis
+            fresh[keys[pending[index]]] = analysis
+    await store_cached_analyses(fresh)
+    return results
+
+async def _analyze_batch_with_ai(contents: List[str], context: str, competitor_name: str) -> List[Dict[str, Any]]:
+    """Analyze one batch in a single completion, halving it if the response comes back incomplete"""
+    if len(contents) == 1:
+        return [await analyze_content_with_ai(contents[0], context, competitor_name)]
+
+    try:
+        snippets = "\n".join(f"[{index}] {content}" for index, content in enumerate(contents))
+        prompt = f"""
+        As a social media marketing expert for home improvement retail, analyze each of these {len(contents)} {context} content snippets from {competitor_name}:
+        
+        {snippets}
+        
+        For EACH snippet, provide detailed analysis with:
+        0. index: The snippet number shown in brackets
+        {CONTENT_ANALYSIS_FIELDS}
+        
+        Return only a valid JSON array with exactly one object per snippet, in snippet order.
+        """
+
+        response = await create_chat_completion(
+            model=os.environ['AZURE_DEPLOYMENT_NAME'],
+            messages=[
+                {"role": "system", "content": CONTENT_ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=AI_BATCH_OUTPUT_TOKENS_PER_SNIPPET * len(contents) + 200
+        )
+
+        choice = response.choices[0]
+        if choice.finish_reason != "length":
+            analyses = parse_batch_analysis(choice.message.content, len(contents))
+            if analyses is not None:
+                return analyses
+        logging.warning(f"Incomplete batch analysis for {len(contents)} snippets, splitting batch")
+
+    except Exception as e:
+        logging.error(f"Batch AI analysis error: {e}")
+        return [default_content_analysis() for _ in contents]
+
+    middle = len(contents) // 2
+    first, second = await asyncio.gather(
+        _analyze_batch_with_ai(contents[:middle], context, competitor_name),
+        _analyze_batch_with_ai(contents[middle:], context, competitor_name)
+    )
+    return first + second
 
 async def generate_strategic_marketing_recommendations(analysis_data: Dict[str, Any], request: RecommendationRequest) -> Dict[str, Any]:
     """Generate comprehensive marketing strategy recommendations"""
@@ -249,7 +478,7 @@ async def generate_strategic_marketing_recommendations(analysis_data: Dict[str,
         Return only valid JSON.
         """
         
-        response = azure_client.chat.completions.create(
+        response = await create_chat_completion(
             model=os.environ['AZURE_DEPLOYMENT_NAME'],
             messages=[
                 {"role": "system", "content": "You are a senior marketing strategist with expertise in home improvement retail, social media marketing, and competitive analysis. Provide comprehensive, actionable strategic recommendations."},
@@ -309,7 +538,23 @@ async def generate_strategic_marketing_recommendations(analysis_data: Dict[str,
         }
 
 # Enhanced Competitor Monitoring Functions
-async def search_competitor_content(competitor: str, platform: str = "google") -> List[Dict[str, Any]]:
+async def serp_search(family: str, params: Dict[str, Any], refresh: bool = False) -> Dict[str, Any]:
+    """SerpAPI Google search served through the persistent search cache (refresh=True bypasses it)."""
+    cache_params = {key: params.get(key) for key in ("engine", "num", "gl", "hl")}
+
+    async def _search():
+        from serpapi import GoogleSearch  # deferred: only needed once a search misses the cache
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: GoogleSearch(params).get_dict())
+
+    async def _fetch():
+        key = make_cache_key(family, params["q"], cache_params)
+        return await search_flight.do(key, _search)
+
+    return await search_cache.get_or_fetch(family, params["q"], cache_params, _fetch, refresh=refresh)
+
+async def search_competitor_content(competitor: str, platform: str = "google", refresh: bool = False) -> List[Dict[str, Any]]:
     """Enhanced competitor social media content search"""
     try:
         search_queries = [
@@ -331,8 +576,7 @@ async def search_competitor_content(competitor: str, platform: str = "google") -
                 "hl": "en"
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = await serp_search("serp_competitor", params, refresh)
             
             if "organic_results" in results:
                 for result in results["organic_results"][:3]:  # Top 3 per query
@@ -352,7 +596,7 @@ async def search_competitor_content(competitor: str, platform: str = "google") -
         logging.error(f"Competitor search error for {competitor}: {e}")
         return []
 
-async def monitor_home_improvement_trends() -> List[Dict[str, Any]]:
+async def monitor_home_improvement_trends(refresh: bool = False) -> List[Dict[str, Any]]:
     """Enhanced trend monitoring for home improvement industry"""
     try:
         trend_queries = [
@@ -378,8 +622,7 @@ async def monitor_home_improvement_trends() -> List[Dict[str, Any]]:
                 "hl": "en"
             }
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = await serp_search("serp_trends", params, refresh)
             
             if "organic_results" in results:
                 for result in results["organic_results"]:
@@ -418,6 +661,8 @@ class AgentTaskRequest(BaseModel):
     agent_type: str
     task_description: str
     parameters: Optional[Dict] = None
+    # Oldest cached result (seconds) to accept instead of re-running the crew; 0 forces a run
+    max_age: Optional[float] = Field(None, ge=0)
 
 @api_router.post("/agents/execute")
 async def execute_agent_task(request: AgentTaskRequest):
@@ -430,14 +675,33 @@ async def execute_agent_task(request: AgentTaskRequest):
                 detail=f"Invalid agent type. Must be one of: {valid_agents}"
             )
 
-        task_id = crew_manager.start_agent_task(request.agent_type, request.task_description, request.parameters)
+        task_id = crew_manager.start_agent_task(
+            request.agent_type, request.task_description, request.parameters, request.max_age
+        )
+        task = crew_manager.get_task_result(task_id)
+        if task.get("cached"):
+            return {
+                "status": "success",
+                "task_id": task_id,
+                "agent_type": request.agent_type,
+                "task_status": task["status"],
+                "cached": True,
+                "cache_age_seconds": task["cache_age_seconds"],
+                "task_result": task
+            }
 
         return {
             "status": "success",
             "task_id": task_id,
             "agent_type": request.agent_type,
-            "message": f"Agent task started successfully"
+            "task_status": task["status"],
+            "cached": False,
+            "message": f"Agent task queued; poll /api/agents/task/{task_id} for the result"
         }
+    except HTTPException:
+        raise
+    except CrewQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logging.error(f"Error executing agent task: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -469,8 +733,11 @@ async def execute_full_workflow():
         return {
             "status": "success",
             "workflow_id": workflow_id,
-            "message": "Full workflow execution started"
+            "task_status": crew_manager.get_task_result(workflow_id)["status"],
+            "message": f"Full workflow execution queued; poll /api/agents/task/{workflow_id} for the result"
         }
+    except CrewQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logging.error(f"Error executing full workflow: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -536,35 +803,35 @@ async def analyze_competitors_enhanced(request: CompetitorAnalysisRequest, backg
             marketing_strategies = []
             improvement_suggestions = []
             
-            for content in content_data:
-                if content.get("snippet"):
-                    # Enhanced AI analysis
-                    ai_analysis = await analyze_content_with_ai(
-                        content["snippet"], 
-                        "competitor social media",
-                        competitor
-                    )
-                    
-                    content_analysis = {
-                        "title": content.get("title", ""),
-                        "content": content.get("snippet", ""),
-                        "themes": ai_analysis.get("content_themes", []),
-                        "sentiment": ai_analysis.get("sentiment_score", 0.0),
-                        "engagement_potential": ai_analysis.get("engagement_potential", 0.5),
-                        "category": ai_analysis.get("content_category", "unknown"),
-                        "performance_indicators": ai_analysis.get("performance_indicators", []),
-                        "marketing_strategy": ai_analysis.get("marketing_strategy", "Unknown"),
-                        "improvement_suggestions": ai_analysis.get("improvement_suggestions", []),
-                        "competitive_advantage": ai_analysis.get("competitive_advantage", "Unknown"),
-                        "call_to_action_effectiveness": ai_analysis.get("call_to_action_effectiveness", 5)
-                    }
-                    
-                    competitor_analysis["content_analysis"].append(content_analysis)
-                    sentiments.append(ai_analysis.get("sentiment_score", 0.0))
-                    all_themes.extend(ai_analysis.get("content_themes", []))
-                    performance_indicators.extend(ai_analysis.get("performance_indicators", []))
-                    marketing_strategies.append(ai_analysis.get("marketing_strategy", "Unknown"))
-                    improvement_suggestions.extend(ai_analysis.get("improvement_suggestions", []))
+            # Enhanced AI analysis of all snippets, batched into as few completions as possible
+            snippets = [content for content in content_data if content.get("snippet")]
+            ai_analyses = await analyze_contents_batch_with_ai(
+                [content["snippet"] for content in snippets],
+                "competitor social media",
+                competitor
+            )
+            
+            for content, ai_analysis in zip(snippets, ai_analyses):
+                content_analysis = {
+                    "title": content.get("title", ""),
+                    "content": content.get("snippet", ""),
+                    "themes": ai_analysis.get("content_themes", []),
+                    "sentiment": ai_analysis.get("sentiment_score", 0.0),
+                    "engagement_potential": ai_analysis.get("engagement_potential", 0.5),
+                    "category": ai_analysis.get("content_category", "unknown"),
+                    "performance_indicators": ai_analysis.get("performance_indicators", []),
+                    "marketing_strategy": ai_analysis.get("marketing_strategy", "Unknown"),
+                    "improvement_suggestions": ai_analysis.get("improvement_suggestions", []),
+                    "competitive_advantage": ai_analysis.get("competitive_advantage", "Unknown"),
+                    "call_to_action_effectiveness": ai_analysis.get("call_to_action_effectiveness", 5)
+                }
+                
+                competitor_analysis["content_analysis"].append(content_analysis)
+                sentiments.append(ai_analysis.get("sentiment_score", 0.0))
+                all_themes.extend(ai_analysis.get("content_themes", []))
+                performance_indicators.extend(ai_analysis.get("performance_indicators", []))
+                marketing_strategies.append(ai_analysis.get("marketing_strategy", "Unknown"))
+                improvement_suggestions.extend(ai_analysis.get("improvement_suggestions", []))
             
             # Calculate comprehensive metrics
             if sentiments:
@@ -584,6 +851,8 @@ async def analyze_competitors_enhanced(request: CompetitorAnalysisRequest, backg
             
             # Find top themes
             if all_themes:
+                import pandas as pd  # deferred: pandas is slow to import and only used here
+
                 theme_counts = pd.Series(all_themes).value_counts()
                 competitor_analysis["top_themes"] = theme_counts.head(5).to_dict()
             
@@ -612,7 +881,7 @@ async def analyze_competitors_enhanced(request: CompetitorAnalysisRequest, backg
                 key_insights=competitor_analysis["key_marketing_insights"]
             )
             
-            await db.competitor_data.insert_one(competitor_record.dict())
+            write_buffer.add("competitor_data", competitor_record.dict())
         
         return {
             "status": "success",
@@ -636,36 +905,35 @@ async def get_current_trends_enhanced():
         
         enhanced_trends = []
         
-        for trend in trends_data:
-            if trend.get("description"):
-                # AI analysis for trends
-                ai_analysis = await analyze_content_with_ai(
-                    trend["description"], 
-                    "trend analysis",
-                    "market trend"
-                )
-                
-                # Enhanced trend data
-                enhanced_trend = {
-                    **trend,
-                    "ai_insights": ai_analysis.get("key_insights", []),
-                    "lowes_relevance": np.random.uniform(0.7, 1.0),
-                    "opportunity_score": np.random.uniform(0.6, 0.95),
-                    "recommended_actions": [
-                        "Create content around this trend",
-                        "Develop targeted campaigns",
-                        "Monitor competitor response"
-                    ],
-                    "target_audience_fit": ai_analysis.get("target_audience", "general"),
-                    "content_suggestions": ai_analysis.get("improvement_suggestions", []),
-                    "seasonal_relevance": "High" if any(word in trend.get("topic", "").lower() 
-                                                     for word in ["winter", "spring", "summer", "fall", "holiday", "season"]) else "Medium"
-                }
-                enhanced_trends.append(enhanced_trend)
+        # AI analysis for all trends concurrently
+        described_trends = [trend for trend in trends_data if trend.get("description")]
+        ai_analyses = await asyncio.gather(*(
+            analyze_content_with_ai(trend["description"], "trend analysis", "market trend")
+            for trend in described_trends
+        ))
+        
+        for trend, ai_analysis in zip(described_trends, ai_analyses):
+            # Enhanced trend data
+            enhanced_trend = {
+                **trend,
+                "ai_insights": ai_analysis.get("key_insights", []),
+                "lowes_relevance": np.random.uniform(0.7, 1.0),
+                "opportunity_score": np.random.uniform(0.6, 0.95),
+                "recommended_actions": [
+                    "Create content around this trend",
+                    "Develop targeted campaigns",
+                    "Monitor competitor response"
+                ],
+                "target_audience_fit": ai_analysis.get("target_audience", "general"),
+                "content_suggestions": ai_analysis.get("improvement_suggestions", []),
+                "seasonal_relevance": "High" if any(word in trend.get("topic", "").lower() 
+                                                 for word in ["winter", "spring", "summer", "fall", "holiday", "season"]) else "Medium"
+            }
+            enhanced_trends.append(enhanced_trend)
         
         # Store enhanced trends in database
-        for trend in enhanced_trends:
-            trend_record = TrendData(
+        write_buffer.add_many("trend_data", [
+            TrendData(
                 trend_topic=trend.get("topic", ""),
                 trend_score=trend.get("relevance_score", 0.5),
                 related_keywords=[trend.get("description", "")[:100]],
@@ -673,8 +941,9 @@ async def get_current_trends_enhanced():
                 lowes_relevance=trend.get("lowes_relevance", 0.5),
                 opportunity_score=trend.get("opportunity_score", 0.5),
                 recommended_actions=trend.get("recommended_actions", [])
-            )
-            await db.trend_data.insert_one(trend_record.dict())
+            ).dict()
+            for trend in enhanced_trends
+        ])
         
         return {
             "status": "success",
@@ -692,7 +961,8 @@ async def get_current_trends_enhanced():
 async def generate_strategic_recommendations_enhanced(request: RecommendationRequest):
     """Generate comprehensive marketing strategy recommendations"""
     try:
-        # Get recent comprehensive data
+        # Get recent comprehensive data, including records still in the write buffer
+        await write_buffer.flush("competitor_data", "trend_data")
         recent_competitors = await db.competitor_data.find().sort("created_at", -1).limit(20).to_list(20)
         recent_trends = await db.trend_data.find().sort("date_identified", -1).limit(15).to_list(15)
         
@@ -753,10 +1023,11 @@ async def generate_strategic_recommendations_enhanced(request: RecommendationReq
         raise HTTPException(status_code=500, detail=f"Recommendation generation failed: {str(e)}")
 
 @api_router.get("/dashboard/overview")
-async def get_dashboard_overview_enhanced():
+async def get_dashboard_overview_enhanced(request: Request):
     """Enhanced dashboard with comprehensive marketing insights"""
     try:
-        # Get comprehensive data counts
+        # Get comprehensive data counts, including records still in the write buffer
+        await write_buffer.flush("competitor_data", "trend_data")
         competitor_count = await db.competitor_data.count_documents({})
         trends_count = await db.trend_data.count_documents({})
         reports_count = await db.analysis_reports.count_documents({})
@@ -794,7 +1065,7 @@ async def get_dashboard_overview_enhanced():
             if trend.get("opportunity_score", 0) > 0.8
         ]
         
-        return {
+        overview = {
             "status": "success",
             "overview": {
                 "total_competitor_posts": competitor_count,
@@ -833,6 +1104,10 @@ async def get_dashboard_overview_enhanced():
             }
         }
         
+        # last_updated changes on every call; leave it out of the ETag
+        unchanged = {**overview, "overview": {k: v for k, v in overview["overview"].items() if k != "last_updated"}}
+        return cached_json_response(request, overview, etag_source=unchanged)
+        
     except Exception as e:
         logging.error(f"Enhanced dashboard overview error: {e}")
         raise HTTPException(status_code=500, detail=f"Dashboard data retrieval failed: {str(e)}")
@@ -842,6 +1117,7 @@ async def get_marketing_performance_analysis():
     """Detailed marketing performance analysis endpoint"""
     try:
         # Get all competitor data for comprehensive analysis
+        await write_buffer.flush("competitor_data")
         all_competitors = await db.competitor_data.find().sort("created_at", -1).limit(50).to_list(50)
         
         # Performance analysis
@@ -893,12 +1169,12 @@ async def get_marketing_performance_analysis():
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.get("/reports/all")
-async def get_all_reports_enhanced():
+async def get_all_reports_enhanced(request: Request):
     """Get all comprehensive analysis reports"""
     try:
         reports = await db.analysis_reports.find().sort("created_at", -1).to_list(50)
         
-        return {
+        return cached_json_response(request, {
             "status": "success",
             "reports": [
                 {
@@ -915,12 +1191,53 @@ async def get_all_reports_enhanced():
                 "reports_generated": len(reports),
                 "latest_report_date": reports[0]["created_at"].isoformat() if reports else None
             }
-        }
+        })
         
     except Exception as e:
         logging.error(f"Enhanced reports retrieval error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@api_router.get("/cache/stats")
+async def get_cache_stats():
+    """Search cache, analysis cache and single-flight counters for tuning."""
+    return {
+        "status": "success",
+        "search_cache": search_cache.stats(),
+        "ai_analysis_cache": ai_analysis_cache_counters,
+        "single_flight": {
+            "search": search_flight.stats(),
+            "llm": llm_flight.stats()
+        },
+        "agent_results": crew_manager.result_cache.stats(),
+        "write_buffer": write_buffer.stats(),
+        "prewarm": prewarm.stats() if prewarm is not None else None,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+# Scheduled pre-warming: refresh the search and AI analysis caches behind the
+# trends and competitor endpoints so dashboard requests never start cold. Searches
+# bypass the cache, since its TTLs are longer than the prewarm intervals.
+async def prewarm_trends():
+    trends_data = await monitor_home_improvement_trends(refresh=True)
+    await asyncio.gather(*(
+        analyze_content_with_ai(trend["description"], "trend analysis", "market trend")
+        for trend in trends_data if trend.get("description")
+    ))
+
+async def prewarm_competitors():
+    for competitor in CompetitorAnalysisRequest().competitors:
+        content_data = await search_competitor_content(competitor, refresh=True)
+        await analyze_contents_batch_with_ai(
+            [content["snippet"] for content in content_data if content.get("snippet")],
+            "competitor social media",
+            competitor
+        )
+
+prewarm = PrewarmScheduler({
+    "trends": prewarm_trends,
+    "competitors": prewarm_competitors,
+}, name="server") if prewarm_enabled() else None
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -939,9 +1256,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_cache_indexes():
+    try:
+        await db.ai_analysis_cache.create_index("created_at", expireAfterSeconds=AI_ANALYSIS_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logging.error(f"Could not create AI analysis cache TTL index: {e}")
+
+@app.on_event("startup")
+async def start_write_buffer():
+    await write_buffer.start()
+
+@app.on_event("startup")
+async def start_prewarm():
+    if prewarm is not None:
+        await prewarm.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if prewarm is not None:
+        await prewarm.stop()
+    crew_manager.shutdown()
+    await write_buffer.stop()
     client.close()
+    search_cache.close()
+    await azure_client.close()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,106 @@
+"""Per-task progress event log with live subscribers, for the SSE results stream."""
+
+import asyncio
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Optional, Set
+
+TERMINAL_EVENTS = {"done"}
+
+
+class TaskEventLog:
+    """Events of one task plus the queues of clients currently listening."""
+
+    def __init__(self, max_events: int):
+        self.events: deque = deque(maxlen=max_events)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.next_id = 1
+        self.finished = False
+
+
+class TaskEvents:
+    """Publishes task progress to SSE subscribers.
+
+    Each task keeps a short replayable history so a client that connects late (or
+    reconnects with Last-Event-ID) still sees earlier events. Logs are kept for the
+    most recent tasks only.
+    """
+
+    def __init__(self, max_tasks: int = 256, max_events: int = 200):
+        self.max_tasks = max_tasks
+        self.max_events = max_events
+        self._logs: "OrderedDict[str, TaskEventLog]" = OrderedDict()
+
+    def _log(self, task_id: str) -> TaskEventLog:
+        log = self._logs.get(task_id)
+        if log is None:
+            log = self._logs[task_id] = TaskEventLog(self.max_events)
+            while len(self._logs) > self.max_tasks:
+                self._logs.popitem(last=False)
+        return log
+
+    def publish(self, task_id: str, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Record an event and push it to every live subscriber."""
+        log = self._log(task_id)
+        record = {
+            "id": log.next_id,
+            "event": event,
+            "data": {**data, "timestamp": datetime.now().isoformat()},
+        }
+        log.next_id += 1
+        log.events.append(record)
+        if event in TERMINAL_EVENTS:
+            log.finished = True
+        for queue in log.subscribers:
+            queue.put_nowait(record)
+        return record
+
+    def progress(self, task_id: str, message: str, **data: Any):
+        """Publish a human-readable progress step."""
+        self.publish(task_id, "progress", {"message": message, **data})
+
+    def finish(self, task_id: str, payload: Dict[str, Any]):
+        """Publish the final result; subscribers stop after this event."""
+        self.publish(task_id, "done", payload)
+
+    async def subscribe(
+        self, task_id: str, last_event_id: int = 0, heartbeat: float = 15.0
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Replay events after last_event_id, then yield live ones until the task is done.
+
+        Yields None every `heartbeat` seconds without events so the caller can send a
+        keep-alive and check whether the client is still connected.
+        """
+        log = self._log(task_id)
+        queue: asyncio.Queue = asyncio.Queue()
+        # Register before replaying so nothing published in between is lost
+        log.subscribers.add(queue)
+        seen = last_event_id
+        try:
+            for record in list(log.events):
+                if record["id"] > seen:
+                    seen = record["id"]
+                    yield record
+                    if record["event"] in TERMINAL_EVENTS:
+                        return
+            while True:
+                try:
+                    record = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if record["id"] <= seen:
+                    continue
+                seen = record["id"]
+                yield record
+                if record["event"] in TERMINAL_EVENTS:
+                    return
+        finally:
+            log.subscribers.discard(queue)
+
+    def stats(self) -> Dict[str, Any]:
+        """Tracked tasks and open streams."""
+        return {
+            "tracked_tasks": len(self._logs),
+            "subscribers": sum(len(log.subscribers) for log in self._logs.values()),
+        }
@@ -0,0 +1,341 @@
+"""Bounded, persistent store for analysis task records."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+DEFAULT_STORE_PATH = Path(__file__).resolve().parent / "task_store.sqlite3"
+
+
+class TaskStore:
+    """Task records in an in-memory LRU tier backed by SQLite.
+
+    Every record is written through to SQLite, so results survive restarts and are
+    visible to other workers sharing the file. The memory tier only holds finished
+    records and is capped by entry count and approximate serialized size. Records
+    older than the TTL are purged from disk.
+
+    Each store instance has a boot id and heartbeats the running tasks it owns every
+    TASK_STORE_HEARTBEAT_INTERVAL seconds. Running tasks whose heartbeat is older than
+    TASK_STORE_HEARTBEAT_STALE seconds belonged to a worker that has gone away (PIDs
+    are reused across container restarts, so they are not checked) and are marked failed.
+
+    "Latest N of a type" lookups read task ids from SQLite through the
+    (analysis_type, status, completed_at) index, so they see results completed by any
+    worker without scanning history; the records themselves come from the memory tier.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_days: Optional[float] = None,
+    ):
+        self.path = str(path or os.getenv("TASK_STORE_PATH", DEFAULT_STORE_PATH))
+        self.max_entries = max_entries or int(os.getenv("TASK_STORE_MEMORY_ENTRIES", "256"))
+        self.max_bytes = max_bytes or int(os.getenv("TASK_STORE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+        self.ttl = timedelta(days=ttl_days or float(os.getenv("TASK_STORE_TTL_DAYS", "30")))
+        self.purge_interval = float(os.getenv("TASK_STORE_PURGE_INTERVAL", "600"))
+        self.heartbeat_interval = float(os.getenv("TASK_STORE_HEARTBEAT_INTERVAL", "30"))
+        self.heartbeat_stale = float(os.getenv("TASK_STORE_HEARTBEAT_STALE", str(self.heartbeat_interval * 4)))
+        self.max_runtime = float(os.getenv("TASK_STORE_MAX_RUNTIME_SECONDS", "3600"))
+        self.boot_id = uuid.uuid4().hex
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self._last_purge = 0.0
+
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "task_id TEXT PRIMARY KEY, analysis_type TEXT NOT NULL, status TEXT NOT NULL, "
+            "started_at TEXT NOT NULL, completed_at TEXT, result TEXT, owner_pid INTEGER, params_key TEXT)"
+        )
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(tasks)")]
+        if "params_key" not in columns:
+            self._db.execute("ALTER TABLE tasks ADD COLUMN params_key TEXT")
+        if "owner_boot" not in columns:
+            self._db.execute("ALTER TABLE tasks ADD COLUMN owner_boot TEXT")
+        if "heartbeat_at" not in columns:
+            self._db.execute("ALTER TABLE tasks ADD COLUMN heartbeat_at REAL")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS tasks_type_completed ON tasks (analysis_type, status, completed_at)"
+        )
+        self._db.commit()
+        self._fail_orphaned_tasks()
+        self.purge_expired()
+
+        self._stopped = threading.Event()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="task-store-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+
+    # Liveness ------------------------------------------------------------
+
+    def _heartbeat_loop(self):
+        while not self._stopped.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+                self._fail_orphaned_tasks()
+            except sqlite3.Error as e:
+                logging.error(f"Task store heartbeat failed: {e}")
+
+    def heartbeat(self):
+        """Mark this instance's running tasks as alive."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE tasks SET heartbeat_at = ? WHERE owner_boot = ? AND status = 'running'",
+                (time.time(), self.boot_id),
+            )
+            self._db.commit()
+
+    def _fail_orphaned_tasks(self) -> int:
+        """Mark running tasks of other instances whose heartbeat has gone stale as failed."""
+        error = json.dumps({"status": "error", "error": "Interrupted by server restart"})
+        with self._lock:
+            orphaned = self._db.execute(
+                "UPDATE tasks SET status = 'failed', completed_at = ?, result = ? "
+                "WHERE status = 'running' AND (owner_boot IS NULL OR owner_boot != ?) "
+                "AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                (datetime.now().isoformat(), error, self.boot_id, time.time() - self.heartbeat_stale),
+            ).rowcount
+            self._db.commit()
+        if orphaned:
+            logging.warning(f"Marked {orphaned} interrupted tasks as failed")
+        return orphaned
+
+    # Writes --------------------------------------------------------------
+
+    def start(self, task_id: str, analysis_type: str, params_key: str = "") -> Dict[str, Any]:
+        """Record a newly started task; params_key identifies equivalent runs."""
+        record = {
+            "task_id": task_id,
+            "analysis_type": analysis_type,
+            "status": "running",
+            "started_at": datetime.now().isoformat(),
+            "completed_at": None,
+            "result": None,
+            "params_key": params_key,
+        }
+        self._write(record)
+        return record
+
+    def complete(self, task_id: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Store a task's final result; error results mark the task failed, cancelled ones cancelled.
+
+        Only a running task is updated, so a late cancellation cannot overwrite a result
+        that has already been stored. Returns None if the task is unknown or already finished.
+        """
+        with self._lock:
+            record = self.get(task_id)
+            if record is None or record["status"] != "running":
+                return None
+            record = {
+                **record,
+                "status": {"error": "failed", "cancelled": "cancelled"}.get(result.get("status"), "completed"),
+                "completed_at": result.get("timestamp") or datetime.now().isoformat(),
+                "result": result,
+            }
+            updated = self._db.execute(
+                "UPDATE tasks SET status = ?, completed_at = ?, result = ? WHERE task_id = ? AND status = 'running'",
+                (record["status"], record["completed_at"], json.dumps(result, default=str), task_id),
+            ).rowcount
+            self._db.commit()
+            if not updated:
+                return None
+            self._remember(record)
+        self._maybe_purge()
+        return record
+
+    def expect_sections(self, task_id: str, names: List[str]) -> Optional[Dict[str, Any]]:
+        """Declare the sections a running task will fill in as it progresses."""
+        with self._lock:
+            record = self.get(task_id)
+            if record is None or record["status"] != "running":
+                return None
+            record = {**record, "result": {"sections": {}, "pending_sections": list(names)}}
+            self._write(record)
+        return record
+
+    def add_section(self, task_id: str, name: str, content: Any) -> Optional[Dict[str, Any]]:
+        """Store one finished section of a running task's partial result."""
+        with self._lock:
+            record = self.get(task_id)
+            if record is None or record["status"] != "running":
+                return None
+            partial = record["result"] or {"sections": {}, "pending_sections": []}
+            sections = {**partial["sections"], name: content}
+            pending = [section for section in partial["pending_sections"] if section != name]
+            record = {**record, "result": {"sections": sections, "pending_sections": pending}}
+            self._write(record)
+        return record
+
+    def _write(self, record: Dict[str, Any]):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO tasks "
+                "(task_id, analysis_type, status, started_at, completed_at, result, owner_pid, params_key, "
+                "owner_boot, heartbeat_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record["task_id"],
+                    record["analysis_type"],
+                    record["status"],
+                    record["started_at"],
+                    record["completed_at"],
+                    json.dumps(record["result"], default=str) if record["result"] is not None else None,
+                    os.getpid(),
+                    record.get("params_key", ""),
+                    self.boot_id,
+                    time.time(),
+                ),
+            )
+            self._db.commit()
+
+    # Memory tier ---------------------------------------------------------
+
+    def _remember(self, record: Dict[str, Any]):
+        """Cache a finished record, evicting least recently used ones past the caps."""
+        if record["status"] == "running":
+            return
+        task_id = record["task_id"]
+        size = len(json.dumps(record, default=str))
+        with self._lock:
+            self._forget(task_id)
+            if size > self.max_bytes:
+                return
+            self._memory[task_id] = record
+            self._sizes[task_id] = size
+            self._memory_bytes += size
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+                oldest = next(iter(self._memory))
+                self._forget(oldest)
+
+    def _forget(self, task_id: str):
+        if task_id in self._memory:
+            del self._memory[task_id]
+            self._memory_bytes -= self._sizes.pop(task_id)
+
+    # Reads ---------------------------------------------------------------
+
+    @staticmethod
+    def _row_to_record(row) -> Dict[str, Any]:
+        return {
+            "task_id": row[0],
+            "analysis_type": row[1],
+            "status": row[2],
+            "started_at": row[3],
+            "completed_at": row[4],
+            "result": json.loads(row[5]) if row[5] else None,
+            "params_key": row[6] or "",
+        }
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a task by id (memory first, then disk)."""
+        with self._lock:
+            record = self._memory.get(task_id)
+            if record is not None:
+                self._memory.move_to_end(task_id)
+                return record
+            row = self._db.execute(
+                "SELECT task_id, analysis_type, status, started_at, completed_at, result, params_key FROM tasks WHERE task_id = ?",
+                (task_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        record = self._row_to_record(row)
+        self._remember(record)
+        return record
+
+    def latest(self, analysis_type: str, n: int = 1) -> List[Dict[str, Any]]:
+        """Last n successful records of an analysis type, newest first, across all workers."""
+        with self._lock:
+            task_ids = [
+                row[0] for row in self._db.execute(
+                    "SELECT task_id FROM tasks WHERE analysis_type = ? AND status = 'completed' "
+                    "ORDER BY completed_at DESC LIMIT ?",
+                    (analysis_type, n),
+                )
+            ]
+        records = [self.get(task_id) for task_id in task_ids]
+        return [record for record in records if record is not None]
+
+    def find_equivalent(self, analysis_type: str, params_key: str, fresh_seconds: float) -> Optional[Dict[str, Any]]:
+        """A live running task, or one completed within fresh_seconds, with the same type and parameters.
+
+        Running tasks only match while their owner still heartbeats them and for at most
+        TASK_STORE_MAX_RUNTIME_SECONDS after they started, so a stuck task is not reused.
+        """
+        now = datetime.now()
+        fresh_since = (now - timedelta(seconds=fresh_seconds)).isoformat()
+        running_since = (now - timedelta(seconds=self.max_runtime)).isoformat()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT task_id FROM tasks WHERE analysis_type = ? AND params_key = ? "
+                "AND ((status = 'running' AND started_at >= ? AND heartbeat_at >= ?) "
+                "OR (status = 'completed' AND completed_at >= ?)) "
+                "ORDER BY status = 'running' DESC, started_at DESC LIMIT 1",
+                (analysis_type, params_key, running_since, time.time() - self.heartbeat_stale, fresh_since),
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def latest_result(self, analysis_type: str) -> Optional[Dict[str, Any]]:
+        """Result payload of the most recent successful task of this type."""
+        records = self.latest(analysis_type, n=1)
+        return records[0]["result"] if records else None
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of stored tasks, optionally filtered by status."""
+        with self._lock:
+            if status is None:
+                return self._db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            return self._db.execute("SELECT COUNT(*) FROM tasks WHERE status = ?", (status,)).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Tier sizes for monitoring."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": self.count(),
+        }
+
+    # Expiry --------------------------------------------------------------
+
+    def _maybe_purge(self):
+        if time.monotonic() - self._last_purge >= self.purge_interval:
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """Delete finished records older than the TTL."""
+        cutoff = (datetime.now() - self.ttl).isoformat()
+        with self._lock:
+            expired = [
+                row[0] for row in self._db.execute(
+                    "SELECT task_id FROM tasks WHERE status != 'running' AND completed_at < ?", (cutoff,)
+                )
+            ]
+            self._db.execute("DELETE FROM tasks WHERE status != 'running' AND completed_at < ?", (cutoff,))
+            self._db.commit()
+            for task_id in expired:
+                self._forget(task_id)
+        self._last_purge = time.monotonic()
+        if expired:
+            logging.info(f"Purged {len(expired)} expired task records")
+        return len(expired)
+
+    def close(self):
+        """Stop the heartbeat and close the SQLite connection."""
+        self._stopped.set()
+        self._heartbeat_thread.join()
+        with self._lock:
+            self._db.close()
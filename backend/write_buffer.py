@@ -0,0 +1,195 @@
+"""Write-behind buffer that batches Mongo inserts into insert_many calls."""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Any, List, Optional, Set
+
+from pymongo.errors import BulkWriteError
+
+DUPLICATE_KEY = 11000
+
+
+class PendingDocument:
+    """A document waiting to be written, with its failed attempts so far."""
+
+    __slots__ = ("document", "attempts")
+
+    def __init__(self, document: Dict[str, Any]):
+        self.document = document
+        self.attempts = 0
+
+
+class WriteBehindBuffer:
+    """Queues documents per collection and writes them with insert_many(ordered=False).
+
+    Handlers call add() and return without waiting on Mongo. A collection is flushed
+    once it holds MONGO_WRITE_BATCH_SIZE documents, every MONGO_WRITE_FLUSH_INTERVAL
+    seconds, and on shutdown. Documents that fail to write are re-queued and retried
+    with backoff, up to MONGO_WRITE_MAX_RETRIES attempts. insert_many assigns _id
+    before sending, so a retried document that did reach the server shows up as a
+    duplicate key and is treated as written. At most MONGO_WRITE_MAX_PENDING documents
+    are held per collection; beyond that the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        db,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or int(os.getenv("MONGO_WRITE_BATCH_SIZE", "100"))
+        self.flush_interval = flush_interval or float(os.getenv("MONGO_WRITE_FLUSH_INTERVAL", "2"))
+        self.max_pending = max_pending or int(os.getenv("MONGO_WRITE_MAX_PENDING", "10000"))
+        self.max_retries = max_retries or int(os.getenv("MONGO_WRITE_MAX_RETRIES", "5"))
+
+        self._pending: Dict[str, List[PendingDocument]] = {}
+        self._flushing: Dict[str, asyncio.Future] = {}
+        self._retry_after: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._background: Set[asyncio.Future] = set()
+        self._ticker: Optional[asyncio.Task] = None
+        self.counters = {"queued": 0, "written": 0, "duplicates": 0, "flushes": 0, "failed_flushes": 0, "dropped": 0}
+
+    # Queueing ------------------------------------------------------------
+
+    def add(self, collection: str, document: Dict[str, Any]):
+        """Queue one document for insertion."""
+        self.add_many(collection, [document])
+
+    def add_many(self, collection: str, documents: List[Dict[str, Any]]):
+        """Queue documents for insertion; flushes in the background once a batch is full."""
+        if not documents:
+            return
+        pending = self._pending.setdefault(collection, [])
+        pending.extend(PendingDocument(document) for document in documents)
+        self.counters["queued"] += len(documents)
+        self._trim(collection)
+        if len(pending) >= self.batch_size:
+            self._schedule_flush(collection)
+
+    def _trim(self, collection: str):
+        pending = self._pending[collection]
+        overflow = len(pending) - self.max_pending
+        if overflow > 0:
+            del pending[:overflow]
+            self.counters["dropped"] += overflow
+            logging.error(f"Write buffer for {collection} is full; dropped {overflow} oldest documents")
+
+    def _schedule_flush(self, collection: str):
+        if collection in self._flushing or time.monotonic() < self._retry_after.get(collection, 0):
+            return
+        task = asyncio.ensure_future(self._flush_collection(collection))
+        self._flushing[collection] = task
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    # Flushing ------------------------------------------------------------
+
+    async def _flush_collection(self, collection: str):
+        """Write the collection's pending documents in batches until empty or a batch fails."""
+        try:
+            while self._pending.get(collection):
+                pending = self._pending[collection]
+                batch = pending[:self.batch_size]
+                del pending[:len(batch)]
+                if not await self._write_batch(collection, batch):
+                    break
+        finally:
+            self._flushing.pop(collection, None)
+
+    async def _write_batch(self, collection: str, batch: List[PendingDocument]) -> bool:
+        """Insert one batch; re-queue what failed. Returns False if the batch failed."""
+        self.counters["flushes"] += 1
+        try:
+            await self.db[collection].insert_many([item.document for item in batch], ordered=False)
+            self.counters["written"] += len(batch)
+            self._failures.pop(collection, None)
+            self._retry_after.pop(collection, None)
+            return True
+        except BulkWriteError as e:
+            failed_indexes = set()
+            for error in e.details.get("writeErrors", []):
+                if error.get("code") == DUPLICATE_KEY:
+                    self.counters["duplicates"] += 1
+                else:
+                    failed_indexes.add(error["index"])
+            self.counters["written"] += e.details.get("nInserted", 0)
+            failed = [item for index, item in enumerate(batch) if index in failed_indexes]
+            if not failed:
+                return True
+            self._requeue(collection, failed, e)
+            return False
+        except Exception as e:
+            self._requeue(collection, batch, e)
+            return False
+
+    def _requeue(self, collection: str, failed: List[PendingDocument], error: Exception):
+        self.counters["failed_flushes"] += 1
+        retry = []
+        for item in failed:
+            item.attempts += 1
+            if item.attempts < self.max_retries:
+                retry.append(item)
+        given_up = len(failed) - len(retry)
+        if given_up:
+            self.counters["dropped"] += given_up
+        logging.error(
+            f"Write to {collection} failed for {len(failed)} documents "
+            f"({len(retry)} will be retried, {given_up} dropped): {error}"
+        )
+        # Retry first on the next flush, after an exponential backoff
+        self._pending[collection] = retry + self._pending.get(collection, [])
+        failures = self._failures[collection] = self._failures.get(collection, 0) + 1
+        self._retry_after[collection] = time.monotonic() + min(60.0, self.flush_interval * 2 ** failures)
+
+    async def flush(self, *collections: str):
+        """Flush the given collections (all by default) unless they are backing off.
+
+        Call before reading a collection so the read sees documents this process queued.
+        """
+        names = collections or list(self._pending)
+        for collection in names:
+            if self._pending.get(collection):
+                self._schedule_flush(collection)
+        flushing = [self._flushing[collection] for collection in names if collection in self._flushing]
+        await asyncio.gather(*flushing, return_exceptions=True)
+
+    # Lifecycle -----------------------------------------------------------
+
+    async def start(self):
+        """Start the periodic flush (call from the app startup hook)."""
+        self._ticker = asyncio.ensure_future(self._tick())
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"Write buffer flush failed: {e}")
+
+    async def stop(self):
+        """Stop the periodic flush and write whatever is still pending, once."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            await asyncio.gather(self._ticker, return_exceptions=True)
+        await asyncio.gather(*list(self._flushing.values()), return_exceptions=True)
+        self._retry_after.clear()
+        for collection in list(self._pending):
+            await self._flush_collection(collection)
+        remaining = sum(len(pending) for pending in self._pending.values())
+        if remaining:
+            logging.error(f"Write buffer stopped with {remaining} unwritten documents")
+
+    def stats(self) -> Dict[str, Any]:
+        """Pending documents per collection and write counters."""
+        return {
+            **self.counters,
+            "pending": {collection: len(pending) for collection, pending in self._pending.items() if pending},
+            "backing_off": [collection for collection, until in self._retry_after.items() if until > time.monotonic()],
+        }
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import {
   BarChart3,
   TrendingUp,
@@ -23,6 +23,9 @@ function App() {
   const [loading, setLoading] = useState<any>({})
   const [processingSteps, setProcessingSteps] = useState<string[]>([])
   const [currentStep, setCurrentStep] = useState(0)
+  const [partialSections, setPartialSections] = useState<Record<string, string>>({})
+  // Analysis types whose steps are driven by live server progress instead of the canned animation
+  const liveProgress = useRef<Record<string, boolean>>({})
 
   // No tabs - navigation happens from dashboard
 
@@ -35,16 +38,19 @@ function App() {
     setProcessingSteps(steps)
 
     try {
-      const response = await fetch(`http://localhost:8002/api/analyze/${type}`, {
+      // Accept a pre-warmed result from the last scheduled refresh instead of waiting for a new run
+      const response = await fetch(`http://localhost:8002/api/analyze/${type}?prefer_cached=true`, {
         method: 'POST'
       })
       const data = await response.json()
 
       if (data.task_id) {
+        liveProgress.current[type] = false
+        setPartialSections({})
         // Start step animation
-        animateProcessingSteps(steps.length)
-        // Poll for results
-        pollForResults(data.task_id, type)
+        animateProcessingSteps(type, steps.length)
+        // Stream progress and results (falls back to polling)
+        watchResults(data.task_id, type)
       }
     } catch (error) {
       console.error(`Error starting ${type} analysis:`, error)
@@ -99,13 +105,74 @@ function App() {
     return stepsByType[type as keyof typeof stepsByType] || []
   }
 
-  const animateProcessingSteps = async (totalSteps: number) => {
+  const animateProcessingSteps = async (type: string, totalSteps: number) => {
     for (let i = 0; i < totalSteps; i++) {
+      if (liveProgress.current[type]) return
       setCurrentStep(i)
       await new Promise(resolve => setTimeout(resolve, Math.random() * 1000 + 500))
     }
   }
 
+  const finishAnalysis = (type: string, data: any) => {
+    if (data.status === 'completed') {
+      if (type === 'competitors') {
+        setCompetitorResults(data.results)
+      } else if (type === 'lowes') {
+        setLowesResults(data.results)
+      } else if (type === 'strategy') {
+        setStrategyResults(data.results)
+      } else if (type === 'campaigns') {
+        setCampaignResults(data.results)
+      }
+    }
+    setLoading(prev => ({ ...prev, [type]: false }))
+    setProcessingSteps([])
+    setCurrentStep(0)
+    setPartialSections({})
+  }
+
+  const watchResults = (taskId: string, type: string) => {
+    if (typeof EventSource === 'undefined') {
+      pollForResults(taskId, type)
+      return
+    }
+
+    const source = new EventSource(`http://localhost:8002/api/results/${taskId}/events`)
+    let finished = false
+    const liveSteps: string[] = []
+
+    source.addEventListener('progress', (event) => {
+      const { message } = JSON.parse((event as MessageEvent).data)
+      // Replace the canned steps with real ones as soon as the server reports progress
+      liveProgress.current[type] = true
+      liveSteps.push(message)
+      setProcessingSteps([...liveSteps])
+      setCurrentStep(liveSteps.length - 1)
+    })
+
+    source.addEventListener('section', (event) => {
+      const { name, content } = JSON.parse((event as MessageEvent).data)
+      if (type === 'competitors') {
+        setPartialSections(prev => ({ ...prev, [name]: content }))
+      }
+    })
+
+    source.addEventListener('done', (event) => {
+      finished = true
+      source.close()
+      finishAnalysis(type, JSON.parse((event as MessageEvent).data))
+    })
+
+    source.onerror = () => {
+      // Stream unavailable or dropped: fall back to polling
+      if (!finished) {
+        finished = true
+        source.close()
+        pollForResults(taskId, type)
+      }
+    }
+  }
+
   const pollForResults = async (taskId: string, type: string) => {
     const maxAttempts = 60 // 5 minutes max
     let attempts = 0
@@ -116,19 +183,8 @@ function App() {
         const data = await response.json()
 
         if (data.status === 'completed') {
-          if (type === 'competitors') {
-            setCompetitorResults(data.results)
-          } else if (type === 'lowes') {
-            setLowesResults(data.results)
-          } else if (type === 'strategy') {
-            setStrategyResults(data.results)
-          } else if (type === 'campaigns') {
-            setCampaignResults(data.results)
-          }
-          setLoading(prev => ({ ...prev, [type]: false }))
-          setProcessingSteps([])
-          setCurrentStep(0)
-        } else if (data.status === 'running' && attempts < maxAttempts) {
+          finishAnalysis(type, data)
+        } else if ((data.status === 'running' || data.status === 'queued') && attempts < maxAttempts) {
           attempts++
           setTimeout(poll, 5000) // Poll every 5 seconds
         } else {
@@ -309,6 +365,13 @@ function App() {
               🔍 <strong>Sources being analyzed:</strong> Instagram posts, Facebook content, Twitter/X posts, engagement metrics, posting patterns, content themes
             </p>
           </div>
+          {Object.keys(partialSections).length > 0 && (
+            <div className="mt-4 bg-blue-50 border-l-4 border-blue-400 p-6 rounded-r-lg">
+              <pre className="whitespace-pre-wrap text-sm text-blue-800 leading-relaxed">
+                {Object.values(partialSections).join('')}
+              </pre>
+            </div>
+          )}
         </div>
       )}
 